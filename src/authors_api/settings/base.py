@@ -22,6 +22,7 @@ DJANGO_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -154,6 +155,8 @@ STATIC_ROOT = str(ROOT_DIR / "staticfiles")
 # MEDIA_URL = "/mediafiles/"
 MEDIA_ROOT = str(ROOT_DIR / "mediafiles")
 
+DEFAULT_FILE_STORAGE = "core_apps.common.storage.ContentAddressedStorage"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 
@@ -174,6 +177,187 @@ CELERY_TASK_SEND_SENT_EVENT = True
 if USE_TZ:
     CELERY_TIMEZONE = TIME_ZONE
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("CACHE_REDIS_URL", default=CELERY_BROKER_URL),
+        "KEY_PREFIX": "authors_api",
+        "TIMEOUT": 300,
+    }
+}
+
+ARTICLE_FRAGMENT_CACHE = {
+    "ENABLED": env.bool("ARTICLE_FRAGMENT_CACHE_ENABLED", True),
+    # seconds; superseded versions are never read again and simply expire
+    "TIMEOUT": env.int("ARTICLE_FRAGMENT_CACHE_TIMEOUT", 60 * 60 * 24),
+}
+
+ARTICLE_VIEW_BUFFER = {
+    "ENABLED": env.bool("ARTICLE_VIEW_BUFFER_ENABLED", True),
+    "REDIS_URL": env("ARTICLE_VIEW_BUFFER_REDIS_URL", default=CELERY_BROKER_URL),
+    "KEY": "articles:view-buffer",
+    "FLUSH_BATCH_SIZE": env.int("ARTICLE_VIEW_FLUSH_BATCH_SIZE", 1000),
+    # seconds
+    "FLUSH_INTERVAL": env.int("ARTICLE_VIEW_FLUSH_INTERVAL", 10),
+    # seconds of in-process buffering after a Redis error before Redis is
+    # tried again
+    "REDIS_RETRY_INTERVAL": env.int("ARTICLE_VIEW_BUFFER_REDIS_RETRY_INTERVAL", 30),
+}
+
+ARTICLE_VIEWERS = {
+    # Keep one ArticleView row per unique viewer in addition to the estimate.
+    "AUDIT": env.bool("ARTICLE_VIEW_AUDIT", False),
+    "REDIS_URL": env("ARTICLE_VIEWERS_REDIS_URL", default=CELERY_BROKER_URL),
+    # minutes during which repeated views from the same viewer are dropped
+    "DEDUPE_WINDOW": env.int("ARTICLE_VIEW_DEDUPE_WINDOW", 30),
+    "BLOOM_CAPACITY": env.int("ARTICLE_VIEW_BLOOM_CAPACITY", 1_000_000),
+    "BLOOM_ERROR_RATE": env.float("ARTICLE_VIEW_BLOOM_ERROR_RATE", 0.01),
+    # seconds between syncs of the estimates into Article.view_count
+    "SYNC_INTERVAL": env.int("ARTICLE_VIEW_SYNC_INTERVAL", 60),
+    # seconds of in-process counting after a Redis error before Redis is
+    # tried again
+    "REDIS_RETRY_INTERVAL": env.int("ARTICLE_VIEWERS_REDIS_RETRY_INTERVAL", 30),
+    # articles counted in-process meanwhile, 16 KB each
+    "LOCAL_MAX_ARTICLES": env.int("ARTICLE_VIEWERS_LOCAL_MAX_ARTICLES", 2000),
+}
+
+ARTICLE_TRENDING = {
+    # seconds after which an event counts half as much
+    "HALF_LIFE": env.int("ARTICLE_TRENDING_HALF_LIFE", 60 * 60 * 12),
+    # seconds without new activity after which an article leaves the ranking
+    "WINDOW": env.int("ARTICLE_TRENDING_WINDOW", 60 * 60 * 24 * 7),
+    "WEIGHTS": {
+        "views": env.float("ARTICLE_TRENDING_VIEW_WEIGHT", 1.0),
+        "claps": env.float("ARTICLE_TRENDING_CLAP_WEIGHT", 3.0),
+        "ratings": env.float("ARTICLE_TRENDING_RATING_WEIGHT", 4.0),
+        "responses": env.float("ARTICLE_TRENDING_RESPONSE_WEIGHT", 5.0),
+    },
+    # seconds between updates of the ranking
+    "INTERVAL": env.int("ARTICLE_TRENDING_INTERVAL", 300),
+    # seconds before the previous update that the next one reads again
+    "WATERMARK_OVERLAP": env.int("ARTICLE_TRENDING_WATERMARK_OVERLAP", 60),
+    "PAGE_SIZE": 10,
+    "MAX_PAGE_SIZE": 30,
+    # the endpoint pages through at most this many articles
+    "MAX_RANK": env.int("ARTICLE_TRENDING_MAX_RANK", 500),
+}
+
+ARTICLE_RELATED = {
+    # refresh related lists in the background when an article changes
+    "ENABLED": env.bool("ARTICLE_RELATED_ENABLED", True),
+    # MinHash signature length, split into BANDS LSH bands of equal size;
+    # 32 bands of 2 rows find pairs from a similarity of about 0.2
+    "NUM_PERM": 64,
+    "BANDS": 32,
+    "TOP_K": env.int("ARTICLE_RELATED_TOP_K", 5),
+    "MIN_SCORE": env.float("ARTICLE_RELATED_MIN_SCORE", 0.1),
+    # candidates compared per article, and buckets too common to be a hint
+    "MAX_CANDIDATES": 1000,
+    "MAX_BUCKET_SIZE": 1000,
+    # worker processes of build_related_articles; 0 uses every core
+    "PROCESSES": env.int("ARTICLE_RELATED_PROCESSES", 0),
+}
+
+ARTICLE_CLAPS = {
+    # articles one clap-status request may ask about
+    "STATUS_MAX_IDS": 100,
+}
+
+RATINGS = {
+    # seconds a rating histogram is cached; a rating change makes it stale
+    # immediately through Article.cache_version
+    "HISTOGRAM_CACHE_TTL": env.int("RATINGS_HISTOGRAM_CACHE_TTL", 60 * 60),
+}
+
+ARTICLE_FEED = {
+    # authors with more followers are not pushed into timelines; their
+    # articles are merged in when a follower reads the feed
+    "FANOUT_LIMIT": env.int("ARTICLE_FEED_FANOUT_LIMIT", 5000),
+    # newest entries kept per timeline
+    "MAX_ENTRIES": env.int("ARTICLE_FEED_MAX_ENTRIES", 1000),
+    # recent articles of an author added to the timeline on follow
+    "BACKFILL": 20,
+    # timeline entries written per INSERT during fan-out
+    "CHUNK_SIZE": 1000,
+    # seconds a user's fan-out-on-read authors are cached
+    "READ_AUTHORS_TTL": env.int("ARTICLE_FEED_READ_AUTHORS_TTL", 300),
+    # seconds between trims of overgrown timelines
+    "TRIM_INTERVAL": env.int("ARTICLE_FEED_TRIM_INTERVAL", 60 * 60),
+}
+
+ARTICLE_SUGGEST = {
+    "MIN_LENGTH": 2,
+    "LIMIT": 10,
+    "MAX_LIMIT": 20,
+    # seconds a typeahead result is served from the cache
+    "CACHE_TTL": env.int("ARTICLE_SUGGEST_CACHE_TTL", 30),
+}
+
+ARTICLE_IMPORT = {
+    # articles validated, inserted and committed together
+    "CHUNK_SIZE": env.int("ARTICLE_IMPORT_CHUNK_SIZE", 500),
+    # larger imports go through the import_articles management command
+    "MAX_REQUEST_RECORDS": env.int("ARTICLE_IMPORT_MAX_REQUEST_RECORDS", 1000),
+}
+
+IMAGE_DERIVATIVES = {
+    # app_label.Model.field -> widths of the resized copies
+    "FIELDS": {
+        "articles.Article.banner_image": [320, 640, 1280],
+        "profiles.Profile.profile_photo": [64, 128, 256],
+        "organization.Organization.logo": [64, 128, 256],
+    },
+    # every width is written in each format; jpeg becomes png for images
+    # with transparency
+    "FORMATS": ["webp", "jpeg"],
+    "WEBP_QUALITY": env.int("IMAGE_DERIVATIVES_WEBP_QUALITY", 80),
+    "JPEG_QUALITY": env.int("IMAGE_DERIVATIVES_JPEG_QUALITY", 82),
+    "PATH": "derivatives",
+}
+
+BULK_DELETE = {
+    # batches of at most this many ids are deleted within the request
+    "SYNC_THRESHOLD": env.int("BULK_DELETE_SYNC_THRESHOLD", 50),
+    # ids deleted per transaction by the background job
+    "CHUNK_SIZE": env.int("BULK_DELETE_CHUNK_SIZE", 100),
+}
+
+CONTENT_ADDRESSED_STORAGE = {
+    # uploads are stored as PREFIX/ab/cd/<sha256>.<ext>
+    "PREFIX": "blobs",
+    # seconds a blob stays unreferenced before garbage collection deletes it
+    "GC_GRACE": env.int("CONTENT_ADDRESSED_STORAGE_GC_GRACE", 60 * 60 * 24),
+}
+
+STREAMING_LIST = {
+    "ENABLED": env.bool("STREAMING_LIST_ENABLED", True),
+    # rows fetched and serialized at a time by streamed list responses
+    "CHUNK_SIZE": env.int("STREAMING_LIST_CHUNK_SIZE", 500),
+}
+
+CELERY_BEAT_SCHEDULE = {
+    "flush-article-views": {
+        "task": "core_apps.articles.tasks.flush_article_views",
+        "schedule": ARTICLE_VIEW_BUFFER["FLUSH_INTERVAL"],
+    },
+    "sync-article-view-counts": {
+        "task": "core_apps.articles.tasks.sync_article_view_counts",
+        "schedule": ARTICLE_VIEWERS["SYNC_INTERVAL"],
+    },
+    "update-trending-articles": {
+        "task": "core_apps.articles.tasks.update_trending_articles",
+        "schedule": ARTICLE_TRENDING["INTERVAL"],
+    },
+    "trim-article-feeds": {
+        "task": "core_apps.articles.tasks.trim_article_feeds",
+        "schedule": ARTICLE_FEED["TRIM_INTERVAL"],
+    },
+    "collect-unreferenced-blobs": {
+        "task": "core_apps.common.tasks.collect_blobs",
+        "schedule": 60 * 60 * 24,
+    },
+}
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "dj_rest_auth.jwt_auth.JWTCookieAuthentication",
@@ -184,6 +368,10 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core_apps.common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 SIMPLE_JWT = {
@@ -0,0 +1,54 @@
+from itertools import count
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models.signals import pre_migrate
+from django.dispatch import receiver
+
+
+@receiver(pre_migrate)
+def create_extensions(using, **kwargs):
+    # --no-migrations (pytest.ini) builds the test database from the models,
+    # skipping the migrations that install pg_trgm for the trigram indexes.
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+@pytest.fixture(autouse=True)
+def local_memory_cache(settings):
+    """Keep tests off Redis and away from each other's cached values."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+@pytest.fixture
+def user_factory(db):
+    numbers = count()
+
+    def create(**kwargs):
+        number = next(numbers)
+        kwargs.setdefault("first_name", f"First{number}")
+        kwargs.setdefault("last_name", f"Last{number}")
+        kwargs.setdefault("email", f"user{number}@example.com")
+        return get_user_model().objects.create_user(password="password", **kwargs)
+
+    return create
+
+
+@pytest.fixture
+def article_factory(db, user_factory):
+    from core_apps.articles.models import Article
+
+    def create(**kwargs):
+        if "author" not in kwargs:
+            kwargs["author"] = user_factory()
+        kwargs.setdefault("title", "An article")
+        kwargs.setdefault("description", "About something")
+        kwargs.setdefault("body", "Some words to read.")
+        return Article.objects.create(**kwargs)
+
+    return create
@@ -7,10 +7,22 @@ class ArticleAdmin(admin.ModelAdmin):
     list_display = ["pkid", "author", "title", "slug", "view_count"]
     list_display_links = ["pkid", "author"]
     list_filter = ["created_at", "updated_at"]
-    search_fields = ["title", "body", "tags"]
+    search_fields = ["title", "body", "tags__name"]
     ordering = ["-created_at"]
 
 
+class ArticleTagAdmin(admin.ModelAdmin):
+    list_display = ["pk", "name", "normalized_name"]
+    list_display_links = ["pk", "name"]
+    search_fields = ["normalized_name"]
+
+
+class TrendingArticleAdmin(admin.ModelAdmin):
+    list_display = ["article", "score", "last_activity_at", "updated_at"]
+    ordering = ["-score"]
+    raw_id_fields = ["article"]
+
+
 class ArticleViewAdmin(admin.ModelAdmin):
     list_display = ["pkid", "article", "user", "viewer_ip"]
     list_display_links = ["pkid", "article"]
@@ -25,5 +37,7 @@ class ClapAdmin(admin.ModelAdmin):
 
 
 admin.site.register(models.Article, ArticleAdmin)
+admin.site.register(models.ArticleTag, ArticleTagAdmin)
+admin.site.register(models.TrendingArticle, TrendingArticleAdmin)
 admin.site.register(models.ArticleView, ArticleViewAdmin)
 admin.site.register(models.Clap, ClapAdmin)
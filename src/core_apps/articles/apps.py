@@ -7,3 +7,5 @@ class ArticlesConfig(AppConfig):
     name = "core_apps.articles"
     verbose_name = _("Articles")
 
+    def ready(self):
+        from core_apps.articles import signals
@@ -0,0 +1,198 @@
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+
+# Timeline entries are inserted from parallel arrays in one statement; the
+# row count then tells how many were new, which bulk_create() with
+# ignore_conflicts cannot.
+INSERT_ENTRIES_SQL = """
+INSERT INTO {entries} (owner_id, article_id, published_at)
+SELECT * FROM unnest(%s::bigint[], %s::bigint[], %s::timestamptz[])
+ON CONFLICT (owner_id, article_id) DO NOTHING
+"""
+
+
+def _follows():
+    # Profile.follow() adds the followed profile to the follower's
+    # ``followers``, so a through row reads from_profile -> to_profile as
+    # "from_profile follows to_profile".
+    from core_apps.profiles.models import Profile
+
+    return Profile.followers.through.objects
+
+
+def _config():
+    return settings.ARTICLE_FEED
+
+
+def _read_authors_key(user_id):
+    return f"articles:feed:read-authors:{user_id}"
+
+
+def follower_count(author_id):
+    return _follows().filter(to_profile__user_id=author_id).count()
+
+
+def read_authors(user):
+    """
+    Users followed by ``user`` with more than FANOUT_LIMIT followers. Their
+    articles are not pushed into timelines but merged in when the feed is
+    read; the set is cached for READ_AUTHORS_TTL seconds.
+    """
+
+    def compute():
+        followed = _follows().filter(from_profile__user=user).values("to_profile_id")
+        return list(
+            _follows()
+            .filter(to_profile_id__in=followed)
+            .values("to_profile__user_id")
+            .annotate(followers=Count("pk"))
+            .filter(followers__gt=_config()["FANOUT_LIMIT"])
+            .values_list("to_profile__user_id", flat=True)
+        )
+
+    return cache.get_or_set(
+        _read_authors_key(user.pk), compute, _config()["READ_AUTHORS_TTL"]
+    )
+
+
+def _insert_entries(rows):
+    """Insert (owner_id, article_id, published_at) rows; returns the number written."""
+    from .models import FeedEntry
+
+    if not rows:
+        return 0
+    sql = INSERT_ENTRIES_SQL.format(
+        entries=connection.ops.quote_name(FeedEntry._meta.db_table)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [list(column) for column in zip(*rows)])
+        return cursor.rowcount
+
+
+def schedule_fan_out(article_pks):
+    from .tasks import fan_out_articles
+
+    article_pks = list(article_pks)
+    if article_pks:
+        transaction.on_commit(lambda: fan_out_articles.delay(article_pks))
+
+
+def fan_out(article_pk):
+    """
+    Push a new article into the timeline of every follower of its author,
+    in chunks. Authors with more than FANOUT_LIMIT followers are skipped;
+    their articles are read at request time instead. Returns the number of
+    entries written; followers who already have the article are not counted.
+    """
+    from .models import Article
+
+    config = _config()
+    article = (
+        Article.objects.filter(pk=article_pk)
+        .values("pkid", "author_id", "created_at")
+        .first()
+    )
+    if article is None or follower_count(article["author_id"]) > config["FANOUT_LIMIT"]:
+        return 0
+
+    followers = (
+        _follows()
+        .filter(to_profile__user_id=article["author_id"])
+        .values_list("from_profile__user_id", flat=True)
+        .iterator(chunk_size=config["CHUNK_SIZE"])
+    )
+    written = 0
+    while True:
+        owners = list(islice(followers, config["CHUNK_SIZE"]))
+        if not owners:
+            return written
+        written += _insert_entries(
+            [(owner_id, article["pkid"], article["created_at"]) for owner_id in owners]
+        )
+
+
+def follow_changed(follower_id, author_id, followed):
+    """
+    Keep a timeline in step with a follow or unfollow: the author's recent
+    articles are added (BACKFILL of them) or all of them removed. Returns
+    the number of entries written or deleted.
+    """
+    from .models import Article, FeedEntry
+
+    cache.delete(_read_authors_key(follower_id))
+    if not followed:
+        return FeedEntry.objects.filter(
+            owner_id=follower_id, article__author_id=author_id
+        ).delete()[0]
+    if follower_count(author_id) > _config()["FANOUT_LIMIT"]:
+        return 0
+    recent = Article.objects.filter(author_id=author_id).order_by(
+        "-created_at", "-pkid"
+    )[: _config()["BACKFILL"]]
+    return _insert_entries(
+        [
+            (follower_id, pkid, created_at)
+            for pkid, created_at in recent.values_list("pkid", "created_at")
+        ]
+    )
+
+
+def timeline(user, position=None, reverse=False, limit=10):
+    """
+    ``limit`` (published_at, article pkid) positions of ``user``'s feed past
+    ``position``, newest first (oldest first when ``reverse``). Timeline
+    entries and the articles of fan-out-on-read authors are each read with
+    one keyset query and merged.
+    """
+    from .models import Article, FeedEntry
+    from .pagination import keyset
+
+    def page(queryset, created_field, pk_field):
+        if position is None:
+            queryset = queryset.order_by(f"-{created_field}", f"-{pk_field}")
+        else:
+            queryset = keyset(queryset, position, reverse, created_field, pk_field)
+        return list(queryset.values_list(created_field, pk_field)[:limit])
+
+    positions = page(FeedEntry.objects.filter(owner=user), "published_at", "article_id")
+    authors = read_authors(user)
+    if authors:
+        positions.extend(
+            page(Article.objects.filter(author_id__in=authors), "created_at", "pkid")
+        )
+    return sorted(set(positions), reverse=not reverse)[:limit]
+
+
+def trim_timelines():
+    """
+    Cut every timeline back to its MAX_ENTRIES newest entries. Returns the
+    number of entries deleted.
+    """
+    from .models import FeedEntry
+    from .pagination import keyset
+
+    limit = _config()["MAX_ENTRIES"]
+    owners = (
+        FeedEntry.objects.values("owner_id")
+        .annotate(entries=Count("pk"))
+        .filter(entries__gt=limit)
+        .values_list("owner_id", flat=True)
+    )
+    deleted = 0
+    for owner_id in owners:
+        timeline = FeedEntry.objects.filter(owner_id=owner_id)
+        boundary = (
+            timeline.order_by("-published_at", "-article_id")
+            .values_list("published_at", "article_id")[limit - 1 : limit]
+            .first()
+        )
+        if boundary is None:
+            continue
+        deleted += keyset(
+            timeline, boundary, created_field="published_at", pk_field="article_id"
+        ).delete()[0]
+    return deleted
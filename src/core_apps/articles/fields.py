@@ -0,0 +1,15 @@
+from autoslug import AutoSlugField
+
+
+class PreallocatedAutoSlugField(AutoSlugField):
+    """
+    AutoSlugField that keeps a slug assigned ahead of time. Bulk writers such
+    as core_apps.articles.importer set ``_slug_preallocated`` on instances
+    whose slugs they already made unique, which skips the per-row uniqueness
+    queries of AutoSlugField.pre_save(); every other save behaves as before.
+    """
+
+    def pre_save(self, instance, add):
+        if getattr(instance, "_slug_preallocated", False):
+            return self.value_from_object(instance)
+        return super().pre_save(instance, add)
@@ -8,10 +8,30 @@ class ArticleFilter(filters.FilterSet):
         field_name="author__first_name", lookup_expr="icontains"
     )
     title = filters.CharFilter(field_name="title", lookup_expr="icontains")
-    tags = filters.CharFilter(field_name="tags__name", lookup_expr="iexact")
+    tags = filters.CharFilter(method="filter_tags")
     created_at = filters.DateFromToRangeFilter(field_name="created_at")
     updated_at = filters.DateFromToRangeFilter(field_name="updated_at")
+    search = filters.CharFilter(method="filter_search")
+    headline = filters.BooleanFilter(method="filter_headline")
 
     class Meta:
         model = Article
-        fields = ["author", "title", "tags", "created_at", "updated_at"]
+        fields = [
+            "author",
+            "title",
+            "tags",
+            "created_at",
+            "updated_at",
+            "search",
+            "headline",
+        ]
+
+    def filter_tags(self, queryset, name, value):
+        return queryset.tagged(value)
+
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value, headline=self.form.cleaned_data.get("headline"))
+
+    def filter_headline(self, queryset, name, value):
+        # Only meaningful together with ?search=, which applies it.
+        return queryset
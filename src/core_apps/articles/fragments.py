@@ -0,0 +1,94 @@
+import hashlib
+import logging
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the article representation changes shape, to orphan old entries.
+FRAGMENT_SCHEMA = 2
+
+
+class ArticleFragmentCache:
+    """
+    Serialized articles cached per (pkid, cache_version, variant). The variant
+    covers the serializer class and the requested fields, so sparse fieldsets
+    get their own entries. A page is read with a single get_many and only the
+    misses are serialized. Invalidation needs no deletes: every change bumps
+    Article.cache_version, and superseded entries expire on their own.
+
+    Values computed per request are never cached: ``views`` comes from the
+    unique-viewer estimate, and search, trending and related annotations
+    depend on the query or the time, so they are applied on top of the
+    cached fragment.
+    """
+
+    prefix = "articles:fragment"
+    annotations = ("search_rank", "headline", "trending_score", "related_score")
+
+    def __init__(self, serializer_class, context, fields):
+        self.serializer_class = serializer_class
+        self.context = context
+        self.fields = fields
+        self.config = settings.ARTICLE_FRAGMENT_CACHE
+        variant = f"{serializer_class.__name__}:{','.join(sorted(fields))}"
+        self.variant = hashlib.md5(variant.encode()).hexdigest()[:12]
+
+    def key(self, article):
+        return (
+            f"{self.prefix}:{FRAGMENT_SCHEMA}:{self.variant}"
+            f":{article.pkid}:{article.cache_version}"
+        )
+
+    def _serialize(self, articles):
+        serializer = self.serializer_class(articles, many=True, context=self.context)
+        fragments = [dict(data) for data in serializer.data]
+        for fragment in fragments:
+            for annotation in self.annotations:
+                fragment.pop(annotation, None)
+        return fragments
+
+    def _finalize(self, fragment, article):
+        data = dict(fragment)
+        estimates = self.context.get("view_estimates")
+        if "views" in data and estimates is not None and article.pkid in estimates:
+            data["views"] = estimates[article.pkid]
+        for annotation in self.annotations:
+            if hasattr(article, annotation):
+                data[annotation] = getattr(article, annotation)
+        return data
+
+    def render(self, articles):
+        articles = list(articles)
+        if not self.config["ENABLED"]:
+            fragments = self._serialize(articles)
+            return [self._finalize(f, a) for f, a in zip(fragments, articles)]
+
+        keys = [self.key(article) for article in articles]
+        try:
+            cached = cache.get_many(keys)
+        except redis.RedisError as e:
+            logger.warning(f"Could not read article fragments: {e}")
+            cached = {}
+
+        misses = [
+            (key, article) for key, article in zip(keys, articles) if key not in cached
+        ]
+        if misses:
+            fresh = dict(
+                zip(
+                    [key for key, _ in misses],
+                    self._serialize([article for _, article in misses]),
+                )
+            )
+            try:
+                cache.set_many(fresh, self.config["TIMEOUT"])
+            except redis.RedisError as e:
+                logger.warning(f"Could not store article fragments: {e}")
+            cached.update(fresh)
+
+        return [
+            self._finalize(cached[key], article) for key, article in zip(keys, articles)
+        ]
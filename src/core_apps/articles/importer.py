@@ -0,0 +1,284 @@
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from autoslug.utils import crop_slug
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from . import feed, related
+from .models import Article, ArticleTag, ArticleTagging
+from .read_time_engine import ArticleReadTimeEngine
+from .serializers import ArticleImportSerializer
+
+User = get_user_model()
+
+logger = logging.getLogger(__name__)
+
+FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+HEADING_RE = re.compile(r"^#\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+# Attempts per chunk when a concurrent writer takes one of its slugs.
+SLUG_CONFLICT_RETRIES = 3
+
+
+def iter_ndjson(lines, start_after=0):
+    """(line number, record) pairs; unparsable lines yield the error message."""
+    for position, line in enumerate(lines, start=1):
+        if position <= start_after:
+            continue
+        if isinstance(line, bytes):
+            line = line.decode()
+        if not line.strip():
+            continue
+        try:
+            yield position, json.loads(line)
+        except ValueError as e:
+            yield position, f"Invalid JSON: {e}"
+
+
+def parse_markdown(text, default_title=""):
+    """
+    A record from a Markdown document. Front matter between ``---`` lines
+    may set title, description, tags (comma separated or ``[a, b]``) and
+    author; otherwise the first ``# heading`` is the title and the first
+    paragraph the description.
+    """
+    record = {}
+    match = FRONT_MATTER_RE.match(text)
+    if match:
+        for line in match.group(1).splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                record[key.strip().lower()] = value.strip().strip("\"'")
+        text = text[match.end() :]
+    if isinstance(record.get("tags"), str):
+        record["tags"] = record["tags"].strip("[]")
+
+    body = text.strip()
+    if "title" not in record:
+        heading = HEADING_RE.search(body)
+        if heading:
+            record["title"] = heading.group(1)
+            body = (body[: heading.start()] + body[heading.end() :]).strip()
+        else:
+            record["title"] = default_title
+    if "description" not in record:
+        paragraph = body.split("\n\n", 1)[0].replace("\n", " ").strip()
+        record["description"] = paragraph[:255]
+    record["body"] = body
+    return record
+
+
+def iter_markdown(directory, start_after=0):
+    """(file number, record) pairs for every ``*.md`` file, in path order."""
+    paths = sorted(Path(directory).rglob("*.md"))
+    for position, path in enumerate(paths[start_after:], start=start_after + 1):
+        title = path.stem.replace("-", " ").replace("_", " ").strip().capitalize()
+        yield position, parse_markdown(path.read_text(encoding="utf-8"), title)
+
+
+class SlugAllocator:
+    """
+    Hands out slugs the way AutoSlugField would, but for many titles at
+    once: existing rivals of a batch are read with one query and collisions
+    are resolved in memory (``slug``, ``slug-2``, ``slug-3``, ...).
+    """
+
+    def __init__(self):
+        self.field = Article._meta.get_field("slug")
+        self.taken = set()
+        self.loaded = set()
+        self.next_index = {}
+
+    def base(self, title):
+        slug = self.field.slugify(title) or Article._meta.model_name
+        return crop_slug(self.field, slug)
+
+    def _rival_prefix(self, base):
+        # Suffixed slugs of a long base are cropped to make room for the index,
+        # so match on the part that survives any index up to six digits.
+        cropped = base[: self.field.max_length - len(self.field.index_sep) - 6]
+        return cropped if cropped != base else base + self.field.index_sep
+
+    def load(self, bases):
+        bases = {base for base in bases if base not in self.loaded}
+        if not bases:
+            return
+        condition = Q()
+        for base in bases:
+            condition |= Q(slug=base) | Q(slug__startswith=self._rival_prefix(base))
+        self.taken.update(
+            Article.objects.filter(condition).values_list("slug", flat=True)
+        )
+        self.loaded.update(bases)
+
+    def forget(self):
+        """Drop what was read so the next load() sees concurrent writes."""
+        self.taken.clear()
+        self.loaded.clear()
+        self.next_index.clear()
+
+    def allocate(self, base):
+        index = self.next_index.get(base, 1)
+        slug = base
+        if index > 1:
+            slug = self._suffixed(base, index)
+        while slug in self.taken:
+            index += 1
+            slug = self._suffixed(base, index)
+        self.taken.add(slug)
+        self.next_index[base] = index
+        return slug
+
+    def _suffixed(self, base, index):
+        tail = f"{self.field.index_sep}{index}"
+        return base[: self.field.max_length - len(tail)] + tail
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    failed: int = 0
+    last_position: object = None
+    articles: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+
+class ArticleImporter:
+    """
+    Imports articles from an iterable of ``(position, record)`` pairs in
+    chunks. Per chunk: records are validated, authors and tags resolved with
+    a handful of queries, slugs pre-allocated in memory, word count and
+    reading time computed without tag queries, and articles and tag
+    relations inserted with bulk_create() in one transaction. Search vectors
+    are filled with one UPDATE per chunk.
+
+    A chunk is committed as a whole, and ``progress`` is called after each
+    commit with the ImportResult so far; its ``last_position`` is where an
+    interrupted import resumes. Invalid records are reported in ``errors``
+    and skipped. Records name their author by email unless
+    ``record_authors`` is False, in which case ``author`` writes them all.
+    """
+
+    def __init__(
+        self,
+        author=None,
+        chunk_size=None,
+        progress=None,
+        collect=False,
+        record_authors=True,
+    ):
+        self.author = author
+        self.record_authors = record_authors
+        self.chunk_size = chunk_size or settings.ARTICLE_IMPORT["CHUNK_SIZE"]
+        self.progress = progress
+        self.collect = collect
+        self.slugs = SlugAllocator()
+        self.result = ImportResult()
+
+    def run(self, records):
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                break
+            self.import_chunk(chunk)
+            if self.progress is not None:
+                self.progress(self.result)
+        return self.result
+
+    def _error(self, position, errors):
+        self.result.failed += 1
+        self.result.errors.append({"position": position, "errors": errors})
+
+    def _validate(self, chunk):
+        valid = []
+        for position, record in chunk:
+            if not isinstance(record, dict):
+                self._error(position, {"non_field_errors": [str(record)]})
+                continue
+            serializer = ArticleImportSerializer(data=record)
+            if serializer.is_valid():
+                valid.append((position, serializer.validated_data))
+            else:
+                self._error(position, serializer.errors)
+        return valid
+
+    def _resolve_authors(self, valid):
+        if not self.record_authors:
+            return [(position, data, self.author) for position, data in valid]
+        emails = {data["author"] for _, data in valid if "author" in data}
+        authors = {user.email: user for user in User.objects.filter(email__in=emails)}
+        resolved = []
+        for position, data in valid:
+            author = authors.get(data["author"]) if "author" in data else self.author
+            if author is None:
+                self._error(position, {"author": ["No such author."]})
+                continue
+            resolved.append((position, data, author))
+        return resolved
+
+    def _insert(self, rows):
+        self.slugs.load(self.slugs.base(data["title"]) for _, data, _ in rows)
+        articles = []
+        for _, data, author in rows:
+            article = Article(
+                author=author,
+                title=data["title"],
+                description=data["description"],
+                body=data["body"],
+                slug=self.slugs.allocate(self.slugs.base(data["title"])),
+            )
+            article._slug_preallocated = True
+            articles.append(article)
+
+        tag_names = [data.get("tags", []) for _, data, _ in rows]
+        for article, names in zip(articles, tag_names):
+            article.word_count = ArticleReadTimeEngine.article_word_count(article)
+            article.reading_time = ArticleReadTimeEngine.reading_time(
+                article.word_count, bool(article.banner_image), len(names)
+            )
+
+        with transaction.atomic():
+            Article.objects.bulk_create(articles)
+            tags = ArticleTag.objects.for_names(
+                name for names in tag_names for name in names
+            )
+            ArticleTagging.objects.bulk_create(
+                ArticleTagging(article=article, tag=tags[ArticleTag.normalize(name)])
+                for article, names in zip(articles, tag_names)
+                for name in names
+            )
+        return articles
+
+    def import_chunk(self, chunk):
+        rows = self._resolve_authors(self._validate(chunk))
+        if rows:
+            for attempt in range(1, SLUG_CONFLICT_RETRIES + 1):
+                try:
+                    articles = self._insert(rows)
+                    break
+                except IntegrityError:
+                    if attempt == SLUG_CONFLICT_RETRIES:
+                        raise
+                    logger.warning("Slug conflict while importing, retrying chunk")
+                    self.slugs.forget()
+            Article.objects.filter(
+                pk__in=[article.pk for article in articles]
+            ).update_search_vector()
+            related.schedule_update(article.pk for article in articles)
+            feed.schedule_fan_out(article.pk for article in articles)
+
+            self.result.created += len(articles)
+            if self.collect:
+                self.result.articles.extend(
+                    {"position": position, "id": article.id, "slug": article.slug}
+                    for (position, _, _), article in zip(rows, articles)
+                )
+        self.result.last_position = chunk[-1][0]
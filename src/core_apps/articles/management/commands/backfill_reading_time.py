@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from core_apps.articles.models import Article
+from core_apps.articles.read_time_engine import ArticleReadTimeEngine
+
+
+class Command(BaseCommand):
+    help = (
+        "Store word_count and reading_time on articles that do not have them yet. "
+        "Safe to interrupt and re-run: finished rows are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of articles computed and written per transaction.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this article pkid.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every article, not only the ones missing a value.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_pkid = options["start_after"]
+        queryset = Article.objects.all()
+        if not options["all"]:
+            queryset = queryset.filter(word_count__isnull=True)
+        queryset = queryset.only(
+            "pkid", "title", "description", "body", "banner_image"
+        ).annotate(tag_total=Count("tags"))
+        backfilled = 0
+
+        while True:
+            articles = list(
+                queryset.filter(pkid__gt=last_pkid).order_by("pkid")[:chunk_size]
+            )
+            if not articles:
+                break
+
+            for article in articles:
+                article.word_count = ArticleReadTimeEngine.article_word_count(article)
+                article.reading_time = ArticleReadTimeEngine.reading_time(
+                    article.word_count, bool(article.banner_image), article.tag_total
+                )
+            with transaction.atomic():
+                Article.objects.bulk_update(articles, ["word_count", "reading_time"])
+
+            backfilled += len(articles)
+            last_pkid = articles[-1].pkid
+            self.stdout.write(
+                f"Backfilled {backfilled} articles (up to pkid {last_pkid})"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Stored reading time for {backfilled} articles.")
+        )
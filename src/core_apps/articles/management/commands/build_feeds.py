@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from core_apps.articles.feed import follow_changed, trim_timelines
+from core_apps.profiles.models import Profile
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill every timeline with the recent articles of the followed authors, "
+        "e.g. for follows that existed before the feed was introduced."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of follow relations read per query.",
+        )
+
+    def handle(self, *args, **options):
+        follows = Profile.followers.through.objects.values_list(
+            "from_profile__user_id", "to_profile__user_id"
+        ).iterator(chunk_size=options["chunk_size"])
+        written = 0
+        for follower_id, author_id in follows:
+            written += follow_changed(follower_id, author_id, followed=True)
+        trimmed = trim_timelines()
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} feed entries, trimmed {trimmed}.")
+        )
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from core_apps.articles.related import build_related
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the MinHash signatures, LSH buckets and related-article lists "
+        "of every article, using a pool of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="Worker processes; defaults to ARTICLE_RELATED['PROCESSES'] "
+            "or the number of cores.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of articles handed to a worker at a time.",
+        )
+
+    def handle(self, *args, **options):
+        indexed = build_related(
+            processes=options["processes"],
+            chunk_size=options["chunk_size"],
+            log=self.stdout.write,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Built related articles for {indexed} articles.")
+        )
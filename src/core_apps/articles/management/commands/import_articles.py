@@ -0,0 +1,124 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core_apps.articles.importer import ArticleImporter, iter_markdown, iter_ndjson
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Import articles from an NDJSON file (one article per line, '-' for "
+        "stdin) or a directory of Markdown files. Records are read as a stream "
+        "and committed in chunks; with --checkpoint an interrupted import "
+        "resumes after the last committed record."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="NDJSON file, '-' or Markdown directory.")
+        parser.add_argument(
+            "--format",
+            choices=["ndjson", "markdown"],
+            help="Defaults to markdown for directories and ndjson otherwise.",
+        )
+        parser.add_argument(
+            "--author",
+            help="Email of the author of records that do not name one.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.ARTICLE_IMPORT["CHUNK_SIZE"],
+            help="Number of articles inserted per transaction.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=None,
+            help="Resume after this record (NDJSON line or Markdown file number).",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="File holding the last committed record; read on start, "
+            "written after every chunk.",
+        )
+
+    def read_checkpoint(self, path):
+        try:
+            return int(Path(path).read_text().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def write_checkpoint(self, path, position):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(f"{position}\n")
+        os.replace(tmp, path)
+
+    def records(self, source, fmt, start_after):
+        if fmt == "markdown":
+            yield from iter_markdown(source, start_after)
+        elif source == "-":
+            yield from iter_ndjson(sys.stdin, start_after)
+        else:
+            with open(source, encoding="utf-8") as f:
+                yield from iter_ndjson(f, start_after)
+
+    def handle(self, *args, **options):
+        source = options["source"]
+        fmt = options["format"] or ("markdown" if os.path.isdir(source) else "ndjson")
+        if source != "-" and not os.path.exists(source):
+            raise CommandError(f"{source} does not exist.")
+
+        author = None
+        if options["author"]:
+            try:
+                author = User.objects.get(email=options["author"])
+            except User.DoesNotExist:
+                raise CommandError(f"No user with email {options['author']}.")
+
+        checkpoint = options["checkpoint"]
+        start_after = options["start_after"]
+        if start_after is None:
+            start_after = self.read_checkpoint(checkpoint) if checkpoint else 0
+        if start_after:
+            self.stdout.write(f"Resuming after record {start_after}")
+
+        def progress(result):
+            for error in result.errors:
+                self.stderr.write(
+                    f"Record {error['position']}: {json.dumps(error['errors'])}"
+                )
+            result.errors.clear()
+            if checkpoint:
+                self.write_checkpoint(checkpoint, result.last_position)
+            self.stdout.write(
+                f"Imported {result.created} articles, skipped {result.failed} "
+                f"(up to record {result.last_position})"
+            )
+
+        records = self.records(source, fmt, start_after)
+        importer = ArticleImporter(
+            author=author, chunk_size=options["chunk_size"], progress=progress
+        )
+        try:
+            result = importer.run(records)
+        except Exception:
+            last = importer.result.last_position or start_after
+            self.stderr.write(
+                f"Import stopped; resume with --start-after {last}"
+                + (f" or --checkpoint {checkpoint}" if checkpoint else "")
+            )
+            raise
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.created} articles, skipped {result.failed}."
+            )
+        )
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+
+from core_apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized engagement counters on articles in chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of article primary keys recomputed per transaction.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this article pkid.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_pkid = options["start_after"]
+        max_pkid = Article.objects.aggregate(max_pkid=Max("pkid"))["max_pkid"] or 0
+        reconciled = 0
+
+        while last_pkid < max_pkid:
+            upper = last_pkid + chunk_size
+            with transaction.atomic():
+                reconciled += Article.objects.filter(
+                    pkid__gt=last_pkid, pkid__lte=upper
+                ).reconcile_counters()
+            last_pkid = upper
+            self.stdout.write(f"Reconciled {reconciled} articles (up to pkid {upper})")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled counters for {reconciled} articles.")
+        )
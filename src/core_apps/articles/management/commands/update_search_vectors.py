@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+
+from core_apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the full-text search_vector on articles that do not have one yet. "
+        "Safe to interrupt and re-run: finished rows are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of article primary keys updated per transaction.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this article pkid.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every article, e.g. after changing the weights.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_pkid = options["start_after"]
+        queryset = Article.objects.all()
+        if not options["all"]:
+            queryset = queryset.filter(search_vector__isnull=True)
+        max_pkid = Article.objects.aggregate(max_pkid=Max("pkid"))["max_pkid"] or 0
+        updated = 0
+
+        while last_pkid < max_pkid:
+            upper = last_pkid + chunk_size
+            with transaction.atomic():
+                updated += queryset.filter(
+                    pkid__gt=last_pkid, pkid__lte=upper
+                ).update_search_vector()
+            last_pkid = upper
+            self.stdout.write(f"Updated {updated} articles (up to pkid {upper})")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Stored search vectors for {updated} articles.")
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from core_apps.articles.models import TrendingArticle
+from core_apps.articles.trending import update_trending
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold recent article activity into the trending ranking, as the "
+        "update_trending_articles beat task does."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of ranking rows written per query.",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Drop the ranking first, e.g. after changing the weights.",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            deleted, _ = TrendingArticle.objects.all().delete()
+            self.stdout.write(f"Dropped {deleted} ranking rows")
+        written = update_trending(batch_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Updated {written} trending scores."))
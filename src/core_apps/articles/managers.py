@@ -0,0 +1,438 @@
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection, models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Sum,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest, Now, Upper
+from django.utils import timezone
+
+# view_count is excluded: it tracks the unique-viewer estimate rather than a
+# child table, see core_apps.articles.viewers.sync_view_counts.
+ENGAGEMENT_COUNTERS = (
+    "clap_count",
+    "bookmark_count",
+    "response_count",
+    "rating_sum",
+    "rating_count",
+)
+
+
+def _aggregate_subquery(queryset, aggregate):
+    """Correlated aggregate over ``queryset``, grouped on its ``article`` column."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values("article")
+            .annotate(total=aggregate)
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+SEARCH_CONFIG = "english"
+
+# Claps are added and removed in one statement each: the article is found by
+# its UUID, the clap row written or deleted and the article's clap_count and
+# cache_version moved only when a row actually changed. ON CONFLICT makes a
+# repeated clap a no-op instead of a check-then-insert race. The outer SELECT
+# reads the snapshot from before the UPDATE, hence the COALESCE.
+CLAP_SQL = """
+WITH article AS (
+    SELECT pkid FROM {articles} WHERE id = %(article)s
+), changed AS (
+    {change}
+), counted AS (
+    UPDATE {articles}
+    SET clap_count = GREATEST(clap_count + %(delta)s, 0),
+        cache_version = cache_version + 1,
+        counters_changed_at = CURRENT_TIMESTAMP
+    FROM changed
+    WHERE {articles}.pkid = changed.article_id
+    RETURNING {articles}.clap_count
+)
+SELECT
+    EXISTS (SELECT 1 FROM changed),
+    COALESCE((SELECT clap_count FROM counted), target.clap_count)
+FROM article
+JOIN {articles} target ON target.pkid = article.pkid
+"""
+
+INSERT_CLAP_SQL = """
+    INSERT INTO {claps} (id, user_id, article_id, created_at, updated_at)
+    SELECT %(id)s, %(user)s, pkid, %(now)s, %(now)s FROM article
+    ON CONFLICT (user_id, article_id) DO NOTHING
+    RETURNING article_id
+"""
+
+DELETE_CLAP_SQL = """
+    DELETE FROM {claps} USING article
+    WHERE {claps}.article_id = article.pkid AND {claps}.user_id = %(user)s
+    RETURNING {claps}.article_id
+"""
+
+
+class ArticleQuerySet(models.QuerySet):
+    def for_serializer(self, fields=None):
+        """
+        The query plan behind ArticleSerializer: one query for the page plus a
+        fixed number of prefetches, independent of the page size. Engagement
+        figures are read from the denormalized counter columns. Pass the
+        serializer fields that will be rendered to skip the body column and
+        the relations nobody asked for.
+        """
+        from core_apps.bookmarks.models import Bookmark
+        from core_apps.responses.models import Response
+
+        def wanted(field):
+            return fields is None or field in fields
+
+        queryset = self.defer("search_vector")
+        if not wanted("body"):
+            queryset = queryset.defer("body")
+        if not wanted("banner_image_derivatives"):
+            queryset = queryset.defer("banner_image_meta")
+        if wanted("author_info"):
+            queryset = queryset.select_related("author__profile")
+        if wanted("tags"):
+            queryset = queryset.prefetch_related("tags")
+        if wanted("responses"):
+            queryset = queryset.prefetch_related(
+                Prefetch("responses", queryset=Response.objects.select_related("user"))
+            )
+        if wanted("bookmarks"):
+            queryset = queryset.prefetch_related(
+                Prefetch("bookmarks", queryset=Bookmark.objects.select_related("user"))
+            )
+        return queryset
+
+    def _search_vector(self):
+        from .models import ArticleTagging
+
+        tag_names = Subquery(
+            ArticleTagging.objects.filter(article=OuterRef("pk"))
+            .order_by()
+            .values("article")
+            .annotate(names=StringAgg("tag__name", delimiter=" "))
+            .values("names"),
+            output_field=TextField(),
+        )
+        return (
+            SearchVector("title", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+            + SearchVector(
+                Coalesce(tag_names, Value(""), output_field=TextField()),
+                weight="B",
+                config=SEARCH_CONFIG,
+            )
+            + SearchVector("body", weight="C", config=SEARCH_CONFIG)
+        )
+
+    def update_search_vector(self):
+        """
+        Recompute the stored search_vector of the selected articles from their
+        title (A), description and tag names (B) and body (C).
+        """
+        return self.update(search_vector=self._search_vector())
+
+    def tagged(self, name):
+        """
+        Articles tagged ``name``, in any spelling. The tag is found through
+        the unique normalized name index and its articles through the
+        (tag, article) index of the through table.
+        """
+        from .models import ArticleTag
+
+        return self.filter(taggings__tag__normalized_name=ArticleTag.normalize(name))
+
+    def trending(self):
+        """
+        Articles of the trending ranking with activity inside
+        ARTICLE_TRENDING["WINDOW"], highest score first, annotated with the
+        stored ``trending_log_score``.
+        """
+        cutoff = timezone.now() - timedelta(seconds=settings.ARTICLE_TRENDING["WINDOW"])
+        return (
+            self.filter(trending__last_activity_at__gte=cutoff)
+            .annotate(trending_log_score=F("trending__score"))
+            .order_by("-trending__score")
+        )
+
+    def related_to(self, article):
+        """
+        The precomputed related articles of ``article``, most similar first,
+        annotated with ``related_score``.
+        """
+        return (
+            self.filter(related_listings__article=article)
+            .annotate(related_score=F("related_listings__score"))
+            .order_by("-related_score")
+        )
+
+    def search(self, query, headline=False):
+        """
+        Articles matching a web-search style ``query`` ("quoted phrases", or,
+        -excluded), best match first. The match uses the GIN index on
+        search_vector; ``headline=True`` also annotates a highlighted body
+        snippet.
+        """
+        query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+        queryset = (
+            self.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_at")
+        )
+        if headline:
+            queryset = queryset.annotate(
+                headline=SearchHeadline(
+                    "body",
+                    query,
+                    config=SEARCH_CONFIG,
+                    min_words=15,
+                    max_words=35,
+                    max_fragments=2,
+                )
+            )
+        return queryset
+
+    def suggest(self, query, limit):
+        """
+        Typeahead matches on the title: substrings and close spellings of
+        ``query``, prefix matches first. Both conditions are served by the
+        trigram index on UPPER(title), the same expression icontains uses.
+        """
+        upper_query = query.upper()
+        return (
+            self.annotate(upper_title=Upper("title"))
+            .filter(
+                Q(title__icontains=query)
+                | Q(upper_title__trigram_word_similar=upper_query)
+            )
+            .annotate(
+                is_prefix=Case(
+                    When(title__istartswith=query, then=Value(1)),
+                    default=Value(0),
+                ),
+                similarity=TrigramWordSimilarity(upper_query, "upper_title"),
+            )
+            .order_by("-is_prefix", "-similarity", "title")
+            .values("id", "title", "slug")[:limit]
+        )
+
+    def adjust_counters(self, article_pk, **deltas):
+        """
+        Atomically shift the counter columns of one article, e.g.
+        ``adjust_counters(pk, clap_count=1)``. Counters never go below zero.
+        The article's cache_version and counters_changed_at are set in the
+        same statement.
+        """
+        return self.filter(pk=article_pk).update(
+            cache_version=F("cache_version") + 1,
+            counters_changed_at=Now(),
+            **{
+                counter: Greatest(F(counter) + delta, 0)
+                for counter, delta in deltas.items()
+            },
+        )
+
+    def touch(self):
+        """Invalidate the cached fragments of the selected articles."""
+        return self.update(cache_version=F("cache_version") + 1)
+
+    def reconcile_counters(self, *counters):
+        """
+        Recompute the counter columns of the selected articles from the child
+        tables. Pass counter names to restrict the update, e.g.
+        ``reconcile_counters("clap_count")``; all counters are recomputed
+        otherwise.
+        """
+        from core_apps.bookmarks.models import Bookmark
+        from core_apps.ratings.models import Rating
+        from core_apps.responses.models import Response
+
+        from .models import Clap
+
+        article = OuterRef("pk")
+        ratings = Rating.objects.filter(article=article)
+        expressions = {
+            "clap_count": _aggregate_subquery(
+                Clap.objects.filter(article=article), Count("pk")
+            ),
+            "bookmark_count": _aggregate_subquery(
+                Bookmark.objects.filter(article=article), Count("pk")
+            ),
+            "response_count": _aggregate_subquery(
+                Response.objects.filter(article=article), Count("pk")
+            ),
+            "rating_sum": _aggregate_subquery(ratings, Sum("rating")),
+            "rating_count": _aggregate_subquery(ratings, Count("pk")),
+        }
+        counters = counters or ENGAGEMENT_COUNTERS
+        return self.update(
+            counters_changed_at=Now(),
+            **{counter: expressions[counter] for counter in counters},
+        )
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
+    pass
+
+
+class ClapManager(models.Manager):
+    def _toggle(self, change_sql, delta, params):
+        from .models import Article
+
+        tables = {
+            "articles": connection.ops.quote_name(Article._meta.db_table),
+            "claps": connection.ops.quote_name(self.model._meta.db_table),
+        }
+        sql = CLAP_SQL.format(change=change_sql.format(**tables), **tables)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {**params, "delta": delta})
+            return cursor.fetchone()
+
+    def add(self, user, article_id):
+        """
+        Clap the article with UUID ``article_id`` once; clapping again
+        changes nothing. Returns (created, clap_count), or None when there is
+        no such article. Post-save signals are not sent.
+        """
+        params = {
+            "id": uuid.uuid4(),
+            "user": user.pk,
+            "article": article_id,
+            "now": timezone.now(),
+        }
+        return self._toggle(INSERT_CLAP_SQL, 1, params)
+
+    def remove(self, user, article_id):
+        """
+        Take back the user's clap, if any. Returns (deleted, clap_count), or
+        None when there is no such article. Post-delete signals are not sent.
+        """
+        return self._toggle(
+            DELETE_CLAP_SQL, -1, {"user": user.pk, "article": article_id}
+        )
+
+    def statuses(self, user, article_ids):
+        """
+        ``{article UUID: {"clapped": bool, "clap_count": int}}`` for the
+        existing articles among ``article_ids``, in one query.
+        """
+        from .models import Article
+
+        rows = (
+            Article.objects.filter(id__in=article_ids)
+            .annotate(clapped=Exists(self.filter(user=user, article=OuterRef("pk"))))
+            .values_list("id", "clapped", "clap_count")
+        )
+        return {
+            article_id: {"clapped": clapped, "clap_count": clap_count}
+            for article_id, clapped, clap_count in rows
+        }
+
+
+class ArticleTagManager(models.Manager):
+    def for_names(self, names):
+        """
+        Tags for ``names`` keyed by normalized name. Missing tags are created
+        with one bulk insert, keeping the first spelling seen; a tag created
+        concurrently is picked up by the re-read.
+        """
+        wanted = {}
+        for name in names:
+            name = " ".join(str(name).split())
+            if name:
+                wanted.setdefault(self.model.normalize(name), name)
+        tags = {
+            tag.normalized_name: tag
+            for tag in self.filter(normalized_name__in=list(wanted))
+        }
+        missing = [key for key in wanted if key not in tags]
+        if missing:
+            self.bulk_create(
+                [self.model(name=wanted[key], normalized_name=key) for key in missing],
+                ignore_conflicts=True,
+            )
+            tags.update(
+                (tag.normalized_name, tag)
+                for tag in self.filter(normalized_name__in=missing)
+            )
+        return tags
+
+
+class ArticleTaggingManager(models.Manager):
+    def assign(self, tags_by_article, replace=True):
+        """
+        Tag many articles at once. ``tags_by_article`` maps articles (or
+        their pks) to tag names; the current taggings are read with one
+        query, stale ones removed with one DELETE (unless ``replace`` is
+        False) and new ones added with one bulk insert. Signals are not sent:
+        callers refresh reading times and search vectors themselves. Returns
+        the pks of the articles whose tags changed.
+        """
+        from .models import ArticleTag
+
+        names_by_article = {
+            getattr(article, "pk", article): list(names)
+            for article, names in tags_by_article.items()
+        }
+        tags = ArticleTag.objects.for_names(
+            name for names in names_by_article.values() for name in names
+        )
+        wanted = {
+            article_pk: {
+                tags[key].pk for key in map(ArticleTag.normalize, names) if key in tags
+            }
+            for article_pk, names in names_by_article.items()
+        }
+        current = defaultdict(set)
+        for article_pk, tag_pk in self.filter(article_id__in=list(wanted)).values_list(
+            "article_id", "tag_id"
+        ):
+            current[article_pk].add(tag_pk)
+
+        stale = models.Q()
+        added = []
+        changed = set()
+        for article_pk, tag_pks in wanted.items():
+            removed = current[article_pk] - tag_pks if replace else set()
+            if removed:
+                stale |= models.Q(article_id=article_pk, tag_id__in=removed)
+            new = tag_pks - current[article_pk]
+            added.extend(
+                self.model(article_id=article_pk, tag_id=tag_pk) for tag_pk in new
+            )
+            if removed or new:
+                changed.add(article_pk)
+
+        with transaction.atomic():
+            if stale:
+                self.filter(stale).delete()
+            self.bulk_create(added, ignore_conflicts=True)
+        return changed
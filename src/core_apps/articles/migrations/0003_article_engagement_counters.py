@@ -0,0 +1,89 @@
+# Generated by Django 4.1.7 on 2026-10-18 08:49
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def _aggregate_subquery(queryset, aggregate):
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values("article")
+            .annotate(total=aggregate)
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    ArticleView = apps.get_model("articles", "ArticleView")
+    Clap = apps.get_model("articles", "Clap")
+    Bookmark = apps.get_model("bookmarks", "Bookmark")
+    Rating = apps.get_model("ratings", "Rating")
+    Response = apps.get_model("responses", "Response")
+
+    article = OuterRef("pk")
+    ratings = Rating.objects.filter(article=article)
+    Article.objects.update(
+        view_count=_aggregate_subquery(
+            ArticleView.objects.filter(article=article), Count("pk")
+        ),
+        clap_count=_aggregate_subquery(
+            Clap.objects.filter(article=article), Count("pk")
+        ),
+        bookmark_count=_aggregate_subquery(
+            Bookmark.objects.filter(article=article), Count("pk")
+        ),
+        response_count=_aggregate_subquery(
+            Response.objects.filter(article=article), Count("pk")
+        ),
+        rating_sum=_aggregate_subquery(ratings, Sum("rating")),
+        rating_count=_aggregate_subquery(ratings, Count("pk")),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0002_initial"),
+        ("bookmarks", "0002_initial"),
+        ("ratings", "0002_initial"),
+        ("responses", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="bookmark_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="bookmark count"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="clap_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="clap count"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="rating count"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, verbose_name="rating sum"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="response_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="response count"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="view_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="view count"),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.1.7 on 2026-10-18 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0003_article_engagement_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="reading_time",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="reading time"
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="word_count",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="word count"
+            ),
+        ),
+    ]
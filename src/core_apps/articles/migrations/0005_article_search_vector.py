@@ -0,0 +1,31 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The GIN index is built concurrently so the articles table stays writable.
+    atomic = False
+
+    dependencies = [
+        ("articles", "0004_article_reading_time"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="article",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="article_search_vector_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-18 10:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("articles", "0006_article_title_trgm"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="article",
+            index=models.Index(
+                fields=["-created_at", "-pkid"], name="article_created_pkid_idx"
+            ),
+        ),
+    ]
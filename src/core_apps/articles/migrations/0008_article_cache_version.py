@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0007_article_created_pkid_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="cache_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
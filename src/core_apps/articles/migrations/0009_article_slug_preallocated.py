@@ -0,0 +1,20 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:10
+
+import core_apps.articles.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0008_article_cache_version"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="article",
+            name="slug",
+            field=core_apps.articles.fields.PreallocatedAutoSlugField(
+                always_update=True, editable=False, populate_from="title", unique=True
+            ),
+        ),
+    ]
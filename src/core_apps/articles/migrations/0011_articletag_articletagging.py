@@ -0,0 +1,84 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0010_article_banner_image_meta"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="name")),
+                (
+                    "normalized_name",
+                    models.CharField(
+                        editable=False,
+                        max_length=100,
+                        unique=True,
+                        verbose_name="normalized name",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArticleTagging",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "article",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="taggings",
+                        to="articles.article",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="taggings",
+                        to="articles.articletag",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="articletagging",
+            index=models.Index(
+                fields=["tag", "article"], name="article_tagging_tag_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="articletagging",
+            constraint=models.UniqueConstraint(
+                fields=("article", "tag"), name="article_tagging_article_tag_uniq"
+            ),
+        ),
+    ]
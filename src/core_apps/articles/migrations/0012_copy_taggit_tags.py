@@ -0,0 +1,80 @@
+from django.db import migrations
+
+BATCH_SIZE = 5000
+
+
+def normalize(name):
+    # Same as ArticleTag.normalize().
+    return " ".join(str(name).split()).lower()
+
+
+def copy_taggit_tags(apps, schema_editor):
+    """
+    Copy the taggit tags of articles into ArticleTag/ArticleTagging. Tags
+    that only differ in case or spacing are merged. The taggit rows are left
+    in place, so reversing this migration needs no data changes.
+    """
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    TaggedItem = apps.get_model("taggit", "TaggedItem")
+    Article = apps.get_model("articles", "Article")
+    ArticleTag = apps.get_model("articles", "ArticleTag")
+    ArticleTagging = apps.get_model("articles", "ArticleTagging")
+
+    content_type = ContentType.objects.filter(
+        app_label="articles", model="article"
+    ).first()
+    if content_type is None:
+        return
+    # Generic relations have no foreign key, so skip rows of deleted articles.
+    items = TaggedItem.objects.filter(
+        content_type=content_type,
+        object_id__in=Article.objects.values("pkid"),
+    )
+
+    names = {}
+    for tag_pk, name in (
+        items.order_by("tag_id").values_list("tag_id", "tag__name").distinct()
+    ):
+        names[tag_pk] = name
+    spellings = {}
+    for name in names.values():
+        name = " ".join(name.split())
+        if name:
+            spellings.setdefault(normalize(name), name)
+    ArticleTag.objects.bulk_create(
+        [ArticleTag(name=name, normalized_name=key) for key, name in spellings.items()],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    new_pks = dict(ArticleTag.objects.values_list("normalized_name", "pk"))
+    tag_map = {
+        tag_pk: new_pks[normalize(name)]
+        for tag_pk, name in names.items()
+        if normalize(name) in new_pks
+    }
+
+    batch = []
+    for article_pk, tag_pk in (
+        items.order_by("pk")
+        .values_list("object_id", "tag_id")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        if tag_pk not in tag_map:
+            continue
+        batch.append(ArticleTagging(article_id=article_pk, tag_id=tag_map[tag_pk]))
+        if len(batch) == BATCH_SIZE:
+            ArticleTagging.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    ArticleTagging.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0011_articletag_articletagging"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("taggit", "0005_auto_20220424_2025"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_taggit_tags, migrations.RunPython.noop),
+    ]
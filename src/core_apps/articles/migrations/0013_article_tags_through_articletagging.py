@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0012_copy_taggit_tags"),
+    ]
+
+    # A TaggableManager has no column or table of its own, and the new field
+    # uses the existing ArticleTagging table, so only the state changes.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveField(
+                    model_name="article",
+                    name="tags",
+                ),
+                migrations.AddField(
+                    model_name="article",
+                    name="tags",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        related_name="articles",
+                        through="articles.ArticleTagging",
+                        to="articles.articletag",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0013_article_tags_through_articletagging"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrendingArticle",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="trending",
+                        serialize=False,
+                        to="articles.article",
+                    ),
+                ),
+                (
+                    "score",
+                    models.FloatField(blank=True, null=True, verbose_name="score"),
+                ),
+                (
+                    "last_activity_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="last activity at"
+                    ),
+                ),
+                ("view_count", models.PositiveIntegerField(default=0)),
+                ("clap_count", models.PositiveIntegerField(default=0)),
+                ("rating_count", models.PositiveIntegerField(default=0)),
+                ("response_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="trendingarticle",
+            index=models.Index(fields=["-score"], name="trending_score_idx"),
+        ),
+    ]
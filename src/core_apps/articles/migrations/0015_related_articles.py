@@ -0,0 +1,105 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0014_trendingarticle"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleSignature",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="signature",
+                        serialize=False,
+                        to="articles.article",
+                    ),
+                ),
+                ("minhash", models.BinaryField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RelatedArticle",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField(verbose_name="score")),
+                (
+                    "article",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_entries",
+                        to="articles.article",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_listings",
+                        to="articles.article",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArticleLSHBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("band", models.PositiveSmallIntegerField()),
+                ("bucket", models.BigIntegerField()),
+                (
+                    "article",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lsh_buckets",
+                        to="articles.article",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="relatedarticle",
+            constraint=models.UniqueConstraint(
+                fields=("article", "related"), name="related_article_uniq"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="articlelshbucket",
+            index=models.Index(
+                fields=["band", "bucket"], name="article_lsh_bucket_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="articlelshbucket",
+            constraint=models.UniqueConstraint(
+                fields=("article", "band"), name="article_lsh_article_band_uniq"
+            ),
+        ),
+    ]
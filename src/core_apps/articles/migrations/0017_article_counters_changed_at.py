@@ -0,0 +1,39 @@
+# Generated by Django 4.1.7 on 2026-10-18 10:05
+
+from django.db import migrations, models
+from django.db.models import Q
+from django.db.models.functions import Now
+
+COUNTERS = ("view_count", "clap_count", "rating_count", "response_count")
+
+
+def mark_active_articles(apps, schema_editor):
+    """
+    Let the first update_trending() run compare every article with activity
+    against its snapshot, as it did before counters_changed_at existed.
+    """
+    Article = apps.get_model("articles", "Article")
+    Article.objects.filter(
+        Q(*(Q(**{f"{counter}__gt": 0}) for counter in COUNTERS), _connector=Q.OR)
+    ).update(counters_changed_at=Now())
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0016_feedentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="counters_changed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["counters_changed_at"], name="article_counters_changed_idx"
+            ),
+        ),
+        migrations.RunPython(mark_active_articles, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,25 @@
-from autoslug import AutoSlugField
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
-from taggit.managers import TaggableManager
 
 from core_apps.common.models import TimeStampedModel
 
-from .read_time_engine import ArticleReadTimeEngine
+from . import related
+from .fields import PreallocatedAutoSlugField
+from .managers import (
+    ArticleManager,
+    ArticleTaggingManager,
+    ArticleTagManager,
+    ClapManager,
+)
+from .read_time_engine import ArticleReadTimeEngine, tag_count
+from .view_buffer import buffer_view
+from .viewers import record_unique_viewer
 
 User = get_user_model()
 
@@ -15,6 +28,8 @@ class Clap(TimeStampedModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     article = models.ForeignKey("Article", on_delete=models.CASCADE)
 
+    objects = ClapManager()
+
     class Meta:
         unique_together = ["user", "article"]
         ordering = ["-created_at"]
@@ -23,39 +38,367 @@ class Clap(TimeStampedModel):
         return f"{self.user.first_name} clapped {self.article.title}"
 
 
+class ArticleTag(models.Model):
+    """
+    A tag of articles. ``name`` keeps the first spelling used;
+    ``normalized_name`` (trimmed, single-spaced, lowercase) identifies the
+    tag, so "Django" and " django" are the same tag and tag lookups are
+    exact matches on its unique index.
+    """
+
+    name = models.CharField(verbose_name=_("name"), max_length=100)
+    normalized_name = models.CharField(
+        verbose_name=_("normalized name"), max_length=100, unique=True, editable=False
+    )
+
+    objects = ArticleTagManager()
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def normalize(name):
+        return " ".join(str(name).split()).lower()
+
+    def save(self, *args, **kwargs):
+        self.name = " ".join(self.name.split())
+        self.normalized_name = self.normalize(self.name)
+        super().save(*args, **kwargs)
+
+
+class ArticleTagging(models.Model):
+    # The unique (article, tag) constraint and the (tag, article) index
+    # cover both directions, so the foreign keys need no indexes of their own.
+    article = models.ForeignKey(
+        "Article", on_delete=models.CASCADE, related_name="taggings", db_index=False
+    )
+    tag = models.ForeignKey(
+        ArticleTag, on_delete=models.CASCADE, related_name="taggings", db_index=False
+    )
+
+    objects = ArticleTaggingManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "tag"], name="article_tagging_article_tag_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["tag", "article"], name="article_tagging_tag_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} tagged {self.tag_id}"
+
+
 class Article(TimeStampedModel):
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="articles")
     title = models.CharField(verbose_name=_("Title"), max_length=255)
-    slug = AutoSlugField(populate_from="title", always_update=True, unique=True)
+    slug = PreallocatedAutoSlugField(
+        populate_from="title", always_update=True, unique=True
+    )
     description = models.CharField(verbose_name=_("description"), max_length=255)
     body = models.TextField(verbose_name=_("article content"))
     banner_image = models.ImageField(
         verbose_name=_("banner image"), default="/profile_default.png"
     )
-    tags = TaggableManager()
+    # Resized copies of banner_image, see core_apps.common.images.
+    banner_image_meta = models.JSONField(default=dict, blank=True, editable=False)
+    tags = models.ManyToManyField(
+        ArticleTag, through=ArticleTagging, related_name="articles", blank=True
+    )
 
     claps = models.ManyToManyField(User, through=Clap, related_name="clapped_articles")
 
+    # Denormalized engagement counters, kept current by core_apps.articles.signals
+    # and repaired by the reconcile_article_counters management command.
+    # view_count is the last synced unique-viewer estimate (see viewers.py).
+    view_count = models.PositiveIntegerField(verbose_name=_("view count"), default=0)
+    clap_count = models.PositiveIntegerField(verbose_name=_("clap count"), default=0)
+    bookmark_count = models.PositiveIntegerField(
+        verbose_name=_("bookmark count"), default=0
+    )
+    response_count = models.PositiveIntegerField(
+        verbose_name=_("response count"), default=0
+    )
+    rating_sum = models.PositiveIntegerField(verbose_name=_("rating sum"), default=0)
+    rating_count = models.PositiveIntegerField(
+        verbose_name=_("rating count"), default=0
+    )
+    # Set by every statement that moves a counter; update_trending() reads
+    # the articles changed since its last run off this column.
+    counters_changed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Recomputed on save only when one of READING_TIME_FIELDS or the tags
+    # change; NULL until backfilled by the backfill_reading_time command.
+    word_count = models.PositiveIntegerField(
+        verbose_name=_("word count"), null=True, blank=True
+    )
+    reading_time = models.PositiveIntegerField(
+        verbose_name=_("reading time"), null=True, blank=True
+    )
+
+    # Part of the rendered-fragment cache key (see fragments.py); bumped with
+    # F() + 1 on every save, counter change and related-row edit.
+    cache_version = models.PositiveIntegerField(default=0, editable=False)
+
+    # Weighted tsvector over title, description, tag names and body, written
+    # by ArticleQuerySet.update_search_vector() after saves and tag changes.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ArticleManager()
+
+    READING_TIME_FIELDS = ("title", "description", "body", "banner_image")
+    SEARCH_FIELDS = ("title", "description", "body")
+    RELATED_FIELDS = ("title", "description")
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            # Keyset order of ArticleCursorPagination.
+            models.Index(
+                fields=["-created_at", "-pkid"], name="article_created_pkid_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="article_search_vector_gin"),
+            models.Index(
+                fields=["counters_changed_at"], name="article_counters_changed_idx"
+            ),
+            # Serves title__icontains, which compares UPPER(title).
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="article_title_trgm",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.author.first_name}'s article"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep references to the loaded values so save() can tell whether the
+        # reading time and search inputs changed without re-reading the row.
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def _tracked_values(self):
+        deferred_fields = self.get_deferred_fields()
+        return {
+            field: self._meta.get_field(field).get_prep_value(getattr(self, field))
+            for field in self.READING_TIME_FIELDS
+            if field not in deferred_fields
+        }
+
+    def _changed_fields(self):
+        values = self._tracked_values()
+        loaded_values = getattr(self, "_loaded_values", None)
+        if loaded_values is None:
+            return set(values)
+        return {
+            field
+            for field, value in values.items()
+            if field in loaded_values and value != loaded_values[field]
+        }
+
+    def save(self, *args, **kwargs):
+        changed_fields = self._changed_fields()
+        bump_version = not self._state.adding
+        if bump_version:
+            self.cache_version = F("cache_version") + 1
+        if changed_fields or self.word_count is None:
+            self.word_count = ArticleReadTimeEngine.article_word_count(self)
+            self.reading_time = ArticleReadTimeEngine.reading_time(
+                self.word_count,
+                bool(self.banner_image),
+                tag_count(self) if self.pk else 0,
+            )
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "word_count",
+                    "reading_time",
+                }
+        if bump_version and kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "cache_version"}
+        super().save(*args, **kwargs)
+        if bump_version:
+            # Drop the F() expression; the next access reloads the new number.
+            self.__dict__.pop("cache_version", None)
+        if changed_fields.intersection(self.SEARCH_FIELDS):
+            self.update_search_vector()
+        if changed_fields.intersection(self.RELATED_FIELDS):
+            related.schedule_update([self.pk])
+        self._loaded_values = self._tracked_values()
+
+    def update_search_vector(self):
+        Article.objects.filter(pk=self.pk).update_search_vector()
+        # The in-memory value is now stale; dropping it defers the field so a
+        # later save() of this instance does not write the old vector back.
+        self.__dict__.pop("search_vector", None)
+
+    def update_reading_time(self):
+        """Refresh reading_time after a tag change, reusing the stored word count."""
+        if self.word_count is None:
+            self.word_count = ArticleReadTimeEngine.article_word_count(self)
+        self.reading_time = ArticleReadTimeEngine.reading_time(
+            self.word_count, bool(self.banner_image), tag_count(self)
+        )
+        Article.objects.filter(pk=self.pk).update(
+            word_count=self.word_count,
+            reading_time=self.reading_time,
+            cache_version=F("cache_version") + 1,
+        )
+        self.__dict__.pop("cache_version", None)
+
+    def set_tags(self, names):
+        """
+        Replace the article's tags with ``names`` and, if that changed
+        anything, refresh the reading time and search vector once.
+        """
+        if ArticleTagging.objects.assign({self.pk: names}):
+            getattr(self, "_prefetched_objects_cache", {}).pop("tags", None)
+            self.update_reading_time()
+            self.update_search_vector()
+            related.schedule_update([self.pk])
+
     @property
     def estimated_reading_time(self):
-        return ArticleReadTimeEngine.estimate_reading_time(self)
-
-    def view_count(self):
-        return self.article_views.count()
+        if self.reading_time is None:
+            return ArticleReadTimeEngine.estimate_reading_time(self)
+        return self.reading_time
 
     def average_rating(self):
-        ratings = self.ratings.all()
-
-        if ratings.count() > 0:
-            total_rating = sum(rating.rating for rating in ratings)
-            average_rating = total_rating / ratings.count()
+        if self.rating_count > 0:
+            average_rating = self.rating_sum / self.rating_count
             return round(average_rating, 2)
         return None
 
 
+class TrendingArticle(models.Model):
+    """
+    The materialized trending ranking, maintained by trending.update_trending().
+    ``score`` is the log of the article's forward-decayed activity (see
+    trending.decayed_score() for the current value); the counter snapshots
+    are what the next update measures new activity against.
+    """
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, primary_key=True, related_name="trending"
+    )
+    score = models.FloatField(verbose_name=_("score"), null=True, blank=True)
+    last_activity_at = models.DateTimeField(
+        verbose_name=_("last activity at"), null=True, blank=True
+    )
+    view_count = models.PositiveIntegerField(default=0)
+    clap_count = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    response_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # The trending endpoint reads pages straight off this index.
+            models.Index(fields=["-score"], name="trending_score_idx"),
+        ]
+
+    def __str__(self):
+        return f"Trending score of article {self.article_id}"
+
+
+class ArticleSignature(models.Model):
+    """MinHash signature of an article's title, description and tags."""
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, primary_key=True, related_name="signature"
+    )
+    minhash = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Signature of article {self.article_id}"
+
+
+class ArticleLSHBucket(models.Model):
+    """An LSH band of an article's signature; a shared bucket makes a candidate."""
+
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="lsh_buckets", db_index=False
+    )
+    band = models.PositiveSmallIntegerField()
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "band"], name="article_lsh_article_band_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["band", "bucket"], name="article_lsh_bucket_idx"),
+        ]
+
+    def __str__(self):
+        return f"Band {self.band} of article {self.article_id}"
+
+
+class RelatedArticle(models.Model):
+    """A precomputed related article, see related.py; TOP_K are kept per article."""
+
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name="related_entries",
+        db_index=False,
+    )
+    related = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="related_listings"
+    )
+    score = models.FloatField(verbose_name=_("score"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "related"], name="related_article_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.related_id} is related to {self.article_id}"
+
+
+class FeedEntry(models.Model):
+    """An article in a follower's timeline, written on publish; see feed.py."""
+
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="feed_entries", db_index=False
+    )
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="feed_entries"
+    )
+    # The article's created_at, so a timeline page is read from this table alone.
+    published_at = models.DateTimeField(verbose_name=_("published at"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "article"], name="feed_entry_owner_article_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["owner", "-published_at", "-article"],
+                name="feed_entry_timeline_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Article {self.article_id} in the feed of {self.owner_id}"
+
+
 class ArticleView(TimeStampedModel):
     article = models.ForeignKey(
         Article, on_delete=models.CASCADE, related_name="article_views"
@@ -77,7 +420,13 @@ class ArticleView(TimeStampedModel):
 
     @classmethod
     def record_view(cls, article, user, viewer_ip):
-        view, _ = cls.objects.get_or_create(
-            article=article, user=user, viewer_ip=viewer_ip
-        )
-        view.save()
+        if not record_unique_viewer(article, user, viewer_ip):
+            return
+        # Exact rows are only kept as an audit trail; view counts come from
+        # the unique-viewer estimate.
+        if not settings.ARTICLE_VIEWERS["AUDIT"]:
+            return
+        if settings.ARTICLE_VIEW_BUFFER["ENABLED"]:
+            buffer_view(article, user, viewer_ip)
+            return
+        cls.objects.get_or_create(article=article, user=user, viewer_ip=viewer_ip)
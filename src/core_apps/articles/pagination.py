@@ -1,7 +1,237 @@
-from rest_framework.pagination import PageNumberPagination
+from collections import OrderedDict
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core_apps.common.cursors import decode_cursor, encode_cursor
+
+
+def keyset(
+    queryset, position, reverse=False, created_field="created_at", pk_field="pkid"
+):
+    """
+    Rows of ``queryset`` after ``position`` (a (created_at, pk) pair) in
+    newest-first order, or before it when ``reverse``, ordered away from
+    the position. The created_at bound keeps this a single index range scan.
+    """
+    created_at, pk = position
+    if reverse:
+        return queryset.filter(
+            Q(**{f"{created_field}__gt": created_at})
+            | Q(**{created_field: created_at, f"{pk_field}__gt": pk}),
+            **{f"{created_field}__gte": created_at},
+        ).order_by(created_field, pk_field)
+    return queryset.filter(
+        Q(**{f"{created_field}__lt": created_at})
+        | Q(**{created_field: created_at, f"{pk_field}__lt": pk}),
+        **{f"{created_field}__lte": created_at},
+    ).order_by(f"-{created_field}", f"-{pk_field}")
 
 
 class ArticlePagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 30
+
+
+class ArticleCursorPagination(BasePagination):
+    """
+    Keyset pagination over (created_at, pkid), newest first. Every page is a
+    range scan on the matching composite index, so deep pages cost the same
+    as the first one and no COUNT(*) is run. Cursors are opaque and carry the
+    direction, so ``next`` and ``previous`` links can be followed either way.
+    Any ?ordering= is ignored in this mode.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 30
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_cursor_link(self, article, reverse):
+        position = {
+            "c": article.created_at.isoformat(),
+            "p": article.pkid,
+            "r": int(reverse),
+        }
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encode_cursor(position)
+        )
+
+    def get_position(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = decode_cursor(encoded)
+            return (
+                datetime.fromisoformat(position["c"]),
+                int(position["p"]),
+                bool(position["r"]),
+            )
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def fetch(self, queryset, cursor, limit):
+        """Up to ``limit`` articles past ``cursor``, in the direction it points."""
+        if cursor is None:
+            return list(queryset.order_by("-created_at", "-pkid")[:limit])
+        created_at, pkid, reverse = cursor
+        return list(keyset(queryset, (created_at, pkid), reverse)[:limit])
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        cursor = self.get_position(request)
+
+        reverse = cursor[2] if cursor is not None else False
+        page = self.fetch(queryset, cursor, page_size + 1)
+        has_more = len(page) > page_size
+        page = page[:page_size]
+        if reverse:
+            page.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = cursor is not None and (has_more or not reverse)
+        self.page = page
+        return page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.get_cursor_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.get_cursor_link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class FeedCursorPagination(ArticleCursorPagination):
+    """
+    ArticleCursorPagination over the requesting user's timeline: positions
+    come from the precomputed entries (see feed.py) and the page's articles
+    are then read by primary key.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        return super().paginate_queryset(queryset, request, view)
+
+    def fetch(self, queryset, cursor, limit):
+        from .feed import timeline
+
+        position, reverse = (cursor[:2], cursor[2]) if cursor else (None, False)
+        positions = timeline(self.request.user, position, reverse, limit)
+        articles = queryset.in_bulk([pkid for _, pkid in positions])
+        return [articles[pkid] for _, pkid in positions if pkid in articles]
+
+
+class TrendingPagination(BasePagination):
+    """
+    Page numbers over the trending ranking without a COUNT(*): a page reads
+    page_size + 1 rows in score order, the extra row deciding whether there
+    is a next page. The ranking ends at ARTICLE_TRENDING["MAX_RANK"].
+    """
+
+    page_query_param = "page"
+    page_size_query_param = "page_size"
+    invalid_page_message = "Invalid page."
+
+    def get_page_size(self, request):
+        config = settings.ARTICLE_TRENDING
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return config["PAGE_SIZE"]
+        return min(max(page_size, 1), config["MAX_PAGE_SIZE"])
+
+    def get_page_link(self, number):
+        if number == 1:
+            return remove_query_param(self.base_url, self.page_query_param)
+        return replace_query_param(self.base_url, self.page_query_param, number)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        try:
+            self.number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+        if self.number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        max_rank = settings.ARTICLE_TRENDING["MAX_RANK"]
+        start = (self.number - 1) * page_size
+        end = min(start + page_size, max_rank)
+        page = list(queryset[start : end + 1]) if start < end else []
+        self.has_next = len(page) > end - start and end < max_rank
+        self.page = page[: end - start]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.get_page_link(self.number + 1)
+
+    def get_previous_link(self):
+        if self.number == 1:
+            return None
+        return self.get_page_link(self.number - 1)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,14 @@
+from rest_framework.parsers import BaseParser
+
+from .importer import iter_ndjson
+
+
+class NDJSONParser(BaseParser):
+    """One JSON document per line; lines that fail to parse become error strings."""
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            return []
+        return [record for _, record in iter_ndjson(stream)]
@@ -2,6 +2,19 @@ import re
 from math import ceil
 
 
+def tag_count(article):
+    """
+    Number of tags of ``article`` from its ``tag_total`` annotation or
+    prefetched tags when present, with a COUNT query otherwise.
+    """
+    if hasattr(article, "tag_total"):
+        return article.tag_total
+    prefetched = getattr(article, "_prefetched_objects_cache", {})
+    if "tags" in prefetched:
+        return len(prefetched["tags"])
+    return article.tags.count()
+
+
 class ArticleReadTimeEngine:
     @staticmethod
     def word_count(text):
@@ -9,23 +22,40 @@ class ArticleReadTimeEngine:
         return len(words)
 
     @staticmethod
-    def estimate_reading_time(
-        article, words_per_minute=250, seconds_per_image=10, seconds_per_tag=2
-    ):
-        word_count_body = ArticleReadTimeEngine.word_count(article.body)
-        word_count_title = ArticleReadTimeEngine.word_count(article.title)
-        word_count_description = ArticleReadTimeEngine.word_count(article.description)
-
-        total_word_count = word_count_body + word_count_title + word_count_description
+    def article_word_count(article):
+        return (
+            ArticleReadTimeEngine.word_count(article.body)
+            + ArticleReadTimeEngine.word_count(article.title)
+            + ArticleReadTimeEngine.word_count(article.description)
+        )
 
+    @staticmethod
+    def reading_time(
+        total_word_count,
+        has_banner_image,
+        tag_count,
+        words_per_minute=250,
+        seconds_per_image=10,
+        seconds_per_tag=2,
+    ):
         reading_time = total_word_count / words_per_minute
 
-        if article.banner_image:
+        if has_banner_image:
             reading_time += seconds_per_image / 60
 
-        tag_count = article.tags.count()
         reading_time += (tag_count * seconds_per_tag) / 60
 
-        reading_time = ceil(reading_time)
+        return ceil(reading_time)
 
-        return reading_time
+    @staticmethod
+    def estimate_reading_time(
+        article, words_per_minute=250, seconds_per_image=10, seconds_per_tag=2
+    ):
+        return ArticleReadTimeEngine.reading_time(
+            ArticleReadTimeEngine.article_word_count(article),
+            bool(article.banner_image),
+            tag_count(article),
+            words_per_minute=words_per_minute,
+            seconds_per_image=seconds_per_image,
+            seconds_per_tag=seconds_per_tag,
+        )
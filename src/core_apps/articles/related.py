@@ -0,0 +1,415 @@
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q, Value
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w+")
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+# Fixed so that signatures stay comparable between runs and processes.
+PERMUTATION_SEED = 20240601
+
+STOPWORDS = frozenset(
+    """
+    a about after all also an and any are as at be been but by can for from
+    had has have how i if in into is it its more most my new no not of on one
+    or our out so than that the their them then there these they this to up
+    us was we what when which who why will with you your
+    """.split()
+)
+
+
+def _config():
+    return settings.ARTICLE_RELATED
+
+
+def _permutations(num_perm):
+    rng = np.random.default_rng(PERMUTATION_SEED)
+    a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def tokens(title, description, tag_names):
+    """
+    The feature set of an article: the words of its title and description
+    without stopwords, and its tags as ``#tag`` so a shared tag is a
+    stronger hint than a shared word.
+    """
+    words = TOKEN_RE.findall(f"{title} {description}".lower())
+    features = {word for word in words if len(word) > 1 and word not in STOPWORDS}
+    features.update(f"#{name}" for name in tag_names)
+    return features
+
+
+def minhash(features, num_perm):
+    """MinHash signature of ``features``: ``num_perm`` uint32 minima."""
+    if not features:
+        return np.full(num_perm, MAX_HASH, dtype=np.uint32)
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(f.encode(), digest_size=4).digest(), "big")
+            for f in features
+        ),
+        dtype=np.uint64,
+        count=len(features),
+    )
+    a, b = _permutations(num_perm)
+    permuted = (a[:, None] * hashes[None, :] + b[:, None]) % MERSENNE_PRIME
+    return (permuted & MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+def band_buckets(signature, bands):
+    """One bucket per band: a 63-bit hash of the band's rows and its number."""
+    if (signature == MAX_HASH).all():
+        return []
+    rows = len(signature) // bands
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                signature[band * rows : (band + 1) * rows].tobytes()
+                + band.to_bytes(2, "big"),
+                digest_size=8,
+            ).digest(),
+            "big",
+        )
+        >> 1
+        for band in range(bands)
+    ]
+
+
+def similarities(signature, candidates):
+    """Estimated Jaccard similarity of ``signature`` to each row of ``candidates``."""
+    return (candidates == signature).mean(axis=1)
+
+
+def top_neighbours(pkid, signature, candidate_pkids, candidate_signatures):
+    """The TOP_K most similar candidates above MIN_SCORE, as (pkid, score)."""
+    config = _config()
+    if not len(candidate_pkids):
+        return []
+    scores = similarities(signature, candidate_signatures)
+    order = np.argsort(-scores, kind="stable")
+    neighbours = []
+    for index in order:
+        if candidate_pkids[index] == pkid:
+            continue
+        score = float(scores[index])
+        if score < config["MIN_SCORE"] or len(neighbours) == config["TOP_K"]:
+            break
+        neighbours.append((int(candidate_pkids[index]), round(score, 4)))
+    return neighbours
+
+
+def _article_rows(queryset, chunk_size):
+    """(pkid, title, description, tag names) of ``queryset``, in pkid chunks."""
+    from .models import ArticleTagging
+
+    last_pkid = 0
+    while True:
+        chunk = list(
+            queryset.filter(pkid__gt=last_pkid)
+            .order_by("pkid")
+            .values_list("pkid", "title", "description")[:chunk_size]
+        )
+        if not chunk:
+            return
+        tags = defaultdict(list)
+        for article_pk, name in ArticleTagging.objects.filter(
+            article_id__in=[row[0] for row in chunk]
+        ).values_list("article_id", "tag__normalized_name"):
+            tags[article_pk].append(name)
+        yield [
+            (pkid, title, description, tags[pkid]) for pkid, title, description in chunk
+        ]
+        last_pkid = chunk[-1][0]
+
+
+def schedule_update(pkids):
+    """Queue update_related() for ``pkids`` once the transaction commits."""
+    from .tasks import update_related_articles
+
+    pkids = list(pkids)
+    if pkids and _config()["ENABLED"]:
+        transaction.on_commit(lambda: update_related_articles.delay(pkids))
+
+
+def _signature_chunk(rows):
+    num_perm = _config()["NUM_PERM"]
+    return [
+        (pkid, minhash(tokens(title, description, tag_names), num_perm))
+        for pkid, title, description, tag_names in rows
+    ]
+
+
+def _store_signatures(signed):
+    """Save signatures and replace the LSH buckets of the signed articles."""
+    from .models import ArticleLSHBucket, ArticleSignature
+
+    bands = _config()["BANDS"]
+    pkids = [pkid for pkid, _ in signed]
+    with transaction.atomic():
+        ArticleSignature.objects.bulk_create(
+            [
+                ArticleSignature(article_id=pkid, minhash=signature.tobytes())
+                for pkid, signature in signed
+            ],
+            update_conflicts=True,
+            unique_fields=["article"],
+            update_fields=["minhash", "updated_at"],
+        )
+        ArticleLSHBucket.objects.filter(article_id__in=pkids).delete()
+        ArticleLSHBucket.objects.bulk_create(
+            ArticleLSHBucket(article_id=pkid, band=band, bucket=bucket)
+            for pkid, signature in signed
+            for band, bucket in enumerate(band_buckets(signature, bands))
+        )
+
+
+def _store_neighbours(neighbours):
+    """Replace the related lists of the articles in ``neighbours``."""
+    from .models import RelatedArticle
+
+    with transaction.atomic():
+        RelatedArticle.objects.filter(article_id__in=list(neighbours)).delete()
+        RelatedArticle.objects.bulk_create(
+            RelatedArticle(article_id=pkid, related_id=related_pkid, score=score)
+            for pkid, related in neighbours.items()
+            for related_pkid, score in related
+        )
+
+
+def _load_signatures(pkids):
+    from .models import ArticleSignature
+
+    rows = list(
+        ArticleSignature.objects.filter(article_id__in=list(pkids)).values_list(
+            "article_id", "minhash"
+        )
+    )
+    num_perm = _config()["NUM_PERM"]
+    matrix = np.zeros((len(rows), num_perm), dtype=np.uint32)
+    for index, (_, minhash_bytes) in enumerate(rows):
+        matrix[index] = np.frombuffer(bytes(minhash_bytes), dtype=np.uint32)
+    return np.array([pkid for pkid, _ in rows], dtype=np.int64), matrix
+
+
+def _bucket_candidates(pkid, buckets):
+    """
+    Articles sharing a bucket with ``pkid``, chosen as build_related() does:
+    buckets larger than MAX_BUCKET_SIZE are skipped and the MAX_CANDIDATES
+    lowest pkids kept. Every bucket is read up to one row past the limit, so
+    a common bucket costs no more than an ordinary one.
+    """
+    from .models import ArticleLSHBucket
+
+    config = _config()
+    if not buckets:
+        return []
+    limit = config["MAX_BUCKET_SIZE"]
+    reads = [
+        ArticleLSHBucket.objects.filter(band=band, bucket=bucket)
+        .annotate(read_band=Value(band))
+        .values_list("read_band", "article_id")[: limit + 1]
+        for band, bucket in enumerate(buckets)
+    ]
+    members = defaultdict(list)
+    for band, article_pk in reads[0].union(*reads[1:], all=True):
+        members[band].append(article_pk)
+    candidates = set()
+    for bucket in members.values():
+        if len(bucket) <= limit:
+            candidates.update(bucket)
+    candidates.discard(pkid)
+    return sorted(candidates)[: config["MAX_CANDIDATES"]]
+
+
+def update_related(pkids):
+    """
+    Refresh the signatures and related lists of the articles ``pkids`` after
+    they changed, and fold them into the lists of their neighbours. LSH
+    buckets narrow the comparison to articles sharing a band, so the cost
+    depends on the neighbourhood rather than on the number of articles.
+    A neighbour that drops an updated article keeps a shorter list until
+    the next build_related_articles run.
+    """
+    from .models import Article, RelatedArticle
+
+    config = _config()
+    pkids = list(pkids)
+    signed = [
+        pair
+        for chunk in _article_rows(
+            Article.objects.filter(pk__in=pkids), max(len(pkids), 1)
+        )
+        for pair in _signature_chunk(chunk)
+    ]
+    if not signed:
+        return 0
+    _store_signatures(signed)
+
+    neighbours = {}
+    reverse = defaultdict(dict)
+    for pkid, signature in signed:
+        candidates = _bucket_candidates(pkid, band_buckets(signature, config["BANDS"]))
+        candidate_pkids, candidate_signatures = _load_signatures(candidates)
+        neighbours[pkid] = top_neighbours(
+            pkid, signature, candidate_pkids, candidate_signatures
+        )
+        scores = similarities(signature, candidate_signatures)
+        for candidate_pkid, score in zip(candidate_pkids, scores):
+            if score >= config["MIN_SCORE"]:
+                reverse[int(candidate_pkid)][pkid] = round(float(score), 4)
+
+    with transaction.atomic():
+        _store_neighbours(neighbours)
+        # The updated articles leave the lists they no longer belong to...
+        stale = Q()
+        for pkid, _ in signed:
+            keep = [
+                candidate for candidate, entries in reverse.items() if pkid in entries
+            ]
+            stale |= Q(related_id=pkid) & ~Q(article_id__in=keep)
+        RelatedArticle.objects.filter(stale).exclude(
+            article_id__in=list(neighbours)
+        ).delete()
+        # ...and enter or move up in those of their neighbours.
+        RelatedArticle.objects.bulk_create(
+            [
+                RelatedArticle(article_id=candidate, related_id=pkid, score=score)
+                for candidate, entries in reverse.items()
+                if candidate not in neighbours
+                for pkid, score in entries.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["article", "related"],
+            update_fields=["score"],
+        )
+        overflow = []
+        lists = defaultdict(list)
+        for entry_pk, article_pk, score in RelatedArticle.objects.filter(
+            article_id__in=list(reverse)
+        ).values_list("pk", "article_id", "score"):
+            lists[article_pk].append((score, entry_pk))
+        for entries in lists.values():
+            entries.sort(reverse=True)
+            overflow.extend(entry_pk for _, entry_pk in entries[config["TOP_K"] :])
+        RelatedArticle.objects.filter(pk__in=overflow).delete()
+    return len(signed)
+
+
+# Set in build worker processes by _init_neighbour_worker().
+_index = {}
+
+
+def _init_neighbour_worker(pkids, signatures, buckets, members):
+    _index.update(pkids=pkids, signatures=signatures, buckets=buckets, members=members)
+
+
+def _neighbour_chunk(positions):
+    config = _config()
+    pkids = _index["pkids"]
+    signatures = _index["signatures"]
+    results = {}
+    for position in positions:
+        candidates = set()
+        for key in _index["buckets"][position]:
+            bucket = _index["members"].get(key, ())
+            if len(bucket) <= config["MAX_BUCKET_SIZE"]:
+                candidates.update(bucket)
+        candidates.discard(position)
+        candidates = sorted(candidates)[: config["MAX_CANDIDATES"]]
+        results[int(pkids[position])] = top_neighbours(
+            pkids[position],
+            signatures[position],
+            pkids[candidates],
+            signatures[candidates],
+        )
+    return results
+
+
+def build_related(processes=None, chunk_size=1000, log=None):
+    """
+    Rebuild every signature, LSH bucket and related list. Signatures and
+    neighbour lists are computed by a pool of ``processes`` workers (all
+    cores by default) over chunks of articles; the workers never touch the
+    database, so only this process reads and writes. Buckets larger than
+    MAX_BUCKET_SIZE (a very common tag or word) are skipped when looking for
+    candidates. Returns the number of articles indexed.
+    """
+    from .models import Article
+
+    config = _config()
+    processes = processes or config["PROCESSES"] or os.cpu_count() or 1
+    log = log or logger.info
+    context = multiprocessing.get_context("fork")
+
+    def pool(**kwargs):
+        # Children must not inherit this process's database connections.
+        connections.close_all()
+        return context.Pool(processes, **kwargs)
+
+    all_pkids, all_signatures = [], []
+    chunks = _article_rows(Article.objects.all(), chunk_size)
+    if processes > 1:
+        with pool() as workers:
+            signed_chunks = workers.imap(_signature_chunk, chunks)
+            for signed in signed_chunks:
+                _store_signatures(signed)
+                all_pkids.extend(pkid for pkid, _ in signed)
+                all_signatures.extend(signature for _, signature in signed)
+                log(f"Signed {len(all_pkids)} articles")
+    else:
+        for chunk in chunks:
+            signed = _signature_chunk(chunk)
+            _store_signatures(signed)
+            all_pkids.extend(pkid for pkid, _ in signed)
+            all_signatures.extend(signature for _, signature in signed)
+            log(f"Signed {len(all_pkids)} articles")
+    if not all_pkids:
+        return 0
+
+    pkids = np.array(all_pkids, dtype=np.int64)
+    signatures = np.vstack(all_signatures)
+    buckets = []
+    members = defaultdict(list)
+    for position, signature in enumerate(signatures):
+        keys = list(enumerate(band_buckets(signature, config["BANDS"])))
+        buckets.append(keys)
+        for key in keys:
+            members[key].append(position)
+    members = dict(members)
+
+    positions = range(len(pkids))
+    position_chunks = [
+        positions[start : start + chunk_size]
+        for start in range(0, len(pkids), chunk_size)
+    ]
+    done = 0
+    if processes > 1:
+        with pool(
+            initializer=_init_neighbour_worker,
+            initargs=(pkids, signatures, buckets, members),
+        ) as workers:
+            results = workers.imap_unordered(_neighbour_chunk, position_chunks)
+            for neighbours in results:
+                _store_neighbours(neighbours)
+                done += len(neighbours)
+                log(f"Related lists for {done} articles")
+    else:
+        _init_neighbour_worker(pkids, signatures, buckets, members)
+        for chunk in position_chunks:
+            neighbours = _neighbour_chunk(chunk)
+            _store_neighbours(neighbours)
+            done += len(neighbours)
+            log(f"Related lists for {done} articles")
+    return len(pkids)
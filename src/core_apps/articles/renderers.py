@@ -1,34 +1,9 @@
-import json
-from rest_framework.renderers import JSONRenderer
+from core_apps.common.renderers import ORJSONRenderer
 
-class ArticleJSONRenderer(JSONRenderer):
-    charset = "utf-8"
 
-    def render(self, data, accepted_media_type=None, renderer_context=None):
-        if renderer_context is None:
-            status_code = 200
-        else:
-            status_code = renderer_context["response"].status_code
+class ArticleJSONRenderer(ORJSONRenderer):
+    pass
 
-        if data is not None:
-            errors = data.get("errors", None)
-        else:
-            errors = None
 
-        if errors is not None:
-            return super(ArticleJSONRenderer, self).render(data)
-        return json.dumps(data)
-
-
-class ArticlesJSONRenderer(JSONRenderer):
-    charset = "utf-8"
-
-    def render(self, data, accepted_media_type=None, renderer_context=None):
-        status_code = renderer_context["response"].status_code
-
-        errors = data.get("errors", None)
-
-        if errors is not None:
-            return super(ArticlesJSONRenderer, self).render(data)
-
-        return json.dumps(data)
\ No newline at end of file
+class ArticlesJSONRenderer(ORJSONRenderer):
+    pass
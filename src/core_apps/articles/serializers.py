@@ -1,8 +1,8 @@
 from rest_framework import serializers
 
-from core_apps.articles.models import Article, ArticleView, Clap
-from core_apps.bookmarks.models import Bookmark
+from core_apps.articles.models import Article, ArticleTag, Clap
 from core_apps.bookmarks.serializers import BookmarkSerializer
+from core_apps.common.serializers import DynamicFieldsMixin, ImageDerivativesField
 from core_apps.profiles.serializers import ProfileSerializer
 from core_apps.responses.serializers import ResponseSerializer
 
@@ -18,39 +18,44 @@ class TagListField(serializers.Field):
             raise serializers.ValidationError("Expected a list of tags or a comma-separated string")
 
         return data
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     author_info = ProfileSerializer(source="author.profile", read_only=True)
     banner_image = serializers.SerializerMethodField()
+    banner_image_derivatives = ImageDerivativesField("banner_image")
     estimated_reading_time = serializers.ReadOnlyField()
     tags = TagListField()
     views = serializers.SerializerMethodField()
     average_rating = serializers.ReadOnlyField()
     bookmarks = serializers.SerializerMethodField()
-    bookmarks_count = serializers.SerializerMethodField()
-    claps_count = serializers.SerializerMethodField()
+    bookmarks_count = serializers.IntegerField(source="bookmark_count", read_only=True)
+    claps_count = serializers.IntegerField(source="clap_count", read_only=True)
     responses = ResponseSerializer(many=True, read_only=True)
-    responses_count = serializers.IntegerField(source="responses.count", read_only=True)
+    responses_count = serializers.IntegerField(source="response_count", read_only=True)
     created_at = serializers.SerializerMethodField()
     updated_at = serializers.SerializerMethodField()
 
-    def get_responses_count(self, obj):
-        return obj.responses.count()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Present when the list was filtered with ?search= (and ?headline=true),
+        # and on the trending and related lists.
+        for annotation in (
+            "search_rank",
+            "headline",
+            "trending_score",
+            "related_score",
+        ):
+            if hasattr(instance, annotation):
+                data[annotation] = getattr(instance, annotation)
+        return data
 
-    def get_claps_count(self, obj):
-        return obj.claps.count()
+    def get_views(self, obj):
+        # Views fetch the estimates in bulk (see estimate_views()); without
+        # one the last synced count is used.
+        estimates = self.context.get("view_estimates", {})
+        return estimates.get(obj.pkid, obj.view_count)
 
     def get_bookmarks(self, obj):
-        bookmarks = Bookmark.objects.filter(article=obj)
-        return BookmarkSerializer(bookmarks, many=True).data
-
-    def get_bookmarks_count(self, obj):
-        return Bookmark.objects.filter(article=obj).count()
-
-    def get_average_rating(self, obj):
-        return obj.average_rating()
-
-    def get_views(self, obj):
-        return ArticleView.objects.filter(article=obj).count()
+        return BookmarkSerializer(obj.bookmarks.all(), many=True).data
 
     def get_banner_image(self, obj):
         return obj.banner_image.url
@@ -68,7 +73,7 @@ class ArticleSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         tags = validated_data.pop("tags", []) 
         article = Article.objects.create(**validated_data)
-        article.tags.set(tags)
+        article.set_tags(tags)
         return article
 
     def update(self, instance, validated_data):
@@ -82,7 +87,7 @@ class ArticleSerializer(serializers.ModelSerializer):
         instance.updated_at = validated_data.get("updated_at", instance.updated_at)
 
         if "tags" in validated_data:
-            instance.tags.set(validated_data["tags"])
+            instance.set_tags(validated_data["tags"])
 
         instance.save()
         return instance
@@ -100,6 +105,7 @@ class ArticleSerializer(serializers.ModelSerializer):
             "description",
             "body",
             "banner_image",
+            "banner_image_derivatives",
             "average_rating",
             "bookmarks_count",
             "claps_count",
@@ -111,6 +117,42 @@ class ArticleSerializer(serializers.ModelSerializer):
         ]
 
 
+class ArticleListSerializer(ArticleSerializer):
+    """
+    List representation: the body and the nested responses and bookmarks are
+    only included on ?expand=, the counts are always there.
+    """
+
+    class Meta(ArticleSerializer.Meta):
+        expandable_fields = ["body", "responses", "bookmarks"]
+
+
+class ArticleImportSerializer(serializers.Serializer):
+    """
+    One record of a bulk import. Validation is kept free of queries; authors,
+    slugs and tags are resolved per chunk by ArticleImporter.
+    """
+
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(max_length=255)
+    body = serializers.CharField(trim_whitespace=False)
+    tags = TagListField(required=False)
+    author = serializers.EmailField(required=False)
+
+    def validate_tags(self, value):
+        # One spelling per tag; "Django" and "django" are the same tag.
+        tags = {}
+        for tag in value:
+            tag = " ".join(str(tag).split())
+            tags.setdefault(ArticleTag.normalize(tag), tag)
+        tags = list(tags.values())
+        if any(not tag or len(tag) > 100 for tag in tags):
+            raise serializers.ValidationError(
+                "Tags must be between 1 and 100 characters long."
+            )
+        return tags
+
+
 class ClapSerializer(serializers.ModelSerializer):
     article_title = serializers.CharField(source="article.title", read_only=True)
     user_first_name = serializers.CharField(source="user.first_name", read_only=True)
@@ -0,0 +1,132 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from core_apps.articles import feed, related
+from core_apps.articles.models import Article, Clap
+from core_apps.profiles.models import Profile
+
+# User fields rendered in author_info.
+AUTHOR_USER_FIELDS = {"first_name", "last_name", "email"}
+
+COUNTER_SENDERS = {
+    Clap: "clap_count",
+    "bookmarks.Bookmark": "bookmark_count",
+    "responses.Response": "response_count",
+}
+
+
+def _deleting_articles(origin):
+    # Rows cascading from a deleted article need no counter updates; skipping
+    # them saves one UPDATE per row against an article that is going away.
+    return isinstance(origin, Article) or (
+        isinstance(origin, QuerySet) and origin.model is Article
+    )
+
+
+def _connect_counter(sender, counter):
+    def increment(sender, instance, created, **kwargs):
+        if created:
+            Article.objects.adjust_counters(instance.article_id, **{counter: 1})
+
+    def decrement(sender, instance, origin=None, **kwargs):
+        if _deleting_articles(origin):
+            return
+        Article.objects.adjust_counters(instance.article_id, **{counter: -1})
+
+    post_save.connect(increment, sender=sender, weak=False)
+    post_delete.connect(decrement, sender=sender, weak=False)
+
+
+for sender, counter in COUNTER_SENDERS.items():
+    _connect_counter(sender, counter)
+
+
+@receiver(post_save, sender="ratings.Rating")
+def add_rating_to_article(sender, instance, created, **kwargs):
+    if created:
+        Article.objects.adjust_counters(
+            instance.article_id, rating_sum=instance.rating, rating_count=1
+        )
+        return
+    # Rating.from_db() remembers the stored value, so a changed rating moves
+    # rating_sum by the difference; an edited review only needs a touch.
+    delta = instance.rating - instance.loaded_rating
+    if delta:
+        Article.objects.adjust_counters(instance.article_id, rating_sum=delta)
+    else:
+        Article.objects.filter(pk=instance.article_id).touch()
+
+
+@receiver(post_delete, sender="ratings.Rating")
+def remove_rating_from_article(sender, instance, origin=None, **kwargs):
+    if _deleting_articles(origin):
+        return
+    Article.objects.adjust_counters(
+        instance.article_id, rating_sum=-instance.rating, rating_count=-1
+    )
+
+
+# Article.set_tags() and the importer refresh these themselves; this covers
+# article.tags.add()/remove()/clear().
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_derived_fields_on_tag_change(sender, instance, action, reverse, **kwargs):
+    if not reverse and action in ("post_add", "post_remove", "post_clear"):
+        instance.update_reading_time()
+        instance.update_search_vector()
+        related.schedule_update([instance.pk])
+
+
+@receiver(post_save, sender=Article)
+def fan_out_new_article(sender, instance, created, **kwargs):
+    if created:
+        feed.schedule_fan_out([instance.pk])
+
+
+# profile.follow(other) adds ``other`` to profile.followers; either side of
+# the relation may be edited, so pairs are normalised to (follower, author).
+@receiver(m2m_changed, sender=Profile.followers.through)
+def update_feeds_on_follow(sender, instance, action, reverse, pk_set, **kwargs):
+    from core_apps.articles.tasks import update_feed_on_follow
+
+    if action not in ("post_add", "post_remove") or not pk_set:
+        return
+    user_ids = Profile.objects.filter(pkid__in=pk_set).values_list("user_id", flat=True)
+    pairs = [
+        (user_id, instance.user_id) if reverse else (instance.user_id, user_id)
+        for user_id in user_ids
+    ]
+    followed = action == "post_add"
+
+    def queue():
+        for follower_id, author_id in pairs:
+            update_feed_on_follow.delay(follower_id, author_id, followed)
+
+    transaction.on_commit(queue)
+
+
+# Creations and deletions of claps, bookmarks, responses and ratings, and
+# rating edits, already bump Article.cache_version through adjust_counters()
+# or add_rating_to_article(); these cover the rest.
+@receiver(post_save, sender="responses.Response")
+def touch_article_on_edit(sender, instance, created, **kwargs):
+    if not created:
+        Article.objects.filter(pk=instance.article_id).touch()
+
+
+# author_info renders the author's profile and user fields.
+@receiver(post_save, sender="profiles.Profile")
+def touch_articles_on_profile_change(sender, instance, **kwargs):
+    Article.objects.filter(author_id=instance.user_id).touch()
+
+
+@receiver(post_save, sender=get_user_model())
+def touch_articles_on_user_change(sender, instance, created, update_fields, **kwargs):
+    # Skips saves that only write other columns, such as last_login.
+    if created or (
+        update_fields is not None and not update_fields & AUTHOR_USER_FIELDS
+    ):
+        return
+    Article.objects.filter(author=instance).touch()
@@ -0,0 +1,49 @@
+from celery import shared_task
+from django.conf import settings
+
+from .feed import fan_out, follow_changed, trim_timelines
+from .related import update_related
+from .trending import update_trending
+from .view_buffer import flush_views
+from .viewers import sync_view_counts
+
+
+@shared_task
+def flush_article_views():
+    batch_size = settings.ARTICLE_VIEW_BUFFER["FLUSH_BATCH_SIZE"]
+    flushed = 0
+    while True:
+        drained = flush_views(batch_size=batch_size)
+        flushed += drained
+        if drained < batch_size:
+            return flushed
+
+
+@shared_task
+def sync_article_view_counts():
+    return sync_view_counts()
+
+
+@shared_task
+def update_trending_articles():
+    return update_trending()
+
+
+@shared_task
+def update_related_articles(pkids):
+    return update_related(pkids)
+
+
+@shared_task
+def fan_out_articles(pkids):
+    return sum(fan_out(pkid) for pkid in pkids)
+
+
+@shared_task
+def update_feed_on_follow(follower_id, author_id, followed):
+    return follow_changed(follower_id, author_id, followed)
+
+
+@shared_task
+def trim_article_feeds():
+    return trim_timelines()
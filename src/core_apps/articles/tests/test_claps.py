@@ -0,0 +1,92 @@
+import uuid
+
+import pytest
+
+from core_apps.articles.models import Article, Clap
+
+
+def _counters(article):
+    return Article.objects.values_list(
+        "clap_count", "cache_version", "counters_changed_at"
+    ).get(pk=article.pk)
+
+
+@pytest.mark.django_db
+def test_add_claps_once_and_moves_the_counters(article_factory, user_factory):
+    article, user = article_factory(), user_factory()
+    _, version, _ = _counters(article)
+
+    assert Clap.objects.add(user, article.id) == (True, 1)
+
+    clap_count, new_version, changed_at = _counters(article)
+    assert clap_count == 1
+    assert new_version == version + 1
+    assert changed_at is not None
+    assert Clap.objects.filter(user=user, article=article).count() == 1
+
+
+@pytest.mark.django_db
+def test_repeated_add_changes_nothing(article_factory, user_factory):
+    article, user = article_factory(), user_factory()
+    Clap.objects.add(user, article.id)
+    counters = _counters(article)
+
+    assert Clap.objects.add(user, article.id) == (False, 1)
+
+    assert _counters(article) == counters
+    assert Clap.objects.filter(article=article).count() == 1
+
+
+@pytest.mark.django_db
+def test_claps_from_different_users_add_up(article_factory, user_factory):
+    article = article_factory()
+    Clap.objects.add(user_factory(), article.id)
+
+    assert Clap.objects.add(user_factory(), article.id) == (True, 2)
+
+
+@pytest.mark.django_db
+def test_remove_takes_the_clap_back(article_factory, user_factory):
+    article, user, other = article_factory(), user_factory(), user_factory()
+    Clap.objects.add(user, article.id)
+    Clap.objects.add(other, article.id)
+    _, version, _ = _counters(article)
+
+    assert Clap.objects.remove(user, article.id) == (True, 1)
+
+    clap_count, new_version, _ = _counters(article)
+    assert (clap_count, new_version) == (1, version + 1)
+    assert list(Clap.objects.values_list("user", flat=True)) == [other.pk]
+
+
+@pytest.mark.django_db
+def test_remove_without_a_clap_changes_nothing(article_factory, user_factory):
+    article, user = article_factory(), user_factory()
+    counters = _counters(article)
+
+    assert Clap.objects.remove(user, article.id) == (False, 0)
+
+    assert _counters(article) == counters
+
+
+@pytest.mark.django_db
+def test_unknown_article_returns_none(user_factory):
+    user = user_factory()
+
+    assert Clap.objects.add(user, uuid.uuid4()) is None
+    assert Clap.objects.remove(user, uuid.uuid4()) is None
+    assert not Clap.objects.exists()
+
+
+@pytest.mark.django_db
+def test_statuses_reports_the_users_claps(article_factory, user_factory):
+    clapped, other, user = article_factory(), article_factory(), user_factory()
+    Clap.objects.add(user, clapped.id)
+    Clap.objects.add(user_factory(), other.id)
+
+    statuses = Clap.objects.statuses(user, [clapped.id, other.id, uuid.uuid4()])
+
+    assert statuses == {
+        clapped.id: {"clapped": True, "clap_count": 1},
+        other.id: {"clapped": False, "clap_count": 1},
+    }
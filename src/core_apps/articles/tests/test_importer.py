@@ -0,0 +1,108 @@
+import json
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError
+
+from core_apps.articles.importer import (
+    SLUG_CONFLICT_RETRIES,
+    ArticleImporter,
+    iter_ndjson,
+)
+from core_apps.articles.models import Article
+
+
+def _record(title, **extra):
+    return {"title": title, "description": "About it", "body": "Some words.", **extra}
+
+
+def _write_ndjson(path, lines):
+    path.write_text("".join(f"{line}\n" for line in lines))
+
+
+@pytest.mark.django_db
+def test_slug_taken_concurrently_retries_the_chunk(
+    user_factory, article_factory, caplog
+):
+    author = user_factory()
+    article_factory(title="Hello", author=author)
+    importer = ArticleImporter(author=author, collect=True, record_authors=False)
+    # A stale allocator: "hello" counts as read but was written since.
+    importer.slugs.loaded.add("hello")
+
+    result = importer.run([(1, _record("Hello")), (2, _record("Hello"))])
+
+    assert "Slug conflict" in caplog.text
+    assert result.created == 2
+    assert [article["slug"] for article in result.articles] == ["hello-2", "hello-3"]
+    assert Article.objects.filter(slug__startswith="hello").count() == 3
+
+
+@pytest.mark.django_db
+def test_slug_conflict_is_raised_once_retries_run_out(user_factory):
+    importer = ArticleImporter(author=user_factory(), record_authors=False)
+    with mock.patch.object(
+        Article.objects, "bulk_create", side_effect=IntegrityError
+    ) as bulk_create:
+        with pytest.raises(IntegrityError):
+            importer.run([(1, _record("Hello"))])
+
+    assert bulk_create.call_count == SLUG_CONFLICT_RETRIES
+    assert importer.result.created == 0
+    assert not Article.objects.exists()
+
+
+@pytest.mark.django_db
+def test_progress_is_reported_after_each_committed_chunk(user_factory):
+    author = user_factory()
+    records = [(1, _record("One")), (2, "Invalid JSON"), (3, _record("Three"))]
+    records += [(4, _record("Four", author="nobody@example.com"))]
+    reports = []
+
+    def progress(result):
+        reports.append((result.last_position, result.created, result.failed))
+
+    ArticleImporter(author=author, chunk_size=2, progress=progress).run(records)
+
+    assert reports == [(2, 1, 1), (4, 2, 2)]
+
+
+@pytest.mark.django_db
+def test_command_resumes_after_its_checkpoint(tmp_path, user_factory):
+    author = user_factory()
+    source = tmp_path / "articles.ndjson"
+    checkpoint = tmp_path / "checkpoint"
+    lines = [json.dumps(_record(f"Article {n}")) for n in range(1, 4)]
+    _write_ndjson(source, lines)
+    options = {
+        "author": author.email,
+        "chunk_size": 2,
+        "checkpoint": str(checkpoint),
+        "stdout": StringIO(),
+    }
+
+    call_command("import_articles", str(source), **options)
+    assert checkpoint.read_text() == "3\n"
+
+    _write_ndjson(source, lines + [json.dumps(_record("Article 4"))])
+    call_command("import_articles", str(source), **options)
+
+    assert checkpoint.read_text() == "4\n"
+    assert sorted(Article.objects.values_list("title", flat=True)) == [
+        "Article 1",
+        "Article 2",
+        "Article 3",
+        "Article 4",
+    ]
+
+
+def test_iter_ndjson_skips_to_the_resume_point():
+    lines = ['{"title": "a"}', "", "not json", '{"title": "b"}']
+
+    records = list(iter_ndjson(lines, start_after=1))
+
+    assert records[0][0] == 3
+    assert records[0][1].startswith("Invalid JSON")
+    assert records[1] == (4, {"title": "b"})
@@ -0,0 +1,109 @@
+"""
+Throughput of the reading-time estimate on a synthetic corpus of short, long
+and 1 MB bodies. Run with ``pytest core_apps/articles/tests/test_read_time_benchmark.py``;
+pytest-benchmark reports each corpus as its own group.
+"""
+import random
+import string
+from math import ceil
+from types import SimpleNamespace
+
+import pytest
+
+from core_apps.articles.read_time_engine import ArticleReadTimeEngine
+
+# Words per body and articles per corpus.
+CORPORA = {
+    "short": (60, 200),
+    "long": (5_000, 50),
+    "1mb": (170_000, 2),
+}
+
+
+class _TagCount:
+    def __init__(self, count):
+        self._count = count
+
+    def count(self):
+        return self._count
+
+
+def _synthetic_articles(size, number, seed=42):
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choices(string.ascii_letters, k=rng.randint(1, 10)))
+        for _ in range(5_000)
+    ]
+    return [
+        SimpleNamespace(
+            title=" ".join(rng.choices(words, k=8)),
+            description=" ".join(rng.choices(words, k=25)),
+            body=" ".join(rng.choices(words, k=size)),
+            banner_image="/profile_default.png" if rng.random() < 0.5 else "",
+            tags=_TagCount(rng.randint(0, 6)),
+        )
+        for _ in range(number)
+    ]
+
+
+def _baseline_estimate_reading_time(
+    article, words_per_minute=250, seconds_per_image=10, seconds_per_tag=2
+):
+    # Verbatim copy of ArticleReadTimeEngine.estimate_reading_time before
+    # word counts were stored, so the comparison does not drift with the engine.
+    word_count_body = ArticleReadTimeEngine.word_count(article.body)
+    word_count_title = ArticleReadTimeEngine.word_count(article.title)
+    word_count_description = ArticleReadTimeEngine.word_count(article.description)
+
+    total_word_count = word_count_body + word_count_title + word_count_description
+
+    reading_time = total_word_count / words_per_minute
+
+    if article.banner_image:
+        reading_time += seconds_per_image / 60
+
+    tag_count = article.tags.count()
+    reading_time += (tag_count * seconds_per_tag) / 60
+
+    reading_time = ceil(reading_time)
+
+    return reading_time
+
+
+def _baseline(articles):
+    return [_baseline_estimate_reading_time(article) for article in articles]
+
+
+def _estimate_reading_time(articles):
+    return [ArticleReadTimeEngine.estimate_reading_time(a) for a in articles]
+
+
+def _supplied_tag_counts(articles):
+    # The path of the importer and backfill_reading_time, which know the tag
+    # counts up front.
+    return [
+        ArticleReadTimeEngine.reading_time(
+            ArticleReadTimeEngine.article_word_count(article),
+            bool(article.banner_image),
+            article.tags.count(),
+        )
+        for article in articles
+    ]
+
+
+@pytest.fixture(scope="module", params=list(CORPORA))
+def corpus(request):
+    size, number = CORPORA[request.param]
+    return request.param, _synthetic_articles(size, number)
+
+
+@pytest.mark.parametrize(
+    "candidate", [_baseline, _estimate_reading_time, _supplied_tag_counts]
+)
+def test_reading_time_throughput(benchmark, corpus, candidate):
+    name, articles = corpus
+    benchmark.group = name
+    benchmark.extra_info["articles"] = len(articles)
+    benchmark.extra_info["megabytes"] = sum(len(a.body) for a in articles) / 1e6
+
+    assert benchmark(candidate, articles) == _baseline(articles)
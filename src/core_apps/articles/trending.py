@@ -0,0 +1,170 @@
+import logging
+import math
+from datetime import timedelta
+from itertools import islice
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Start time of the last completed update_trending() run.
+WATERMARK_KEY = "articles:trending:watermark"
+
+# Article counter -> key of its weight in ARTICLE_TRENDING["WEIGHTS"].
+TRENDING_COUNTERS = {
+    "view_count": "views",
+    "clap_count": "claps",
+    "rating_count": "ratings",
+    "response_count": "responses",
+}
+
+
+def decay_rate():
+    return math.log(2) / settings.ARTICLE_TRENDING["HALF_LIFE"]
+
+
+def decayed_score(log_score, now=None):
+    """
+    The trending score of a stored ``log_score`` at ``now``: the weighted
+    activity of the article, every event discounted by its age.
+    """
+    if log_score is None:
+        return 0.0
+    now = now or timezone.now()
+    return math.exp(log_score - decay_rate() * now.timestamp())
+
+
+def _log_add(a, b):
+    if a is None:
+        return b
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+def _counter_changed(counter):
+    snapshot = F(f"trending__{counter}")
+    return Q(**{f"{counter}__gt": snapshot}) | Q(**{f"{counter}__lt": snapshot})
+
+
+def _changed_since(cutoff):
+    """
+    Where the next run starts reading Article.counters_changed_at: the start
+    of the last run minus WATERMARK_OVERLAP, for counter changes committed
+    while it ran. Without a watermark, the whole window is read.
+    """
+    try:
+        watermark = cache.get(WATERMARK_KEY)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read the trending watermark: {e}")
+        watermark = None
+    if watermark is None:
+        return cutoff
+    overlap = timedelta(seconds=settings.ARTICLE_TRENDING["WATERMARK_OVERLAP"])
+    return watermark - overlap
+
+
+def update_trending(batch_size=1000, now=None):
+    """
+    Fold the activity since the last run into the TrendingArticle ranking.
+
+    New views, claps, ratings and responses are the growth of the article
+    counters over the snapshot stored with each row. Only articles whose
+    counters_changed_at is past the last run are read, off its index and
+    without touching the child tables; re-reading an article is harmless,
+    as its snapshot already matches its counters. Scores use
+    forward decay: an event of weight w at time t adds w * e^(λt) to the
+    score, which is stored as its logarithm. Every score shrinks by the same
+    factor over time, so the order holds without rewriting rows of inactive
+    articles, and ``decayed_score()`` recovers the current value.
+
+    Articles seen for the first time count their existing activity as of
+    their creation if that lies within the window; older ones start from a
+    snapshot with no score. Returns the number of rows written.
+    """
+    from .models import Article, TrendingArticle
+
+    config = settings.ARTICLE_TRENDING
+    started_at = timezone.now()
+    now = now or started_at
+    rate = decay_rate()
+    cutoff = now - timedelta(seconds=config["WINDOW"])
+    weights = {
+        counter: config["WEIGHTS"][key] for counter, key in TRENDING_COUNTERS.items()
+    }
+
+    unseen = Q(trending__isnull=True) & Q(
+        *(Q(**{f"{counter}__gt": 0}) for counter in TRENDING_COUNTERS),
+        _connector=Q.OR,
+    )
+    changed = Q(
+        *(_counter_changed(counter) for counter in TRENDING_COUNTERS),
+        _connector=Q.OR,
+    )
+    rows = (
+        Article.objects.filter(counters_changed_at__gte=_changed_since(cutoff))
+        .filter(unseen | changed)
+        .order_by()
+        .values_list(
+            "pkid",
+            "created_at",
+            "trending__score",
+            "trending__last_activity_at",
+            *TRENDING_COUNTERS,
+            *(f"trending__{counter}" for counter in TRENDING_COUNTERS),
+        )
+        .iterator(chunk_size=batch_size)
+    )
+
+    counters = list(TRENDING_COUNTERS)
+    written = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        entries = []
+        for pkid, created_at, score, last_activity_at, *values in batch:
+            current = values[: len(counters)]
+            snapshot = values[len(counters) :]
+            if snapshot[0] is None:
+                # First sighting: the snapshot of this row is empty.
+                if created_at < cutoff:
+                    snapshot = current
+                else:
+                    snapshot = [0] * len(counters)
+                event_time = created_at
+            else:
+                event_time = now
+            increment = sum(
+                weights[counter] * max(value - seen, 0)
+                for counter, value, seen in zip(counters, current, snapshot)
+            )
+            if increment > 0:
+                score = _log_add(
+                    score, math.log(increment) + rate * event_time.timestamp()
+                )
+                last_activity_at = now
+            entries.append(
+                TrendingArticle(
+                    article_id=pkid,
+                    score=score,
+                    last_activity_at=last_activity_at,
+                    **dict(zip(counters, current)),
+                )
+            )
+        TrendingArticle.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["article"],
+            update_fields=["score", "last_activity_at", *counters, "updated_at"],
+        )
+        written += len(entries)
+
+    try:
+        cache.set(WATERMARK_KEY, started_at, None)
+    except redis.RedisError as e:
+        logger.warning(f"Could not store the trending watermark: {e}")
+    return written
@@ -2,17 +2,33 @@ from django.urls import path
 from .views import (
     ArticleListCreateView,
     ArticleRetrieveUpdateDestroyView,
+    ArticleSuggestView,
     ClapArticleView,
+    ClapStatusView,
     ArticleBulkDeleteView,
+    ArticleBulkCreateView,
+    TrendingArticleListView,
+    RelatedArticleListView,
+    ArticleFeedView,
 )
 
 urlpatterns = [
     path("", ArticleListCreateView.as_view(), name="article-list-create"),
+    path("suggest/", ArticleSuggestView.as_view(), name="article-suggest"),
+    path("trending/", TrendingArticleListView.as_view(), name="article-trending"),
+    path("feed/", ArticleFeedView.as_view(), name="article-feed"),
+    path("claps/status/", ClapStatusView.as_view(), name="clap-status"),
     path(
         "<uuid:id>/",
         ArticleRetrieveUpdateDestroyView.as_view(),
         name="article-retrieve-update-destroy",
     ),
+    path(
+        "<uuid:id>/related/",
+        RelatedArticleListView.as_view(),
+        name="article-related",
+    ),
     path("<uuid:article_id>/clap/", ClapArticleView.as_view(), name="clap-article"),
+    path("bulk-create/", ArticleBulkCreateView.as_view(), name="article-bulk-create"),
     path("bulk-delete/", ArticleBulkDeleteView.as_view(), name="article-bulk-delete"), 
 ]
\ No newline at end of file
@@ -0,0 +1,191 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+
+import redis
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+User = get_user_model()
+
+logger = logging.getLogger(__name__)
+
+
+class RedisViewBuffer:
+    """Article views queued in a Redis list shared by every web and worker process."""
+
+    shared = True
+
+    def __init__(self, url, key):
+        self.client = redis.Redis.from_url(url)
+        self.key = key
+
+    def push(self, entry):
+        self.client.rpush(self.key, json.dumps(entry))
+
+    def drain(self, limit):
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.lrange(self.key, 0, limit - 1)
+        pipeline.ltrim(self.key, limit, -1)
+        entries, _ = pipeline.execute()
+        return [json.loads(entry) for entry in entries]
+
+    def requeue(self, entries):
+        self.client.lpush(self.key, *[json.dumps(entry) for entry in reversed(entries)])
+
+    def __len__(self):
+        return self.client.llen(self.key)
+
+
+class LocalViewBuffer:
+    """
+    In-process fallback used when Redis is unreachable. Nothing outside the
+    current process can drain it, so the owning process flushes it itself.
+    """
+
+    shared = False
+
+    def __init__(self):
+        self.entries = deque()
+        self.lock = threading.Lock()
+        self.last_flush = time.monotonic()
+
+    def push(self, entry):
+        self.entries.append(entry)
+
+    def drain(self, limit):
+        with self.lock:
+            batch = []
+            while self.entries and len(batch) < limit:
+                batch.append(self.entries.popleft())
+            self.last_flush = time.monotonic()
+            return batch
+
+    def requeue(self, entries):
+        with self.lock:
+            self.entries.extendleft(reversed(entries))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def is_due(self, batch_size, interval):
+        return (
+            len(self.entries) >= batch_size
+            or time.monotonic() - self.last_flush >= interval
+        )
+
+
+_redis_buffer = None
+_local_buffer = LocalViewBuffer()
+_redis_retry_at = 0.0
+
+
+def redis_unavailable(e):
+    """
+    Buffer in-process for REDIS_RETRY_INTERVAL seconds before trying Redis
+    again; the process flushes its own views meanwhile.
+    """
+    global _redis_retry_at
+
+    logger.warning(f"Redis view buffer unavailable, buffering in-process: {e}")
+    _redis_retry_at = (
+        time.monotonic() + settings.ARTICLE_VIEW_BUFFER["REDIS_RETRY_INTERVAL"]
+    )
+
+
+def get_view_buffer():
+    global _redis_buffer
+
+    if time.monotonic() < _redis_retry_at:
+        return _local_buffer
+    if _redis_buffer is None:
+        config = settings.ARTICLE_VIEW_BUFFER
+        try:
+            buffer = RedisViewBuffer(config["REDIS_URL"], config["KEY"])
+            buffer.client.ping()
+        except redis.RedisError as e:
+            redis_unavailable(e)
+            return _local_buffer
+        _redis_buffer = buffer
+    return _redis_buffer
+
+
+def buffer_view(article, user, viewer_ip):
+    config = settings.ARTICLE_VIEW_BUFFER
+    entry = {
+        "article": article.pkid,
+        "user": user.pkid if user and user.is_authenticated else None,
+        "viewer_ip": viewer_ip,
+    }
+
+    try:
+        get_view_buffer().push(entry)
+    except redis.RedisError as e:
+        redis_unavailable(e)
+        _local_buffer.push(entry)
+
+    # In-process views are flushed from here, also once Redis is back.
+    if len(_local_buffer) and _local_buffer.is_due(
+        config["FLUSH_BATCH_SIZE"], config["FLUSH_INTERVAL"]
+    ):
+        flush_views(_local_buffer)
+
+
+def flush_views(buffer=None, batch_size=None):
+    """
+    Drain up to ``batch_size`` buffered views and insert them in one
+    statement. Duplicates of existing (article, user, viewer_ip) rows are
+    skipped by the database.
+    """
+    from .models import Article, ArticleView
+
+    buffer = buffer or get_view_buffer()
+    batch_size = batch_size or settings.ARTICLE_VIEW_BUFFER["FLUSH_BATCH_SIZE"]
+    entries = buffer.drain(batch_size)
+    if not entries:
+        return 0
+
+    # Drained entries are put back when the insert fails, so a database
+    # error does not lose them.
+    try:
+        with transaction.atomic():
+            # Rows deleted since the view was buffered would fail the foreign keys.
+            article_ids = set(
+                Article.objects.filter(
+                    pkid__in={entry["article"] for entry in entries}
+                ).values_list("pkid", flat=True)
+            )
+            user_ids = set(
+                User.objects.filter(
+                    pkid__in={entry["user"] for entry in entries if entry["user"]}
+                ).values_list("pkid", flat=True)
+            )
+            unique_views = {
+                (
+                    entry["article"],
+                    entry["user"] if entry["user"] in user_ids else None,
+                    entry["viewer_ip"],
+                )
+                for entry in entries
+                if entry["article"] in article_ids
+            }
+            ArticleView.objects.bulk_create(
+                [
+                    ArticleView(
+                        article_id=article_id, user_id=user_id, viewer_ip=viewer_ip
+                    )
+                    for article_id, user_id, viewer_ip in unique_views
+                ],
+                ignore_conflicts=True,
+            )
+    except Exception:
+        try:
+            buffer.requeue(entries)
+        except redis.RedisError as e:
+            redis_unavailable(e)
+            _local_buffer.requeue(entries)
+        raise
+    return len(entries)
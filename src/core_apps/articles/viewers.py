@@ -0,0 +1,330 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+from django.conf import settings
+from django.db.models import Case, F, PositiveIntegerField, Value, When
+from django.db.models.functions import Greatest, Now
+
+logger = logging.getLogger(__name__)
+
+
+def _hash64(value):
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def _bloom_positions(item, size, hash_count):
+    digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [(h1 + i * h2) % size for i in range(hash_count)]
+
+
+def bloom_parameters(capacity, error_rate):
+    """Bit-array size and hash count for a Bloom filter holding ``capacity`` items."""
+    size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+    hash_count = max(1, round(size / capacity * math.log(2)))
+    return size, hash_count
+
+
+class HyperLogLog:
+    """Pure-Python HyperLogLog with the same 2^14 registers Redis uses (~0.81% error)."""
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+        self.alpha = 0.7213 / (1 + 1.079 / self.size)
+
+    def add(self, value):
+        x = _hash64(value)
+        index = x >> (64 - self.precision)
+        remainder = x & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        estimate = (
+            self.alpha
+            * self.size
+            * self.size
+            / sum(2.0**-register for register in self.registers)
+        )
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            estimate = self.size * math.log(self.size / zeros)
+        return round(estimate)
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        self.size, self.hash_count = bloom_parameters(capacity, error_rate)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, item):
+        """Set ``item`` and return whether it was (probably) present already."""
+        present = True
+        for position in _bloom_positions(item, self.size, self.hash_count):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position // 8] & (1 << (position % 8))
+            for position in _bloom_positions(item, self.size, self.hash_count)
+        )
+
+
+class RedisViewerStats:
+    """
+    Unique viewers per article in Redis: one HyperLogLog (PFADD/PFCOUNT) per
+    article, plus SETBIT Bloom filters over fixed time buckets for the dedupe
+    window. A viewer counts as recent when it is in the current or the
+    previous bucket.
+    """
+
+    shared = True
+    prefix = "articles:viewers"
+
+    def __init__(self, url, window, capacity, error_rate):
+        self.client = redis.Redis.from_url(url)
+        self.window = window
+        self.size, self.hash_count = bloom_parameters(capacity, error_rate)
+
+    def _hll_key(self, article_pkid):
+        return f"{self.prefix}:hll:{article_pkid}"
+
+    def seen_recently(self, article_pkid, viewer):
+        bucket = int(time.time() // self.window)
+        current = f"{self.prefix}:bloom:{bucket}"
+        previous = f"{self.prefix}:bloom:{bucket - 1}"
+        positions = _bloom_positions(
+            f"{article_pkid}:{viewer}", self.size, self.hash_count
+        )
+
+        pipeline = self.client.pipeline(transaction=False)
+        for position in positions:
+            pipeline.setbit(current, position, 1)
+        for position in positions:
+            pipeline.getbit(previous, position)
+        pipeline.expire(current, self.window * 2)
+        bits = pipeline.execute()[:-1]
+        return all(bits[: self.hash_count]) or all(bits[self.hash_count :])
+
+    def add_viewer(self, article_pkid, viewer):
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.pfadd(self._hll_key(article_pkid), viewer)
+        pipeline.sadd(f"{self.prefix}:dirty", article_pkid)
+        pipeline.execute()
+
+    def estimate_many(self, article_pkids):
+        pipeline = self.client.pipeline(transaction=False)
+        for article_pkid in article_pkids:
+            pipeline.pfcount(self._hll_key(article_pkid))
+        return dict(zip(article_pkids, pipeline.execute()))
+
+    def pop_dirty(self, limit):
+        return [int(pkid) for pkid in self.client.spop(f"{self.prefix}:dirty", limit)]
+
+
+class LocalViewerStats:
+    """
+    In-process fallback used when Redis is unreachable. Estimates only cover
+    the views seen by the current process, which also syncs them itself.
+    Counters of at most ``max_articles`` articles are kept (16 KB each). The
+    least recently viewed one is dropped first, with its views since the
+    last sync; it starts over when viewed again, and the synced view_count
+    never goes down.
+    """
+
+    shared = False
+
+    def __init__(self, window, capacity, error_rate, max_articles):
+        self.window = window
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_articles = max_articles
+        self.counters = OrderedDict()
+        self.blooms = {}
+        self.dirty = set()
+        self.lock = threading.Lock()
+        self.last_sync = time.monotonic()
+
+    def seen_recently(self, article_pkid, viewer):
+        item = f"{article_pkid}:{viewer}"
+        bucket = int(time.time() // self.window)
+        with self.lock:
+            for stale in [key for key in self.blooms if key < bucket - 1]:
+                del self.blooms[stale]
+            if bucket not in self.blooms:
+                self.blooms[bucket] = BloomFilter(self.capacity, self.error_rate)
+            previous = self.blooms.get(bucket - 1)
+            present = self.blooms[bucket].add(item)
+            return present or (previous is not None and item in previous)
+
+    def add_viewer(self, article_pkid, viewer):
+        with self.lock:
+            if article_pkid in self.counters:
+                self.counters.move_to_end(article_pkid)
+            else:
+                self.counters[article_pkid] = HyperLogLog()
+                if len(self.counters) > self.max_articles:
+                    evicted, _ = self.counters.popitem(last=False)
+                    self.dirty.discard(evicted)
+            self.counters[article_pkid].add(viewer)
+            self.dirty.add(article_pkid)
+
+    def estimate_many(self, article_pkids):
+        return {
+            pkid: self.counters[pkid].count() if pkid in self.counters else 0
+            for pkid in article_pkids
+        }
+
+    def pop_dirty(self, limit):
+        with self.lock:
+            popped = [self.dirty.pop() for _ in range(min(limit, len(self.dirty)))]
+            self.last_sync = time.monotonic()
+            return popped
+
+    def is_due(self, interval):
+        return time.monotonic() - self.last_sync >= interval
+
+
+_redis_stats = None
+_local_stats = None
+_redis_retry_at = 0.0
+
+
+def get_local_stats():
+    """The in-process fallback, used only while Redis is unreachable."""
+    global _local_stats
+
+    if _local_stats is None:
+        config = settings.ARTICLE_VIEWERS
+        _local_stats = LocalViewerStats(
+            config["DEDUPE_WINDOW"] * 60,
+            config["BLOOM_CAPACITY"],
+            config["BLOOM_ERROR_RATE"],
+            config["LOCAL_MAX_ARTICLES"],
+        )
+    return _local_stats
+
+
+def redis_unavailable(e):
+    """
+    Count in-process for REDIS_RETRY_INTERVAL seconds before trying Redis
+    again. Each process only sees its own viewers meanwhile, so the fallback
+    is kept as short as Redis allows.
+    """
+    global _redis_retry_at
+
+    logger.warning(f"Redis viewer stats unavailable, counting in-process: {e}")
+    _redis_retry_at = (
+        time.monotonic() + settings.ARTICLE_VIEWERS["REDIS_RETRY_INTERVAL"]
+    )
+
+
+def get_viewer_stats():
+    global _redis_stats
+
+    if time.monotonic() < _redis_retry_at:
+        return get_local_stats()
+    if _redis_stats is None:
+        config = settings.ARTICLE_VIEWERS
+        try:
+            stats = RedisViewerStats(
+                config["REDIS_URL"],
+                config["DEDUPE_WINDOW"] * 60,
+                config["BLOOM_CAPACITY"],
+                config["BLOOM_ERROR_RATE"],
+            )
+            stats.client.ping()
+        except redis.RedisError as e:
+            redis_unavailable(e)
+            return get_local_stats()
+        _redis_stats = stats
+    return _redis_stats
+
+
+def viewer_key(user, viewer_ip):
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pkid}"
+    return f"ip:{viewer_ip}"
+
+
+def record_unique_viewer(article, user, viewer_ip):
+    """
+    Add the viewer to the article's unique-viewer estimate. Returns False when
+    the same viewer was already seen inside the dedupe window, in which case
+    nothing is written.
+    """
+    stats = get_viewer_stats()
+    viewer = viewer_key(user, viewer_ip)
+    try:
+        if stats.seen_recently(article.pkid, viewer):
+            return False
+        stats.add_viewer(article.pkid, viewer)
+    except redis.RedisError as e:
+        redis_unavailable(e)
+        stats = get_local_stats()
+        if stats.seen_recently(article.pkid, viewer):
+            return False
+        stats.add_viewer(article.pkid, viewer)
+
+    # In-process counts are synced from here, also once Redis is back.
+    local = _local_stats
+    if local is not None and local.is_due(settings.ARTICLE_VIEWERS["SYNC_INTERVAL"]):
+        sync_view_counts(local)
+    return True
+
+
+def estimate_views(articles):
+    """Unique-viewer estimates for ``articles`` in one round trip, keyed by pkid."""
+    articles = list(articles)
+    try:
+        estimates = get_viewer_stats().estimate_many([a.pkid for a in articles])
+    except redis.RedisError as e:
+        redis_unavailable(e)
+        estimates = {}
+    # view_count holds the last synced estimate (and the exact counts from
+    # before estimates existed), so an estimate never reads lower than it.
+    return {a.pkid: max(estimates.get(a.pkid, 0), a.view_count) for a in articles}
+
+
+def sync_view_counts(stats=None, batch_size=1000):
+    """Persist the estimates of recently viewed articles into Article.view_count."""
+    from .models import Article
+
+    stats = stats or get_viewer_stats()
+    synced = 0
+    while True:
+        pkids = stats.pop_dirty(batch_size)
+        if not pkids:
+            return synced
+        estimates = stats.estimate_many(pkids)
+        # Greatest() keeps counts from before estimates existed from regressing.
+        Article.objects.filter(pkid__in=pkids).update(
+            counters_changed_at=Now(),
+            view_count=Greatest(
+                F("view_count"),
+                Case(
+                    *[
+                        When(pkid=pkid, then=Value(count))
+                        for pkid, count in estimates.items()
+                    ],
+                    default=F("view_count"),
+                    output_field=PositiveIntegerField(),
+                ),
+            ),
+        )
+        synced += len(pkids)
@@ -1,28 +1,75 @@
+import hashlib
 import logging
 from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
-from django.core.files.storage import default_storage
+from django.db.models import Sum
 from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, permissions, status
-from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 
+from core_apps.common.bulk_delete import start_bulk_delete
+from core_apps.common.conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+)
+from core_apps.common.serializers import BulkDeleteJobSerializer
+
 from .filters import ArticleFilter
+from .fragments import ArticleFragmentCache
+from .importer import ArticleImporter
 from .models import Article, ArticleView, Clap
-from .pagination import ArticlePagination
+from .pagination import (
+    ArticleCursorPagination,
+    ArticlePagination,
+    FeedCursorPagination,
+    TrendingPagination,
+)
+from .parsers import NDJSONParser
 from .permissions import IsOwnerOrReadOnly
-from .serializers import ArticleSerializer, ClapSerializer
+from .serializers import (
+    ArticleImportSerializer,
+    ArticleListSerializer,
+    ArticleSerializer,
+)
+from .trending import decayed_score
+from .viewers import estimate_views
 
 User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
 
-class ArticleListCreateView(generics.ListCreateAPIView):
+def get_viewer_ip(request):
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+class ArticleListDataMixin:
+    def get_list_data(self, articles):
+        # Fetch the unique-viewer estimates of the whole page in one round trip.
+        articles = list(articles)
+        serializer_class = self.get_serializer_class()
+        fields = serializer_class.get_requested_fields(self.request)
+        context = self.get_serializer_context()
+        if "views" in fields:
+            context["view_estimates"] = estimate_views(articles)
+        return ArticleFragmentCache(serializer_class, context, fields).render(articles)
+
+
+class ArticleListCreateView(
+    ArticleListDataMixin, ConditionalListMixin, generics.ListCreateAPIView
+):
     queryset = Article.objects.all()
     serializer_class = ArticleSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -30,6 +77,41 @@ class ArticleListCreateView(generics.ListCreateAPIView):
     filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
     filterset_class = ArticleFilter
     ordering_fields = ["created_at", "updated_at"]
+    # cache_version moves with every counter change and every touch() (tags,
+    # author profile, response and rating edits); view_count is synced
+    # without one.
+    collection_aggregates = {
+        "versions": Sum("cache_version"),
+        "views": Sum("view_count"),
+    }
+
+    def get_version(self):
+        # Cursor pages never count the collection; validating them would add
+        # the full scan that keyset pagination avoids.
+        if isinstance(self.paginator, ArticleCursorPagination):
+            return None
+        return super().get_version()
+
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return ArticleListSerializer
+        return ArticleSerializer
+
+    def get_queryset(self):
+        fields = self.get_serializer_class().get_requested_fields(self.request)
+        return Article.objects.for_serializer(fields)
+
+    @property
+    def paginator(self):
+        # ?pagination=cursor (or following a cursor link) switches the feed to
+        # keyset pagination; page numbers stay the default.
+        if not hasattr(self, "_paginator"):
+            params = self.request.query_params
+            if params.get("pagination") == "cursor" or "cursor" in params:
+                self._paginator = ArticleCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def perform_create(self, serializer):
         # Set the author to the currently authenticated user
@@ -62,21 +144,25 @@ class ArticleListCreateView(generics.ListCreateAPIView):
             queryset = self.filter_queryset(self.get_queryset())
             page = self.paginate_queryset(queryset)
             if page is not None:
-                serializer = self.get_serializer(page, many=True)
                 response_data = {
                     "status": "success",
                     "message": "Articles retrieved successfully.",
-                    "data": self.get_paginated_response(serializer.data).data,
+                    "data": self.get_paginated_response(self.get_list_data(page)).data,
                 }
                 return Response(response_data, status=status.HTTP_200_OK)
 
-            serializer = self.get_serializer(queryset, many=True)
             response_data = {
                 "status": "success",
                 "message": "Articles retrieved successfully.",
-                "data": serializer.data,
+                "data": self.get_list_data(queryset),
             }
             return Response(response_data, status=status.HTTP_200_OK)
+        except NotFound as e:
+            return Response({
+                "status": "error",
+                "message": str(e.detail),
+                "data": None,
+            }, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error retrieving articles: {str(e)}", exc_info=True)
             return Response({
@@ -84,23 +170,199 @@ class ArticleListCreateView(generics.ListCreateAPIView):
                 "message": f"An unexpected error occurred: {str(e)}",
                 "data": None,
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-class ArticleRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+
+
+class TrendingArticleListView(ArticleListDataMixin, generics.ListAPIView):
+    """
+    Articles ranked by time-decayed activity, read from the TrendingArticle
+    table that the update_trending_articles task keeps current.
+    """
+
+    serializer_class = ArticleListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TrendingPagination
+
+    def get_queryset(self):
+        fields = self.get_serializer_class().get_requested_fields(self.request)
+        return Article.objects.for_serializer(fields).trending()
+
+    def list(self, request, *args, **kwargs):
+        try:
+            page = self.paginate_queryset(self.get_queryset())
+            now = timezone.now()
+            for article in page:
+                article.trending_score = round(
+                    decayed_score(article.trending_log_score, now), 4
+                )
+            return Response({
+                "status": "success",
+                "message": "Trending articles retrieved successfully.",
+                "data": self.get_paginated_response(self.get_list_data(page)).data,
+            }, status=status.HTTP_200_OK)
+        except NotFound as e:
+            return Response({
+                "status": "error",
+                "message": str(e.detail),
+                "data": None,
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error retrieving trending articles: {str(e)}", exc_info=True)
+            return Response({
+                "status": "error",
+                "message": f"An unexpected error occurred: {str(e)}",
+                "data": None,
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ArticleFeedView(ArticleListDataMixin, generics.ListAPIView):
+    """
+    Newest articles of the authors the user follows, read from the user's
+    precomputed timeline (see feed.py) with cursor pagination.
+    """
+
+    serializer_class = ArticleListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = FeedCursorPagination
+
+    def get_queryset(self):
+        fields = self.get_serializer_class().get_requested_fields(self.request)
+        return Article.objects.for_serializer(fields)
+
+    def list(self, request, *args, **kwargs):
+        try:
+            page = self.paginate_queryset(self.get_queryset())
+            return Response({
+                "status": "success",
+                "message": "Feed retrieved successfully.",
+                "data": self.get_paginated_response(self.get_list_data(page)).data,
+            }, status=status.HTTP_200_OK)
+        except NotFound as e:
+            return Response({
+                "status": "error",
+                "message": str(e.detail),
+                "data": None,
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error retrieving feed: {str(e)}", exc_info=True)
+            return Response({
+                "status": "error",
+                "message": f"An unexpected error occurred: {str(e)}",
+                "data": None,
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class RelatedArticleListView(ArticleListDataMixin, generics.ListAPIView):
+    """The precomputed related articles of an article, most similar first."""
+
+    serializer_class = ArticleListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+
+    def get_queryset(self):
+        article = get_object_or_404(Article.objects.only("pkid"), id=self.kwargs["id"])
+        fields = self.get_serializer_class().get_requested_fields(self.request)
+        return Article.objects.for_serializer(fields).related_to(article)
+
+    def list(self, request, *args, **kwargs):
+        try:
+            return Response({
+                "status": "success",
+                "message": "Related articles retrieved successfully.",
+                "data": self.get_list_data(self.get_queryset()),
+            }, status=status.HTTP_200_OK)
+        except Http404:
+            return Response({
+                "status": "error",
+                "message": "Article not found.",
+                "data": None,
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error retrieving related articles: {str(e)}", exc_info=True)
+            return Response({
+                "status": "error",
+                "message": f"An unexpected error occurred: {str(e)}",
+                "data": None,
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ArticleSuggestView(generics.GenericAPIView):
+    """Typeahead: ids, titles and slugs of articles matching ?q=, from a short-TTL cache."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        config = settings.ARTICLE_SUGGEST
+        query = " ".join(request.query_params.get("q", "").split())
+        try:
+            limit = min(
+                int(request.query_params.get("limit", config["LIMIT"])),
+                config["MAX_LIMIT"],
+            )
+        except ValueError:
+            limit = config["LIMIT"]
+
+        if len(query) < config["MIN_LENGTH"] or limit < 1:
+            suggestions = []
+        else:
+            digest = hashlib.md5(query.casefold().encode()).hexdigest()
+            cache_key = f"articles:suggest:{limit}:{digest}"
+            suggestions = cache.get(cache_key)
+            if suggestions is None:
+                suggestions = list(Article.objects.suggest(query, limit))
+                cache.set(cache_key, suggestions, config["CACHE_TTL"])
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Suggestions retrieved successfully.",
+                "data": suggestions,
+            },
+            status=status.HTTP_200_OK,
+        )
+class ArticleRetrieveUpdateDestroyView(
+    ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
     queryset = Article.objects.all()
     serializer_class = ArticleSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     lookup_field = "id"
     parser_classes = [MultiPartParser, FormParser]
+    # cache_version covers counters, responses and the author profile.
+    # Revalidated requests are answered with a 304 and are not recorded as
+    # views; "views" in the ETag reflects the last synced view_count.
+    conditional_fields = ("cache_version", "view_count")
+
+    def get_queryset(self):
+        fields = self.get_serializer_class().get_requested_fields(self.request)
+        return Article.objects.for_serializer(fields)
+
+    def get_object(self):
+        self.article = super().get_object()
+        return self.article
+
+    def get_serializer_context(self):
+        # The serializer reads the unique-viewer estimate of the article from
+        # the context, so it is fetched once per request here.
+        context = super().get_serializer_context()
+        article = getattr(self, "article", None)
+        fields = self.get_serializer_class().get_requested_fields(self.request)
+        if article is not None and "views" in fields:
+            context["view_estimates"] = estimate_views([article])
+        return context
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        ArticleView.record_view(instance, request.user, get_viewer_ip(request))
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
 
     def perform_update(self, serializer):
-        instance = serializer.save(author=self.request.user)
+        # One save; the replaced banner and its derivatives are deleted in the
+        # background (see core_apps.common.images).
+        extra = {}
         if "banner_image" in self.request.FILES:
-            if (
-                instance.banner_image
-                and instance.banner_image.name != "/profile_default.png"
-            ):
-                default_storage.delete(instance.banner_image.path)
-            instance.banner_image = self.request.FILES["banner_image"]
-            instance.save()
+            extra["banner_image"] = self.request.FILES["banner_image"]
+        serializer.save(author=self.request.user, **extra)
 
     def update(self, request, *args, **kwargs):
         try:
@@ -138,9 +400,20 @@ class ArticleBulkDeleteView(generics.GenericAPIView):
 
         try:
             uuids = [UUID(id) for id in ids]
-            articles = Article.objects.filter(id__in=uuids)
-            articles_deleted = articles.count()
-            articles.delete()
+        except (TypeError, ValueError, AttributeError):
+            return Response({
+                "status": "error",
+                "message": "IDs must be valid UUIDs."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            job, articles_deleted = start_bulk_delete(Article, uuids, request.user)
+            if job is not None:
+                return Response({
+                    "status": "success",
+                    "message": f"Deleting {job.total} articles in the background.",
+                    "data": BulkDeleteJobSerializer(job).data
+                }, status=status.HTTP_202_ACCEPTED)
             return Response({
                 "status": "success",
                 "message": f"{articles_deleted} articles deleted successfully.",
@@ -165,29 +438,92 @@ class ArticleBulkDeleteView(generics.GenericAPIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class ClapArticleView(generics.CreateAPIView, generics.DestroyAPIView):
-    queryset = Clap.objects.all()
-    serializer_class = ClapSerializer
+class ArticleBulkCreateView(generics.GenericAPIView):
+    """
+    Creates up to ARTICLE_IMPORT["MAX_REQUEST_RECORDS"] articles for the
+    current user from a JSON list (or {"articles": [...]}) or an NDJSON body.
+    Valid records are created even when others fail; ``position`` in the
+    result is the record's index in the request, so a client can resend
+    only what is missing.
+    """
 
-    def create(self, request, *args, **kwargs):
-        user = request.user
-        article_id = kwargs.get("article_id")
-        article = get_object_or_404(Article, id=article_id)
+    serializer_class = ArticleImportSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [JSONParser, NDJSONParser]
+
+    def post(self, request, *args, **kwargs):
+        records = request.data
+        if isinstance(records, dict):
+            records = records.get("articles")
+        if not isinstance(records, list) or not records:
+            return Response({
+                "status": "error",
+                "message": "Expected a non-empty list of articles.",
+                "data": None,
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-        if Clap.objects.filter(user=user, article=article).exists():
+        limit = settings.ARTICLE_IMPORT["MAX_REQUEST_RECORDS"]
+        if len(records) > limit:
             return Response({
                 "status": "error",
-                "message": "You have already clapped on this article."
+                "message": (
+                    f"At most {limit} articles can be created per request; "
+                    "use the import_articles command for larger imports."
+                ),
+                "data": None,
             }, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            clap = Clap.objects.create(user=user, article=article)
-            clap.save()
+            result = ArticleImporter(
+                author=request.user, collect=True, record_authors=False
+            ).run(enumerate(records))
+        except Exception as e:
+            logger.error(f"Error importing articles: {str(e)}", exc_info=True)
             return Response({
-                "status": "success",
-                "message": "Clap added to article.",
-                "data": {}
-            }, status=status.HTTP_201_CREATED)
+                "status": "error",
+                "message": f"An unexpected error occurred: {str(e)}",
+                "data": None,
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response({
+            "status": "success" if result.created else "error",
+            "message": f"{result.created} articles created, {result.failed} failed.",
+            "data": {
+                "created": result.created,
+                "failed": result.failed,
+                "articles": result.articles,
+                "errors": result.errors,
+            },
+        }, status=status.HTTP_201_CREATED if result.created else status.HTTP_400_BAD_REQUEST)
+
+
+class ClapArticleView(generics.GenericAPIView):
+    """
+    PUT (or POST) claps the article, DELETE takes the clap back. Both are
+    idempotent, take a single statement (see ClapManager) and return the
+    article's current clap count.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def _respond(self, result, message, created=False):
+        if result is None:
+            return Response({
+                "status": "error",
+                "message": "Article not found.",
+                "data": None,
+            }, status=status.HTTP_404_NOT_FOUND)
+        changed, clap_count = result
+        return Response({
+            "status": "success",
+            "message": message,
+            "data": {"clapped": created, "changed": changed, "clap_count": clap_count},
+        }, status=status.HTTP_201_CREATED if created and changed else status.HTTP_200_OK)
+
+    def put(self, request, *args, **kwargs):
+        try:
+            result = Clap.objects.add(request.user, kwargs["article_id"])
+            return self._respond(result, "Clap added to article.", created=True)
         except Exception as e:
             logger.error(f"Error adding clap: {str(e)}", exc_info=True)
             return Response({
@@ -195,27 +531,52 @@ class ClapArticleView(generics.CreateAPIView, generics.DestroyAPIView):
                 "message": f"An unexpected error occurred: {str(e)}"
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def delete(self, request, *args, **kwargs):
-        user = request.user
-        article_id = kwargs.get("article_id")
-        article = get_object_or_404(Article, id=article_id)
+    post = put
 
+    def delete(self, request, *args, **kwargs):
         try:
-            clap = get_object_or_404(Clap, user=user, article=article)
-            clap.delete()
-            return Response({
-                "status": "success",
-                "message": "Clap removed from article.",
-                "data": {}
-            }, status=status.HTTP_204_NO_CONTENT)
-        except Http404:
-            return Response({
-                "status": "error",
-                "message": "Clap not found."
-            }, status=status.HTTP_404_NOT_FOUND)
+            result = Clap.objects.remove(request.user, kwargs["article_id"])
+            return self._respond(result, "Clap removed from article.")
         except Exception as e:
             logger.error(f"Error removing clap: {str(e)}", exc_info=True)
             return Response({
                 "status": "error",
                 "message": f"An unexpected error occurred: {str(e)}"
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ClapStatusView(generics.GenericAPIView):
+    """
+    Whether the user clapped each of ``?ids=<uuid>,<uuid>`` and their clap
+    counts, in one query; unknown ids are left out.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        ids = [id for id in request.query_params.get("ids", "").split(",") if id]
+        if not ids:
+            return Response({
+                "status": "error",
+                "message": "No IDs provided."
+            }, status=status.HTTP_400_BAD_REQUEST)
+        max_ids = settings.ARTICLE_CLAPS["STATUS_MAX_IDS"]
+        if len(ids) > max_ids:
+            return Response({
+                "status": "error",
+                "message": f"At most {max_ids} IDs can be requested at once."
+            }, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            uuids = [UUID(id) for id in ids]
+        except ValueError:
+            return Response({
+                "status": "error",
+                "message": "IDs must be valid UUIDs."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        statuses = Clap.objects.statuses(request.user, uuids)
+        return Response({
+            "status": "success",
+            "message": "Clap statuses retrieved successfully.",
+            "data": {str(article_id): value for article_id, value in statuses.items()},
+        }, status=status.HTTP_200_OK)
\ No newline at end of file
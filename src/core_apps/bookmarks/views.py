@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from rest_framework import generics, permissions
 from rest_framework.exceptions import NotFound, ValidationError
 
@@ -26,7 +26,8 @@ class BookmarkCreateView(generics.CreateAPIView):
         else:
             raise ValidationError("article_id is required")
         try:
-            serializer.save(user=self.request.user, article=article)
+            with transaction.atomic():
+                serializer.save(user=self.request.user, article=article)
         except IntegrityError:
             raise ValidationError("You have already bookmarked this article")
 
@@ -56,4 +57,5 @@ class BookmarkDestroyView(generics.DestroyAPIView):
         user = self.request.user
         if instance.user != user:
             raise ValidationError("You cannot delete a bookmark that is not yours")
-        instance.delete()
+        with transaction.atomic():
+            instance.delete()
@@ -1,6 +1,7 @@
 from rest_framework import generics, status, permissions, filters, serializers
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.response import Response
+from django.db.models import Max
 from .models import Client
 from .serializers import (
     ClientSerializer,
@@ -8,10 +9,21 @@ from .serializers import (
     UpdateClientSerializer,
     ClientListSerializer,
 )
+from core_apps.common.conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+)
+from core_apps.common.streaming import StreamingListMixin
 from core_apps.organization.models import Organization
-class ClientListCreateView(generics.ListCreateAPIView):
+
+class ClientListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     queryset = Client.objects.all()
     serializer_class = ClientSerializer
+    # Rows render their organization, whose edits the client's own
+    # updated_at does not see.
+    collection_aggregates = {
+        "organizations": Max("organization__updated_at"),
+    }
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
     search_fields = ["name", "email", "phone_number"]
@@ -68,7 +80,9 @@ class ClientListCreateView(generics.ListCreateAPIView):
                 "message": str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class ClientRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class ClientRetrieveUpdateDestroyView(
+    ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
     queryset = Client.objects.all()
     serializer_class = ClientSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -109,19 +123,23 @@ class ClientRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         }, status=status.HTTP_204_NO_CONTENT)
 
 
-class OrganizationClientsView(generics.ListAPIView):
+class OrganizationClientsView(StreamingListMixin, generics.ListAPIView):
     serializer_class = ClientListSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         organization_uuid = self.kwargs.get("organization_uuid") 
-        return Client.objects.filter(organization__id=organization_uuid)
+        return Client.objects.filter(organization__id=organization_uuid).select_related(
+            "organization"
+        )
 
     def get(self, request, *args, **kwargs):
         clients = self.get_queryset()
-        serializer = self.get_serializer(clients, many=True)
-        return Response({
-            "status": "success",
-            "message": "Clients retrieved successfully",
-            "data": serializer.data
-        }, status=status.HTTP_200_OK)
+        return self.stream_list(
+            clients,
+            {
+                "status": "success",
+                "message": "Clients retrieved successfully",
+            },
+            "data",
+        )
@@ -1,3 +1,24 @@
 from django.contrib import admin
 
-# Register your models here.
+from . import models
+
+
+class BulkDeleteJobAdmin(admin.ModelAdmin):
+    list_display = ["pkid", "target", "status", "total", "processed", "deleted"]
+    list_display_links = ["pkid", "target"]
+    list_filter = ["status", "target", "created_at"]
+    exclude = ["ids"]
+
+
+admin.site.register(models.BulkDeleteJob, BulkDeleteJobAdmin)
+
+
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = ["pkid", "name", "size", "refcount", "updated_at"]
+    list_display_links = ["pkid", "name"]
+    list_filter = ["created_at"]
+    search_fields = ["digest", "name"]
+    readonly_fields = ["digest", "name", "size"]
+
+
+admin.site.register(models.StoredBlob, StoredBlobAdmin)
@@ -0,0 +1,100 @@
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import CASCADE, F
+from django.db.models.deletion import Collector
+from django.utils import timezone
+
+from .models import BulkDeleteJob
+
+logger = logging.getLogger(__name__)
+
+
+def delete_chunk(model, ids):
+    """
+    Delete the rows of ``model`` with these UUIDs; returns how many existed.
+    Rows referencing them through a cascading foreign key are deleted first,
+    per relation and with the parent queryset as the signal origin, so a
+    chunk's cascade stays one bounded step at a time and receivers can tell
+    the parent is going away.
+    """
+    parents = model.objects.filter(id__in=ids)
+    pks = list(parents.values_list("pk", flat=True))
+    if not pks:
+        return 0
+    parents = model.objects.filter(pk__in=pks)
+    for relation in model._meta.related_objects:
+        if not relation.one_to_many or relation.on_delete is not CASCADE:
+            continue
+        collector = Collector(using=parents.db, origin=parents)
+        collector.collect(
+            relation.related_model._base_manager.filter(
+                **{f"{relation.field.name}__in": pks}
+            )
+        )
+        collector.delete()
+    _, deleted = parents.delete()
+    return deleted.get(model._meta.label, 0)
+
+
+def start_bulk_delete(model, ids, user):
+    """
+    Delete ``ids`` right away when there are at most
+    BULK_DELETE["SYNC_THRESHOLD"] of them and return ``(None, deleted)``.
+    Larger batches become a BulkDeleteJob handled by a Celery task once the
+    surrounding transaction commits; ``(job, 0)`` is returned.
+    """
+    ids = [str(value) for value in dict.fromkeys(ids)]
+    if len(ids) <= settings.BULK_DELETE["SYNC_THRESHOLD"]:
+        with transaction.atomic():
+            return None, delete_chunk(model, ids)
+
+    from .tasks import run_bulk_delete_job
+
+    job = BulkDeleteJob.objects.create(
+        target=model._meta.label, requested_by=user, ids=ids, total=len(ids)
+    )
+    transaction.on_commit(lambda: run_bulk_delete_job.delay(job.pk))
+    return job, 0
+
+
+def run_bulk_delete(job):
+    """
+    Work through ``job`` in chunks of BULK_DELETE["CHUNK_SIZE"] ids, each
+    deleted (with its cascades) in its own short transaction together with
+    the progress update. A job picked up again resumes after ``processed``.
+    """
+    chunk_size = settings.BULK_DELETE["CHUNK_SIZE"]
+    model = apps.get_model(job.target)
+    jobs = BulkDeleteJob.objects.filter(pk=job.pk)
+    jobs.update(status=BulkDeleteJob.Status.RUNNING, updated_at=timezone.now())
+
+    try:
+        for start in range(job.processed, job.total, chunk_size):
+            chunk = job.ids[start : start + chunk_size]
+            with transaction.atomic():
+                deleted = delete_chunk(model, chunk)
+                jobs.update(
+                    processed=start + len(chunk),
+                    deleted=F("deleted") + deleted,
+                    updated_at=timezone.now(),
+                )
+    except Exception as e:
+        logger.error(f"Bulk delete job {job.id} failed: {str(e)}", exc_info=True)
+        jobs.update(
+            status=BulkDeleteJob.Status.FAILED,
+            error=str(e),
+            updated_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+        raise
+
+    jobs.update(
+        status=BulkDeleteJob.Status.SUCCEEDED,
+        updated_at=timezone.now(),
+        finished_at=timezone.now(),
+    )
+    job.refresh_from_db()
+    return job
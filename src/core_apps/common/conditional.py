@@ -0,0 +1,105 @@
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetBase:
+    """
+    Shared ETag / Last-Modified handling. Subclasses read a small tuple of
+    version values with one query; a matching If-None-Match or
+    If-Modified-Since is answered with a bodyless 304 before anything is
+    serialized.
+    """
+
+    def get_version(self):
+        raise NotImplementedError
+
+    def get_validators(self, version):
+        digest = hashlib.md5(
+            repr((version, self.request.get_full_path())).encode()
+        ).hexdigest()
+        timestamps = [value for value in version if isinstance(value, datetime)]
+        last_modified = max(timestamps).timestamp() if timestamps else None
+        # If-Modified-Since is only trustworthy when every part of the version
+        # is a timestamp; counters and names change without one.
+        exact = len(timestamps) == len(version)
+        return quote_etag(digest), last_modified, exact
+
+    def get(self, request, *args, **kwargs):
+        version = self.get_version()
+        if version is None:
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified, exact = self.get_validators(version)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified if exact else None
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class ConditionalRetrieveMixin(ConditionalGetBase):
+    """
+    Conditional GET for retrieve views. The version is ``updated_at`` plus
+    ``conditional_fields`` (columns or related lookups rendered by the
+    serializer) and ``conditional_annotations`` (aggregates over related rows).
+    """
+
+    conditional_fields = ()
+    conditional_annotations = {}
+
+    def get_conditional_queryset(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return (
+            self.get_queryset()
+            .prefetch_related(None)
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        )
+
+    def get_version(self):
+        return (
+            self.get_conditional_queryset()
+            .annotate(**self.conditional_annotations)
+            .order_by()
+            .values_list(
+                "updated_at",
+                *self.conditional_fields,
+                *self.conditional_annotations,
+            )
+            .first()
+        )
+
+
+class ConditionalListMixin(ConditionalGetBase):
+    """
+    Conditional GET for list views. The collection version is the newest
+    ``updated_at`` and the row count of the filtered queryset, plus
+    ``collection_aggregates`` for values that change without updated_at.
+    """
+
+    collection_aggregates = {}
+
+    def get_version(self):
+        version = (
+            self.filter_queryset(self.get_queryset())
+            .prefetch_related(None)
+            .order_by()
+            .aggregate(
+                last_updated_at=Max("updated_at"),
+                total=Count("pk"),
+                **self.collection_aggregates,
+            )
+        )
+        if version["last_updated_at"] is None:
+            return None
+        return tuple(version.values())
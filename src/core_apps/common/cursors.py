@@ -0,0 +1,18 @@
+import base64
+import json
+
+
+def encode_cursor(position):
+    """Opaque, URL-safe token for a JSON-serializable keyset position."""
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(encoded):
+    """Inverse of encode_cursor(); raises ValueError for malformed tokens."""
+    try:
+        position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor: {e}")
+    if not isinstance(position, dict):
+        raise ValueError("Malformed cursor")
+    return position
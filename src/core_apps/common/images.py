@@ -0,0 +1,278 @@
+import hashlib
+import io
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from PIL import Image, ImageOps
+
+from .storage import ContentAddressedStorage
+
+logger = logging.getLogger(__name__)
+
+EXIF_ORIENTATION = 0x0112
+
+# format name -> (Pillow format, file extension)
+FORMATS = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+    "png": ("PNG", "png"),
+}
+
+
+def meta_field_name(field_name):
+    return f"{field_name}_meta"
+
+
+def image_fields():
+    """(model, field name, widths) for every field in IMAGE_DERIVATIVES["FIELDS"]."""
+    for path, widths in settings.IMAGE_DERIVATIVES["FIELDS"].items():
+        label, field_name = path.rsplit(".", 1)
+        yield apps.get_model(label), field_name, widths
+
+
+def is_default_image(model, field_name, name):
+    return not name or name == model._meta.get_field(field_name).default
+
+
+def derivative_names(meta):
+    return [derivative["name"] for derivative in (meta or {}).get("derivatives", [])]
+
+
+def _save_options(fmt):
+    config = settings.IMAGE_DERIVATIVES
+    if fmt == "webp":
+        return {"quality": config["WEBP_QUALITY"], "method": 4}
+    if fmt == "jpeg":
+        return {
+            "quality": config["JPEG_QUALITY"],
+            "optimize": True,
+            "progressive": True,
+        }
+    return {"optimize": True}
+
+
+def render_derivatives(source, widths):
+    """
+    Resize ``source`` to each of ``widths`` narrower than the original (or
+    once at its own width) in every configured format. Images with
+    transparency get PNG instead of JPEG. Returns the original
+    ``(width, height)`` and a list of ``(width, height, format, bytes)``.
+    """
+    with Image.open(source) as image:
+        width, height = image.size
+        # Orientations 5-8 are rotated by a quarter turn.
+        if image.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+            width, height = height, width
+        largest = max(widths)
+        # For JPEG sources, decode at a reduced scale that still covers the
+        # largest derivative.
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ("RGBA", "LA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    formats = [
+        "png" if fmt == "jpeg" and has_alpha else fmt
+        for fmt in settings.IMAGE_DERIVATIVES["FORMATS"]
+    ]
+    targets = sorted({target for target in widths if target < width}) or [width]
+
+    derivatives = []
+    for target in targets:
+        target_height = max(1, round(height * target / width))
+        resized = (
+            image
+            if image.size == (target, target_height)
+            else image.resize((target, target_height), Image.Resampling.LANCZOS)
+        )
+        for fmt in formats:
+            buffer = io.BytesIO()
+            resized.save(buffer, format=FORMATS[fmt][0], **_save_options(fmt))
+            derivatives.append((target, target_height, fmt, buffer.getvalue()))
+    return (width, height), derivatives
+
+
+def generate_derivatives(model, pk, field_name, widths):
+    """
+    Write the derivatives of the current file of ``field_name`` and record
+    them with width, height and byte size in ``<field_name>_meta``, so
+    serializers never have to open an image. Returns the names of files
+    that are no longer referenced: the previous derivatives, or the new
+    ones when the file was replaced again in the meantime.
+    """
+    meta_field = meta_field_name(field_name)
+    instance = model.objects.filter(pk=pk).only("pk", field_name).first()
+    if instance is None:
+        return []
+    file = getattr(instance, field_name)
+    source = file.name
+    if is_default_image(model, field_name, source):
+        return []
+
+    with file.open("rb"):
+        (width, height), rendered = render_derivatives(file, widths)
+        size = file.size
+
+    digest = hashlib.md5(f"{pk}:{source}".encode()).hexdigest()[:12]
+    prefix = (
+        f"{settings.IMAGE_DERIVATIVES['PATH']}/{model._meta.label_lower}"
+        f"/{field_name}/{digest}"
+    )
+    derivatives = []
+    for target_width, target_height, fmt, content in rendered:
+        name = default_storage.save(
+            f"{prefix}-{target_width}w.{FORMATS[fmt][1]}", ContentFile(content)
+        )
+        derivatives.append(
+            {
+                "name": name,
+                "width": target_width,
+                "height": target_height,
+                "format": fmt,
+                "size": len(content),
+            }
+        )
+    meta = {
+        "source": source,
+        "width": width,
+        "height": height,
+        "size": size,
+        "derivatives": derivatives,
+    }
+
+    with transaction.atomic():
+        instance = model.objects.select_for_update().filter(pk=pk).first()
+        if instance is None or getattr(instance, field_name).name != source:
+            return derivative_names(meta)
+        superseded = derivative_names(getattr(instance, meta_field))
+        setattr(instance, meta_field, meta)
+        # A regular save, so cache versions and dependent signals follow.
+        instance.save(update_fields=[meta_field, "updated_at"])
+    return superseded
+
+
+def image_derivatives(instance, field_name):
+    """
+    The recorded derivatives of the current file, with URLs, or None while
+    they are being generated.
+    """
+    meta = getattr(instance, meta_field_name(field_name)) or {}
+    file = getattr(instance, field_name)
+    if not file or meta.get("source") != file.name:
+        return None
+    return {
+        "width": meta["width"],
+        "height": meta["height"],
+        "size": meta["size"],
+        "sources": [
+            {
+                "url": default_storage.url(derivative["name"]),
+                "width": derivative["width"],
+                "height": derivative["height"],
+                "format": derivative["format"],
+                "size": derivative["size"],
+            }
+            for derivative in meta["derivatives"]
+        ],
+    }
+
+
+def _current_name(value):
+    return getattr(value, "name", value)
+
+
+def _release_duplicate(name):
+    # The same content was uploaded again: storing it took another reference
+    # to the blob the field already held, which nothing will release.
+    storage = default_storage
+    if isinstance(storage, ContentAddressedStorage) and storage.is_blob(name):
+        storage.delete(name)
+
+
+def connect_image_signals():
+    """
+    Queue derivative generation after a configured image field changes and
+    the transaction commits, and delete superseded originals and
+    derivatives in the background.
+    """
+    from .tasks import delete_stored_files, generate_image_derivatives
+
+    for model, field_name, widths in image_fields():
+        meta_field = meta_field_name(field_name)
+
+        def remember(sender, instance, field_name=field_name, **kwargs):
+            if field_name in instance.__dict__:
+                instance._image_names = {
+                    **getattr(instance, "_image_names", {}),
+                    field_name: _current_name(instance.__dict__[field_name]),
+                }
+
+        def note_upload(sender, instance, field_name=field_name, **kwargs):
+            # Before the field's pre_save() writes the file and commits it.
+            if (
+                field_name in instance.__dict__
+                and not getattr(instance, field_name)._committed
+            ):
+                instance._image_uploads = {
+                    *getattr(instance, "_image_uploads", ()),
+                    field_name,
+                }
+
+        def on_save(
+            sender,
+            instance,
+            created,
+            field_name=field_name,
+            meta_field=meta_field,
+            widths=widths,
+            **kwargs,
+        ):
+            if field_name not in instance.__dict__:
+                return
+            uploads = getattr(instance, "_image_uploads", set())
+            instance._image_uploads = uploads - {field_name}
+            names = getattr(instance, "_image_names", {})
+            previous = names.get(field_name)
+            current = _current_name(instance.__dict__[field_name])
+            if not created and (field_name not in names or previous == current):
+                if field_name in uploads and previous == current:
+                    _release_duplicate(current)
+                return
+            instance._image_names = {**names, field_name: current}
+
+            label = sender._meta.label
+            pk = instance.pk
+            if not is_default_image(sender, field_name, current):
+                transaction.on_commit(
+                    lambda: generate_image_derivatives.delay(
+                        label, pk, field_name, widths
+                    )
+                )
+            if not created and not is_default_image(sender, field_name, previous):
+                superseded = [previous]
+                if is_default_image(sender, field_name, current):
+                    # No new derivatives will replace the recorded ones.
+                    superseded += derivative_names(instance.__dict__.get(meta_field))
+                transaction.on_commit(lambda: delete_stored_files.delay(superseded))
+
+        def on_delete(
+            sender, instance, field_name=field_name, meta_field=meta_field, **kwargs
+        ):
+            names = derivative_names(instance.__dict__.get(meta_field))
+            current = _current_name(instance.__dict__.get(field_name))
+            if not is_default_image(sender, field_name, current):
+                names.append(current)
+            if names:
+                transaction.on_commit(lambda: delete_stored_files.delay(names))
+
+        post_init.connect(remember, sender=model, weak=False)
+        pre_save.connect(note_upload, sender=model, weak=False)
+        post_save.connect(on_save, sender=model, weak=False)
+        post_delete.connect(on_delete, sender=model, weak=False)
@@ -0,0 +1,170 @@
+import json
+import random
+import string
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.renderers import JSONRenderer
+
+from core_apps.common.renderers import ORJSONRenderer
+
+
+def _words(rng, count):
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(count)
+    )
+
+
+def _article(rng, native):
+    """Shaped like ArticleSerializer output; ``native`` keeps raw Python types."""
+    now = timezone.now()
+    timestamp = now if native else now.strftime("%m/%d/%Y, %H:%M:%S")
+    identifier = uuid.uuid4() if native else str(uuid.uuid4())
+    return {
+        "id": identifier,
+        "title": _words(rng, 8),
+        "slug": _words(rng, 8).replace(" ", "-"),
+        "tags": [_words(rng, 1) for _ in range(5)],
+        "estimated_reading_time": 21,
+        "author_info": {
+            "id": identifier,
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "full_name": "Ada Lovelace",
+            "email": "ada@example.com",
+            "profile_photo": "/profile_default.png",
+            "phone_number": PhoneNumber.from_string("+250784123456")
+            if native
+            else "+250784123456",
+            "gender": "F",
+            "country": "Kenya",
+            "city": "Nairobi",
+            "twitter_handle": "ada",
+            "about_me": _words(rng, 30),
+        },
+        "views": 1234,
+        "description": _words(rng, 25),
+        "body": _words(rng, 5_000),
+        "banner_image": "/profile_default.png",
+        "average_rating": Decimal("4.25") if native else 4.25,
+        "bookmarks_count": 12,
+        "claps_count": 87,
+        "responses": [
+            {
+                "id": identifier,
+                "user_first_name": "Grace",
+                "article_title": "Title",
+                "parent_response": None,
+                "content": _words(rng, 60),
+                "created_at": now if native else now.isoformat(),
+            }
+            for _ in range(20)
+        ],
+        "responses_count": 20,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+
+
+def _invoice(rng, native):
+    """Shaped like InvoiceDetailSerializer output."""
+    now = timezone.now()
+    party = {
+        "id": uuid.uuid4() if native else str(uuid.uuid4()),
+        "name": _words(rng, 3),
+        "email": "billing@example.com",
+        "address": _words(rng, 10),
+        "phone_number": "+250784123456",
+    }
+    return {
+        "id": uuid.uuid4() if native else str(uuid.uuid4()),
+        "created_by_info": "owner@example.com",
+        "updated_by_info": "owner@example.com",
+        "logo_url": "https://example.com/logo.png",
+        "title": _words(rng, 4),
+        "irn": "INV-ACME-20260101-000001",
+        "issue_date": now.date() if native else now.date().isoformat(),
+        "due_date": now.date() if native else now.date().isoformat(),
+        "client": party,
+        "items": [
+            {
+                "description": _words(rng, 12),
+                "quantity": rng.randint(1, 20),
+                "unit_price": Decimal("19.99") if native else "19.99",
+            }
+            for _ in range(50)
+        ],
+        "payment_info": {"bank": _words(rng, 2), "account": "0123456789"},
+        "discount": Decimal("5.00") if native else "5.00",
+        "shipping": Decimal("12.50") if native else "12.50",
+        "terms_and_conditions": _words(rng, 120),
+        "note": _words(rng, 40),
+        "template_id": 1,
+        "created_at": now if native else now.strftime("%m/%d/%Y, %H:%M:%S"),
+        "updated_at": now if native else now.strftime("%m/%d/%Y, %H:%M:%S"),
+        "organization": party,
+    }
+
+
+def _stdlib(data):
+    return json.dumps(data).encode()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare ORJSONRenderer with DRF's JSONRenderer and the json.dumps the "
+        "custom renderers used, on article and invoice payloads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=10, help="Objects per page.")
+        parser.add_argument("--rounds", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        envelope = lambda items: {  # noqa: E731
+            "status": "success",
+            "message": "Retrieved successfully.",
+            "data": {
+                "count": len(items),
+                "next": None,
+                "previous": None,
+                "results": items,
+            },
+        }
+        payloads = {}
+        for name, factory in (("articles", _article), ("invoices", _invoice)):
+            for native in (False, True):
+                label = f"{name} ({'native types' if native else 'serialized'})"
+                payloads[label] = envelope(
+                    [factory(rng, native) for _ in range(options["items"])]
+                )
+
+        candidates = {
+            "json.dumps": _stdlib,
+            "JSONRenderer": JSONRenderer().render,
+            "ORJSONRenderer": ORJSONRenderer().render,
+        }
+        for label, payload in payloads.items():
+            self.stdout.write(label)
+            for name, render in candidates.items():
+                try:
+                    size = len(render(payload))
+                except TypeError:
+                    self.stdout.write(f"  {name:<16} not serializable")
+                    continue
+                best = float("inf")
+                for _ in range(options["rounds"]):
+                    started = time.perf_counter()
+                    render(payload)
+                    best = min(best, time.perf_counter() - started)
+                self.stdout.write(
+                    f"  {name:<16} {size / best / 1_000_000:>10,.1f} MB/s "
+                    f"{1 / best:>10,.0f} pages/s ({size / 1000:,.0f} kB)"
+                )
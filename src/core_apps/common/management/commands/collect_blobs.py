@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core_apps.common.storage import (
+    adopt_orphaned_blobs,
+    collect_unreferenced_blobs,
+    reconcile_blob_refcounts,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stored blobs that nothing has referenced for longer than the "
+        "grace period. With --reconcile every reference count is recomputed "
+        "from the file fields first. Blob files without a row, left behind by "
+        "rolled-back uploads, are registered first and collected a grace "
+        "period later."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace",
+            type=int,
+            default=settings.CONTENT_ADDRESSED_STORAGE["GC_GRACE"],
+            help="Seconds a blob must have been unreferenced.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of candidate blobs checked per query.",
+        )
+        parser.add_argument(
+            "--reconcile",
+            action="store_true",
+            help="Recount the references of every blob before collecting.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        if options["reconcile"] and not options["dry_run"]:
+            changed = reconcile_blob_refcounts()
+            self.stdout.write(f"Corrected {changed} reference counts")
+
+        if not options["dry_run"]:
+            adopted = adopt_orphaned_blobs(
+                grace=options["grace"], batch_size=options["chunk_size"]
+            )
+            self.stdout.write(f"Registered {adopted} blob files without a row")
+
+        deleted, repaired = collect_unreferenced_blobs(
+            grace=options["grace"],
+            batch_size=options["chunk_size"],
+            dry_run=options["dry_run"],
+        )
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {deleted} blobs; {repaired} were still referenced."
+            )
+        )
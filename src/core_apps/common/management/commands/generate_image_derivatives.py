@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core_apps.common.images import (
+    generate_derivatives,
+    image_fields,
+    is_default_image,
+    meta_field_name,
+)
+from core_apps.common.tasks import delete_stored_files, generate_image_derivatives
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate resized copies of uploaded images that have none for their "
+        "current file, e.g. uploads from before the derivative pipeline. Safe "
+        "to interrupt and re-run: finished rows are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--field",
+            action="append",
+            choices=list(settings.IMAGE_DERIVATIVES["FIELDS"]),
+            help="Only this app_label.Model.field; may be repeated.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of rows read per query.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this pkid (with a single --field).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every image, e.g. after changing the widths.",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Generate in this process instead of queueing Celery tasks.",
+        )
+
+    def handle(self, *args, **options):
+        selected = options["field"]
+        if options["start_after"] and (not selected or len(selected) != 1):
+            raise CommandError("--start-after needs exactly one --field.")
+
+        for model, field_name, widths in image_fields():
+            path = f"{model._meta.label}.{field_name}"
+            if selected and path not in selected:
+                continue
+            meta_field = meta_field_name(field_name)
+            queryset = model.objects.only("pkid", field_name, meta_field).order_by(
+                "pkid"
+            )
+            last_pkid = options["start_after"]
+            handled = 0
+
+            while True:
+                rows = list(
+                    queryset.filter(pkid__gt=last_pkid)[: options["chunk_size"]]
+                )
+                if not rows:
+                    break
+                for row in rows:
+                    name = getattr(row, field_name).name
+                    meta = getattr(row, meta_field) or {}
+                    if is_default_image(model, field_name, name):
+                        continue
+                    if not options["all"] and meta.get("source") == name:
+                        continue
+                    if options["sync"]:
+                        superseded = generate_derivatives(
+                            model, row.pk, field_name, widths
+                        )
+                        if superseded:
+                            delete_stored_files(superseded)
+                    else:
+                        generate_image_derivatives.delay(
+                            model._meta.label, row.pk, field_name, widths
+                        )
+                    handled += 1
+                last_pkid = rows[-1].pkid
+                self.stdout.write(f"{path}: {handled} images (up to pkid {last_pkid})")
+
+            verb = "Generated" if options["sync"] else "Queued"
+            self.stdout.write(
+                self.style.SUCCESS(f"{verb} derivatives for {handled} {path} images.")
+            )
@@ -0,0 +1,29 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+
+class StoredBlobManager(models.Manager):
+    def acquire(self, digest, name, size):
+        """Count one more reference to the blob, registering it on first use."""
+        if self.filter(digest=digest).update(
+            refcount=F("refcount") + 1, updated_at=timezone.now()
+        ):
+            return
+        try:
+            with transaction.atomic():
+                self.create(digest=digest, name=name, size=size, refcount=1)
+        except IntegrityError:
+            # Registered concurrently by an identical upload.
+            self.filter(digest=digest).update(
+                refcount=F("refcount") + 1, updated_at=timezone.now()
+            )
+
+    def release(self, name):
+        """Drop one reference; returns False when ``name`` is not a known blob."""
+        return bool(
+            self.filter(name=name).update(
+                refcount=Greatest(F("refcount") - 1, 0), updated_at=timezone.now()
+            )
+        )
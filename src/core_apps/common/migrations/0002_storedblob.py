@@ -0,0 +1,58 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:18
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StoredBlob",
+            fields=[
+                (
+                    "pkid",
+                    models.BigAutoField(
+                        editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "digest",
+                    models.CharField(max_length=64, unique=True, verbose_name="digest"),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=255, unique=True, verbose_name="name"),
+                ),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(default=0, verbose_name="size"),
+                ),
+                (
+                    "refcount",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="reference count"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at", "-updated_at"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="storedblob",
+            index=models.Index(
+                fields=["refcount", "updated_at"], name="storedblob_gc_idx"
+            ),
+        ),
+    ]
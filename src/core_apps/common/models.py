@@ -1,6 +1,12 @@
 import uuid
 
+from django.conf import settings
 from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .managers import StoredBlobManager
+
+
 class TimeStampedModel(models.Model):
     pkid = models.BigAutoField(primary_key=True, editable=False)
     id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
@@ -10,3 +16,66 @@ class TimeStampedModel(models.Model):
     class Meta:
         abstract = True
         ordering = ["-created_at", "-updated_at"]
+
+
+class BulkDeleteJob(TimeStampedModel):
+    """
+    A bulk delete run in the background by core_apps.common.tasks. ``ids``
+    are the requested UUIDs of ``target`` (an app label.model name);
+    ``processed`` of them have been handled so far, ``deleted`` counts the
+    rows that existed.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+
+    target = models.CharField(verbose_name=_("target"), max_length=100)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="bulk_delete_jobs",
+    )
+    ids = models.JSONField(verbose_name=_("ids"), default=list)
+    status = models.CharField(
+        verbose_name=_("status"),
+        choices=Status.choices,
+        default=Status.PENDING,
+        max_length=20,
+    )
+    total = models.PositiveIntegerField(verbose_name=_("total"), default=0)
+    processed = models.PositiveIntegerField(verbose_name=_("processed"), default=0)
+    deleted = models.PositiveIntegerField(verbose_name=_("deleted"), default=0)
+    error = models.TextField(verbose_name=_("error"), blank=True)
+    finished_at = models.DateTimeField(verbose_name=_("finished at"), null=True, blank=True)
+
+    def __str__(self):
+        return f"Delete {self.total} {self.target} ({self.status})"
+
+
+class StoredBlob(TimeStampedModel):
+    """
+    A file written by ContentAddressedStorage, named after the SHA-256 of
+    its content. ``refcount`` counts the stored references: each save of
+    the same content adds one, each storage delete removes one, and the
+    collect_blobs command deletes blobs left at zero.
+    """
+
+    digest = models.CharField(verbose_name=_("digest"), max_length=64, unique=True)
+    name = models.CharField(verbose_name=_("name"), max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(verbose_name=_("size"), default=0)
+    refcount = models.PositiveIntegerField(verbose_name=_("reference count"), default=0)
+
+    objects = StoredBlobManager()
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            # Garbage collection scans unreferenced blobs by age.
+            models.Index(fields=["refcount", "updated_at"], name="storedblob_gc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.refcount} references)"
@@ -0,0 +1,83 @@
+import datetime
+import decimal
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.functional import Promise
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.renderers import BaseRenderer
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj):
+    """Types orjson does not know, encoded the way DRF's JSONEncoder does."""
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, PhoneNumber):
+        return obj.as_e164
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "__getitem__"):
+        try:
+            return dict(obj)
+        except (TypeError, ValueError):
+            pass
+    if hasattr(obj, "__iter__"):
+        return tuple(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data, indent=False):
+    option = (ORJSON_OPTIONS | orjson.OPT_INDENT_2) if indent else ORJSON_OPTIONS
+    return orjson.dumps(data, default=orjson_default, option=option)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer built on orjson: writes bytes directly and handles UUID,
+    datetime, Decimal, PhoneNumber and lazy translations natively or through
+    orjson_default(). Subclasses can set ``envelope_key`` to wrap successful
+    responses in ``{"status_code": ..., <envelope_key>: data}``.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    envelope_key = None
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        if accepted_media_type:
+            params = dict(
+                param.strip().split("=", 1)
+                for param in accepted_media_type.split(";")[1:]
+                if "=" in param
+            )
+            if params.get("indent"):
+                return True
+        return bool(renderer_context.get("indent"))
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.envelope_key is not None and not (
+            isinstance(data, dict) and data.get("errors") is not None
+        ):
+            response = renderer_context.get("response")
+            data = {
+                "status_code": response.status_code if response is not None else 200,
+                self.envelope_key: data,
+            }
+        return dumps(
+            data, indent=self.get_indent(accepted_media_type, renderer_context)
+        )
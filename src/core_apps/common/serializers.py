@@ -0,0 +1,69 @@
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from .images import image_derivatives
+from .models import BulkDeleteJob
+
+
+def _split_param(value):
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets for ModelSerializers on read requests. ?fields=a,b
+    renders only those fields; ?expand=c adds fields listed in
+    Meta.expandable_fields, which are left out by default.
+    """
+
+    @classmethod
+    def get_requested_fields(cls, request):
+        field_names = set(cls.Meta.fields)
+        if request is None or request.method not in SAFE_METHODS:
+            return field_names
+
+        expandable = set(getattr(cls.Meta, "expandable_fields", ()))
+        fields = _split_param(request.query_params.get("fields"))
+        expand = _split_param(request.query_params.get("expand"))
+        if fields:
+            return field_names & (fields | expand)
+        return field_names - (expandable - expand)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.get_requested_fields(self.context.get("request"))
+        for name in set(self.fields) - requested:
+            self.fields.pop(name)
+
+
+class ImageDerivativesField(serializers.Field):
+    """
+    Resized copies of ``image_field`` with their URLs, sizes and formats,
+    read from the recorded metadata; null until they have been generated.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return image_derivatives(instance, self.image_field)
+
+
+class BulkDeleteJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BulkDeleteJob
+        fields = [
+            "id",
+            "target",
+            "status",
+            "total",
+            "processed",
+            "deleted",
+            "error",
+            "created_at",
+            "updated_at",
+            "finished_at",
+        ]
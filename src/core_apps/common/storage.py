@@ -0,0 +1,268 @@
+import hashlib
+import logging
+import os
+import re
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+logger = logging.getLogger(__name__)
+
+DIGEST_RE = re.compile(r"[0-9a-f]{64}")
+
+
+class BlobExists(Exception):
+    pass
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage that names every file after the SHA-256 of its
+    content (``blobs/ab/cd/abcd….ext``), so identical uploads share one
+    file. Each save adds a reference to the file's StoredBlob and delete()
+    drops one; the bytes are removed by collect_unreferenced_blobs() once
+    nothing refers to them. A blob URL always serves the same bytes and can
+    be cached indefinitely. Files stored under their upload names before
+    the switch are still deleted directly.
+    """
+
+    def __init__(self, *args, prefix=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prefix = prefix or settings.CONTENT_ADDRESSED_STORAGE["PREFIX"]
+
+    def is_blob(self, name):
+        return name.startswith(f"{self.prefix}/")
+
+    def blob_name(self, digest, name):
+        extension = os.path.splitext(name)[1].lower()
+        return f"{self.prefix}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+    def get_available_name(self, name, max_length=None):
+        # The content decides the name, so there is nothing to make unique.
+        # An existing blob here means an identical upload was written first.
+        if self.is_blob(name) and self.exists(name):
+            raise BlobExists(name)
+        return name
+
+    def _save(self, name, content):
+        from .models import StoredBlob
+
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks():
+            digest.update(chunk)
+            size += len(chunk)
+        digest = digest.hexdigest()
+        name = self.blob_name(digest, name)
+
+        # Taking the reference first holds the StoredBlob row, so garbage
+        # collection cannot remove the file between the check and the write.
+        with transaction.atomic():
+            StoredBlob.objects.acquire(digest, name, size)
+            if not self.exists(name):
+                try:
+                    name = super()._save(name, content)
+                except BlobExists:
+                    pass
+        return name
+
+    def delete(self, name):
+        from .models import StoredBlob
+
+        if self.is_blob(name) and StoredBlob.objects.release(name):
+            return
+        super().delete(name)
+
+    def purge(self, name):
+        """Remove the bytes of a blob; for garbage collection only."""
+        super().delete(name)
+
+
+def file_references(names=None):
+    """
+    How often each stored name is referenced by a FileField column or by
+    the recorded derivatives of a current image. ``names`` limits the count
+    to those names.
+    """
+    from .images import derivative_names, image_fields, meta_field_name
+
+    counts = Counter()
+    wanted = None if names is None else list(names)
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if not isinstance(field, models.FileField):
+                continue
+            queryset = model._default_manager.exclude(
+                **{f"{field.attname}__isnull": True}
+            ).exclude(**{field.attname: ""})
+            if wanted is None:
+                counts.update(
+                    queryset.values_list(field.attname, flat=True).iterator(
+                        chunk_size=2000
+                    )
+                )
+                continue
+            for start in range(0, len(wanted), 1000):
+                counts.update(
+                    queryset.filter(
+                        **{f"{field.attname}__in": wanted[start : start + 1000]}
+                    ).values_list(field.attname, flat=True)
+                )
+
+    for model, field_name, _ in image_fields():
+        rows = (
+            model._default_manager.exclude(**{meta_field_name(field_name): {}})
+            .values_list(field_name, meta_field_name(field_name))
+            .iterator(chunk_size=2000)
+        )
+        for name, meta in rows:
+            if meta.get("source") != name:
+                continue
+            counts.update(
+                derivative
+                for derivative in derivative_names(meta)
+                if names is None or derivative in names
+            )
+    return counts
+
+
+def reconcile_blob_refcounts(batch_size=1000):
+    """Reset every StoredBlob.refcount to the references that actually exist."""
+    from .models import StoredBlob
+
+    counts = file_references()
+    changed = []
+    for blob in StoredBlob.objects.only("pkid", "name", "refcount").iterator(
+        chunk_size=batch_size
+    ):
+        refcount = counts.get(blob.name, 0)
+        if blob.refcount != refcount:
+            blob.refcount = refcount
+            changed.append(blob)
+    StoredBlob.objects.bulk_update(changed, ["refcount"], batch_size=batch_size)
+    return len(changed)
+
+
+def adopt_orphaned_blobs(grace=None, batch_size=500):
+    """
+    Register blob files that have no StoredBlob row, unreferenced. The row
+    is written in the upload's transaction and the file outside it, so a
+    rollback leaves the file behind; once adopted, such files are collected
+    like any other unreferenced blob. Only files older than ``grace``
+    seconds are considered, so uploads still in flight are left alone.
+    Returns the number of rows created.
+    """
+    from .models import StoredBlob
+
+    storage = default_storage
+    if not isinstance(storage, ContentAddressedStorage):
+        return 0
+    if grace is None:
+        grace = settings.CONTENT_ADDRESSED_STORAGE["GC_GRACE"]
+    cutoff = time.time() - grace
+
+    def adopt(sizes):
+        known = set(
+            StoredBlob.objects.filter(name__in=list(sizes)).values_list(
+                "name", flat=True
+            )
+        )
+        orphans = [
+            StoredBlob(
+                digest=os.path.splitext(os.path.basename(name))[0],
+                name=name,
+                size=size,
+                refcount=0,
+            )
+            for name, size in sizes.items()
+            if name not in known
+        ]
+        return len(StoredBlob.objects.bulk_create(orphans, ignore_conflicts=True))
+
+    adopted = 0
+    sizes = {}
+    for directory, _, filenames in os.walk(storage.path(storage.prefix)):
+        for filename in filenames:
+            if not DIGEST_RE.fullmatch(os.path.splitext(filename)[0]):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime > cutoff:
+                continue
+            name = os.path.relpath(path, storage.location).replace(os.sep, "/")
+            sizes[name] = stat.st_size
+            if len(sizes) >= batch_size:
+                adopted += adopt(sizes)
+                sizes = {}
+    if sizes:
+        adopted += adopt(sizes)
+    if adopted:
+        logger.info("Adopted %d blob files without a StoredBlob row", adopted)
+    return adopted
+
+
+def collect_unreferenced_blobs(grace=None, batch_size=500, dry_run=False):
+    """
+    Delete blobs whose reference count has been zero for longer than
+    ``grace`` seconds. Candidates are checked against the actual references
+    first, so a blob referenced without going through the storage (a copied
+    file name) is kept and its count repaired. Returns (deleted, repaired).
+    """
+    from .models import StoredBlob
+
+    if grace is None:
+        grace = settings.CONTENT_ADDRESSED_STORAGE["GC_GRACE"]
+    cutoff = timezone.now() - timedelta(seconds=grace)
+    storage = default_storage
+    deleted = repaired = 0
+    last_pkid = 0
+
+    while True:
+        candidates = dict(
+            StoredBlob.objects.filter(
+                refcount=0, updated_at__lt=cutoff, pkid__gt=last_pkid
+            )
+            .order_by("pkid")
+            .values_list("pkid", "name")[:batch_size]
+        )
+        if not candidates:
+            break
+        last_pkid = max(candidates)
+        alive = file_references(set(candidates.values()))
+
+        for pkid, name in candidates.items():
+            if alive.get(name):
+                repaired += 1
+                if not dry_run:
+                    StoredBlob.objects.filter(pkid=pkid).update(refcount=alive[name])
+                continue
+            if dry_run:
+                deleted += 1
+                continue
+            with transaction.atomic():
+                # The row lock keeps a concurrent identical upload waiting
+                # until the file and the row are both gone.
+                blob = (
+                    StoredBlob.objects.select_for_update(skip_locked=True)
+                    .filter(pkid=pkid, refcount=0)
+                    .first()
+                )
+                if blob is None:
+                    continue
+                storage.purge(blob.name)
+                blob.delete()
+            deleted += 1
+    if deleted or repaired:
+        logger.info("Collected %d blobs, repaired %d refcounts", deleted, repaired)
+    return deleted, repaired
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status as http_status
+from rest_framework.response import Response
+
+from .renderers import dumps
+
+
+def iter_chunks(queryset, chunk_size):
+    """Lists of at most ``chunk_size`` objects, fetched with ``iterator()``."""
+    chunk = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_json_list(envelope, key, chunks, serialize):
+    """
+    Bytes of ``envelope`` with ``key`` holding a JSON array of every
+    serialized chunk. The array is written last and element by element, so
+    only one chunk is ever held in memory.
+    """
+    head = dumps(envelope)[:-1]
+    yield head + (b"," if envelope else b"") + dumps(key) + b":["
+    first = True
+    for chunk in chunks:
+        body = dumps(serialize(chunk))[1:-1]
+        if not body:
+            continue
+        yield body if first else b"," + body
+        first = False
+    yield b"]}"
+
+
+class StreamingListMixin:
+    """
+    Streams unbounded list responses instead of building them in memory.
+    The queryset is read with ``iterator(chunk_size=...)``, each chunk is
+    serialized on its own and written into the response array as it goes.
+    Clients asking for another format (the browsable API) get a regular
+    Response with the same envelope.
+    """
+
+    stream_chunk_size = None
+
+    def get_stream_chunk_size(self):
+        return self.stream_chunk_size or settings.STREAMING_LIST["CHUNK_SIZE"]
+
+    def should_stream(self):
+        if not settings.STREAMING_LIST["ENABLED"]:
+            return False
+        renderer = getattr(self.request, "accepted_renderer", None)
+        return renderer is not None and renderer.format == "json"
+
+    def stream_list(
+        self,
+        queryset,
+        envelope,
+        key,
+        serializer_class=None,
+        status=http_status.HTTP_200_OK,
+    ):
+        serializer_class = serializer_class or self.get_serializer_class()
+        context = (
+            self.get_serializer_context()
+            if hasattr(self, "get_serializer_context")
+            else {}
+        )
+
+        def serialize(objects):
+            return serializer_class(objects, many=True, context=context).data
+
+        if not self.should_stream():
+            return Response({**envelope, key: serialize(queryset)}, status=status)
+
+        chunks = iter_chunks(queryset, self.get_stream_chunk_size())
+        return StreamingHttpResponse(
+            stream_json_list(envelope, key, chunks, serialize),
+            status=status,
+            content_type="application/json",
+        )
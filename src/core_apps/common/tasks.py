@@ -0,0 +1,53 @@
+import logging
+
+from celery import shared_task
+from django.apps import apps
+from django.core.files.storage import default_storage
+
+from .bulk_delete import run_bulk_delete
+from .images import generate_derivatives
+from .models import BulkDeleteJob
+from .storage import adopt_orphaned_blobs, collect_unreferenced_blobs
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def run_bulk_delete_job(job_pk):
+    job = (
+        BulkDeleteJob.objects.filter(pk=job_pk)
+        .exclude(status=BulkDeleteJob.Status.SUCCEEDED)
+        .first()
+    )
+    if job is None:
+        return 0
+    return run_bulk_delete(job).deleted
+
+
+@shared_task
+def generate_image_derivatives(model_label, pk, field_name, widths):
+    superseded = generate_derivatives(
+        apps.get_model(model_label), pk, field_name, widths
+    )
+    if superseded:
+        delete_stored_files.delay(superseded)
+    return len(superseded)
+
+
+@shared_task
+def delete_stored_files(names):
+    deleted = 0
+    for name in names:
+        try:
+            default_storage.delete(name)
+            deleted += 1
+        except Exception as e:
+            logger.warning(f"Could not delete {name}: {e}")
+    return deleted
+
+
+@shared_task
+def collect_blobs():
+    adopt_orphaned_blobs()
+    deleted, _ = collect_unreferenced_blobs()
+    return deleted
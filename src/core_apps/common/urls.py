@@ -1,9 +1,15 @@
 from django.urls import path
 
 from .views import (
+    BulkDeleteJobDetailView,
     test_view
 )
 
 urlpatterns = [
     path("test/", test_view, name="test"),
+    path(
+        "bulk-delete-jobs/<uuid:id>/",
+        BulkDeleteJobDetailView.as_view(),
+        name="bulk-delete-job-detail",
+    ),
 ]
@@ -2,6 +2,11 @@
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+
+from .models import BulkDeleteJob
+from .serializers import BulkDeleteJobSerializer
 
 @method_decorator(csrf_exempt, name='dispatch')
 def test_view(request):
@@ -11,3 +16,22 @@ def test_view(request):
     response["Access-Control-Allow-Headers"] = "Authorization, Content-Type, X-CSRFToken"
     response["Access-Control-Allow-Credentials"] = "true"
     return response
+
+
+class BulkDeleteJobDetailView(generics.RetrieveAPIView):
+    """Progress of a bulk delete started by the requesting user."""
+
+    serializer_class = BulkDeleteJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_field = "id"
+
+    def get_queryset(self):
+        return BulkDeleteJob.objects.filter(requested_by=self.request.user).defer("ids")
+
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        return Response({
+            "status": "success",
+            "message": "Bulk delete job retrieved successfully.",
+            "data": serializer.data,
+        }, status=status.HTTP_200_OK)
@@ -4,11 +4,19 @@ from django.core.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
 from django.http import JsonResponse
 from django.http import Http404
+from django.db.models import Max
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, permissions, status, serializers
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core_apps.common.bulk_delete import start_bulk_delete
+from core_apps.common.conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+)
+from core_apps.common.serializers import BulkDeleteJobSerializer
+
 from .models import Invoice, Organization
 from .pagination import InvoicePagination
 from .permissions import IsOwnerOrReadOnly
@@ -63,13 +71,18 @@ class GenerateIRNView(APIView):
         except Exception as e:
             logger.error(f"Error retrieving increment number: {str(e)}", exc_info=True)
             raise
-class InvoiceListCreateView(generics.ListCreateAPIView):
+class InvoiceListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     queryset = Invoice.objects.all()
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = InvoicePagination
     filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
     ordering_fields = ["created_at", "updated_at"]
     filterset_fields = ['organization']
+    # Each row renders its client's name; renaming a client bumps its
+    # updated_at, which the invoice's own timestamp does not see.
+    collection_aggregates = {
+        "clients": Max("client__updated_at"),
+    }
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -121,11 +134,19 @@ class InvoiceListCreateView(generics.ListCreateAPIView):
                 "message": str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class InvoiceRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class InvoiceRetrieveUpdateDestroyView(
+    ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
     queryset = Invoice.objects.all()
     serializer_class = InvoiceDetailSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     lookup_field = "id"
+    conditional_fields = (
+        "client__updated_at",
+        "organization__updated_at",
+        "created_by__email",
+        "updated_by__email",
+    )
 
     def perform_update(self, serializer):
         try:
@@ -175,9 +196,20 @@ class InvoiceBulkDeleteView(generics.GenericAPIView):
 
         try:
             uuids = [UUID(id) for id in ids]
-            invoices = Invoice.objects.filter(id__in=uuids)
-            invoices_deleted = invoices.count()
-            invoices.delete()
+        except (TypeError, ValueError, AttributeError):
+            return Response({
+                "status": "error",
+                "message": "IDs must be valid UUIDs."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            job, invoices_deleted = start_bulk_delete(Invoice, uuids, request.user)
+            if job is not None:
+                return Response({
+                    "status": "success",
+                    "message": f"Deleting {job.total} invoices in the background.",
+                    "data": BulkDeleteJobSerializer(job).data
+                }, status=status.HTTP_202_ACCEPTED)
             return Response({
                 "status": "success",
                 "message": f"{invoices_deleted} invoices deleted successfully.",
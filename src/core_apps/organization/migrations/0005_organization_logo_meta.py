@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organization", "0004_alter_organization_invoice_reference_prefix"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="logo_meta",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
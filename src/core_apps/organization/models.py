@@ -9,6 +9,8 @@ User = get_user_model()
 class Organization(TimeStampedModel):
     name = models.CharField(max_length=255, verbose_name=_("Organization Name"))
     logo = models.ImageField(upload_to='organization_logos/', verbose_name=_("Logo"), blank=True, null=True)
+    # Resized copies of logo, see core_apps.common.images.
+    logo_meta = models.JSONField(default=dict, blank=True, editable=False)
     address = models.TextField(verbose_name=_("Address"), blank=True, null=True)
     email = models.EmailField(verbose_name=_("Email"), blank=True, null=True)
     phone_number = PhoneNumberField(verbose_name=_("Phone Number"), blank=True, null=True)
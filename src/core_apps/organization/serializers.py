@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core_apps.common.serializers import ImageDerivativesField
 from .models import Organization, OrganizationMember
 from django.contrib.auth import get_user_model
 
@@ -14,6 +15,7 @@ class OrganizationMemberSerializer(serializers.ModelSerializer):
 
 class OrganizationSerializer(serializers.ModelSerializer):
     members = OrganizationMemberSerializer(source='organizationmember_set', many=True, read_only=True)
+    logo_derivatives = ImageDerivativesField("logo")
     created_at = serializers.SerializerMethodField()
     updated_at = serializers.SerializerMethodField()
 
@@ -29,6 +31,7 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "id",
             "name",
             "logo",
+            "logo_derivatives",
             "address",
             "email",
             "phone_number",
@@ -64,12 +67,15 @@ class OrganizationSerializer(serializers.ModelSerializer):
         return instance
 
 class OrganizationListSerializer(serializers.ModelSerializer):
+    logo_derivatives = ImageDerivativesField("logo")
+
     class Meta:
         model = Organization
         fields = [
             "id", 
             "name", 
             "logo", 
+            "logo_derivatives",
             "address", 
             "email", 
             "phone_number", 
@@ -1,5 +1,8 @@
 import logging
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Concat
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, permissions, status
@@ -7,6 +10,12 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import serializers
+from core_apps.common.conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+)
+from core_apps.common.streaming import StreamingListMixin
+
 from .models import Organization, OrganizationMember
 from .serializers import OrganizationSerializer, OrganizationMemberSerializer, OrganizationListSerializer
 
@@ -14,12 +23,31 @@ User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
-class OrganizationListCreateView(generics.ListCreateAPIView):
-    queryset = Organization.objects.all()
+class OrganizationListCreateView(
+    ConditionalListMixin, StreamingListMixin, generics.ListCreateAPIView
+):
+    queryset = Organization.objects.prefetch_related("organizationmember_set__user")
     serializer_class = OrganizationSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     ordering_fields = ["created_at", "updated_at"]
+    # Memberships and user names have no timestamps, so the version lists
+    # every member row with the values it renders.
+    collection_aggregates = {
+        "members": StringAgg(
+            Concat(
+                Cast("organizationmember__pk", CharField()),
+                Value(":"),
+                "organizationmember__role",
+                Value(":"),
+                "organizationmember__user__first_name",
+                Value(" "),
+                "organizationmember__user__last_name",
+            ),
+            delimiter=",",
+            ordering="organizationmember__pk",
+        ),
+    }
 
     def perform_create(self, serializer):
         serializer.save()
@@ -27,12 +55,14 @@ class OrganizationListCreateView(generics.ListCreateAPIView):
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            "status": "success",
-            "message": "Organizations retrieved successfully",
-            "data": serializer.data
-        })
+        return self.stream_list(
+            queryset,
+            {
+                "status": "success",
+                "message": "Organizations retrieved successfully",
+            },
+            "data",
+        )
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -44,11 +74,29 @@ class OrganizationListCreateView(generics.ListCreateAPIView):
             "data": serializer.data
         }, status=status.HTTP_201_CREATED)
 
-class OrganizationRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class OrganizationRetrieveUpdateDestroyView(
+    ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
     queryset = Organization.objects.all()
     serializer_class = OrganizationSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = "id"
+    # Memberships have no timestamps, so the version lists them instead.
+    conditional_annotations = {
+        "members": StringAgg(
+            Concat(
+                Cast("organizationmember__user_id", CharField()),
+                Value(":"),
+                "organizationmember__role",
+                Value(":"),
+                "organizationmember__user__first_name",
+                Value(" "),
+                "organizationmember__user__last_name",
+            ),
+            delimiter=",",
+            ordering="organizationmember__pk",
+        ),
+    }
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
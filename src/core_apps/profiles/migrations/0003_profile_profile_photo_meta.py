@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("profiles", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="profile_photo_meta",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -21,6 +21,8 @@ class Profile(TimeStampedModel):
     country = CountryField(verbose_name=_("country"), default="KE", blank=False, null=False)
     city = models.CharField(verbose_name=_("city"), max_length=180, default="Nairobi", blank=False, null=False)
     profile_photo = models.ImageField(verbose_name=_("profile photo"), default="/profile_default.png")
+    # Resized copies of profile_photo, see core_apps.common.images.
+    profile_photo_meta = models.JSONField(default=dict, blank=True, editable=False)
     twitter_handle = models.CharField(verbose_name=_("twitter handle"), max_length=20, blank=True)
     followers = models.ManyToManyField("self", symmetrical=False, related_name="following", blank=True)
     organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name="members", null=True, blank=True)
@@ -1,27 +1,9 @@
-import json
+from core_apps.common.renderers import ORJSONRenderer
 
-from rest_framework.renderers import JSONRenderer
 
+class ProfileJSONRenderer(ORJSONRenderer):
+    envelope_key = "profile"
 
-class ProfileJSONRenderer(JSONRenderer):
-    charset = "utf-8"
 
-    def render(self, data, accepted_media_type=None, renderer_context=None):
-        status_code = renderer_context["response"].status_code
-        errors = data.get("errors", None)
-
-        if errors is not None:
-            return super(ProfileJSONRenderer, self).render(data)
-        return json.dumps({"status_code": status_code, "profile": data})
-
-
-class ProfilesJSONRenderer(JSONRenderer):
-    charset = "utf-8"
-
-    def render(self, data, accepted_media_type=None, renderer_context=None):
-        status_code = renderer_context["response"].status_code
-        errors = data.get("errors", None)
-
-        if errors is not None:
-            return super(ProfilesJSONRenderer, self).render(data)
-        return json.dumps({"status_code": status_code, "profiles": data})
+class ProfilesJSONRenderer(ORJSONRenderer):
+    envelope_key = "profiles"
@@ -1,6 +1,8 @@
 from django_countries.serializer_fields import CountryField
 from rest_framework import serializers
 
+from core_apps.common.serializers import ImageDerivativesField
+
 from .models import Profile
 
 
@@ -10,6 +12,7 @@ class ProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source="user.email")
     full_name = serializers.SerializerMethodField(read_only=True)
     profile_photo = serializers.SerializerMethodField()
+    profile_photo_derivatives = ImageDerivativesField("profile_photo")
     country = CountryField(name_only=True)
 
     class Meta:
@@ -21,6 +24,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             "full_name",
             "email",
             "profile_photo",
+            "profile_photo_derivatives",
             "phone_number",
             "gender",
             "country",
@@ -57,6 +61,7 @@ class UpdateProfileSerializer(serializers.ModelSerializer):
 class FollowingSerializer(serializers.ModelSerializer):
     first_name = serializers.CharField(source="user.first_name")
     last_name = serializers.CharField(source="user.last_name")
+    profile_photo_derivatives = ImageDerivativesField("profile_photo")
 
     class Meta:
         model = Profile
@@ -64,6 +69,7 @@ class FollowingSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "profile_photo",
+            "profile_photo_derivatives",
             "about_me",
             "twitter_handle",
         ]
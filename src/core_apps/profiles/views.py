@@ -8,6 +8,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from authors_api.settings.local import DEFAULT_FROM_EMAIL
+from core_apps.common.conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+)
+from core_apps.common.streaming import StreamingListMixin
 from .exceptions import CantFollowYourself
 from .models import Profile
 from .pagination import ProfilePagination
@@ -16,21 +21,25 @@ from .serializers import FollowingSerializer, ProfileSerializer, UpdateProfileSe
 
 User = get_user_model()
 
-class ProfileListAPIView(generics.ListAPIView):
+class ProfileListAPIView(ConditionalListMixin, generics.ListAPIView):
     queryset = Profile.objects.all()
     serializer_class = ProfileSerializer
     pagination_class = ProfilePagination
     renderer_classes = [ProfilesJSONRenderer]
 
-class ProfileDetailAPIView(generics.RetrieveAPIView):
+class ProfileDetailAPIView(ConditionalRetrieveMixin, generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ProfileSerializer
     renderer_classes = [ProfileJSONRenderer]
+    conditional_fields = ("user__first_name", "user__last_name", "user__email")
 
     def get_queryset(self):
         queryset = Profile.objects.select_related("user")
         return queryset
 
+    def get_conditional_queryset(self):
+        return self.get_queryset().filter(user=self.request.user)
+
     def get_object(self):
         user = self.request.user
         profile = self.get_queryset().get(user=user)
@@ -71,36 +80,39 @@ class UpdateProfilePhotoAPIView(generics.RetrieveAPIView):
         serializer.save()
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-class FollowerListView(APIView):
+class FollowerListView(StreamingListMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, format=None):
         try:
             profile = Profile.objects.get(user__id=request.user.id)
-            follower_profiles = profile.followers.all()
-            serializer = FollowingSerializer(follower_profiles, many=True)
-            formatted_response = {
-                "status_code": status.HTTP_200_OK,
-                "followers_count": follower_profiles.count(),
-                "followers": serializer.data,
-            }
-            return Response(formatted_response, status=status.HTTP_200_OK)
+            follower_profiles = profile.followers.select_related("user")
+            return self.stream_list(
+                follower_profiles,
+                {
+                    "status_code": status.HTTP_200_OK,
+                    "followers_count": follower_profiles.count(),
+                },
+                "followers",
+                serializer_class=FollowingSerializer,
+            )
         except Profile.DoesNotExist:
             return Response(status=404)
 
-class FollowingListView(APIView):
+class FollowingListView(StreamingListMixin, APIView):
     def get(self, request, user_id, format=None):
         try:
             profile = Profile.objects.get(user__id=user_id)
-            following_profiles = profile.following.all()
-            users = [p.user for p in following_profiles]
-            serializer = FollowingSerializer(users, many=True)
-            formatted_response = {
-                "status_code": status.HTTP_200_OK,
-                "following_count": following_profiles.count(),
-                "users_i_follow": serializer.data,
-            }
-            return Response(formatted_response, status=status.HTTP_200_OK)
+            following_profiles = profile.following.select_related("user")
+            return self.stream_list(
+                following_profiles,
+                {
+                    "status_code": status.HTTP_200_OK,
+                    "following_count": following_profiles.count(),
+                },
+                "users_i_follow",
+                serializer_class=FollowingSerializer,
+            )
         except Profile.DoesNotExist:
             return Response(status=404)
 
@@ -5,3 +5,9 @@ class YouhaveAlreadyRated(APIException):
     status_code = 400
     default_detail = "have already rated this article"
     default_code = "bad_request"
+
+
+class RatingChangedConcurrently(APIException):
+    status_code = 409
+    default_detail = "the rating changed concurrently, please retry"
+    default_code = "conflict"
@@ -0,0 +1,18 @@
+from django.db import models
+from django.db.models import Count
+
+
+class RatingManager(models.Manager):
+    def histogram(self, article_pk):
+        """
+        ``{rating: count}`` for every value of Rating.RATING_CHOICES, zeros
+        included, from one grouped query over the article's ratings.
+        """
+        counts = dict(
+            self.filter(article_id=article_pk)
+            .order_by()
+            .values("rating")
+            .annotate(count=Count("pk"))
+            .values_list("rating", "count")
+        )
+        return {value: counts.get(value, 0) for value, _ in self.model.RATING_CHOICES}
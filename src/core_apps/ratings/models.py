@@ -4,6 +4,8 @@ from django.db import models
 from core_apps.articles.models import Article
 from core_apps.common.models import TimeStampedModel
 
+from .managers import RatingManager
+
 User = get_user_model()
 
 
@@ -22,6 +24,8 @@ class Rating(TimeStampedModel):
     rating = models.PositiveSmallIntegerField(choices=RATING_CHOICES)
     review = models.TextField(blank=True)
 
+    objects = RatingManager()
+
     class Meta:
         unique_together = ("article", "user")
         verbose_name = "Rating"
@@ -29,3 +33,20 @@ class Rating(TimeStampedModel):
 
     def __str__(self):
         return f"{self.user.first_name} rated {self.article.title} as {self.get_rating_display()}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The stored rating, so an edit can adjust Article.rating_sum by the
+        # difference without reading the row again.
+        instance._loaded_rating = instance.__dict__.get("rating")
+        return instance
+
+    @property
+    def loaded_rating(self):
+        """The rating as last read from or written to the database."""
+        return getattr(self, "_loaded_rating", None) or self.rating
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_rating = self.rating
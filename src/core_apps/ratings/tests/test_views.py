@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.articles.models import Article
+from core_apps.ratings.models import Rating
+from core_apps.ratings.views import UPSERT_ATTEMPTS
+
+
+@pytest.fixture
+def rate(user_factory, article_factory):
+    article = article_factory()
+    user = user_factory()
+    client = APIClient()
+    client.force_authenticate(user)
+    url = reverse("rating-create", kwargs={"article_id": article.id})
+
+    def put(rating, review=""):
+        return client.put(url, {"rating": rating, "review": review}, format="json")
+
+    put.article, put.user = article, user
+    return put
+
+
+def _aggregates(article):
+    return Article.objects.values_list("rating_sum", "rating_count").get(pk=article.pk)
+
+
+@pytest.mark.django_db
+def test_put_creates_then_replaces_the_rating(rate):
+    response = rate(4)
+    assert response.status_code == 201
+    assert response.data["rating"] == 4
+
+    response = rate(2, "Changed my mind")
+    assert response.status_code == 200
+    assert response.data["rating"] == 2
+
+    rating = Rating.objects.get(article=rate.article, user=rate.user)
+    assert (rating.rating, rating.review) == (2, "Changed my mind")
+    assert _aggregates(rate.article) == (2, 1)
+
+
+@pytest.mark.django_db
+def test_put_retries_the_create_when_the_rating_disappears(rate):
+    rate(4)
+    select_for_update = Rating.objects.select_for_update
+
+    def delete_first(*args, **kwargs):
+        # Another request deletes the rating between our insert and the lock.
+        Rating.objects.filter(article=rate.article, user=rate.user).delete()
+        return select_for_update(*args, **kwargs)
+
+    with mock.patch.object(Rating.objects, "select_for_update", delete_first):
+        response = rate(3)
+
+    assert response.status_code == 201
+    assert Rating.objects.get(article=rate.article, user=rate.user).rating == 3
+    assert _aggregates(rate.article) == (3, 1)
+
+
+@pytest.mark.django_db
+def test_put_gives_up_with_409_when_the_rating_keeps_changing(rate):
+    rate(4)
+
+    with mock.patch.object(
+        Rating.objects, "select_for_update", return_value=Rating.objects.none()
+    ) as select_for_update:
+        response = rate(1)
+
+    assert response.status_code == 409
+    assert select_for_update.call_count == UPSERT_ATTEMPTS
+    assert Rating.objects.get(article=rate.article, user=rate.user).rating == 4
+    assert _aggregates(rate.article) == (4, 1)
+
+
+@pytest.mark.django_db
+def test_put_rejects_an_invalid_rating(rate):
+    assert rate(6).status_code == 400
+    assert not Rating.objects.exists()
@@ -1,11 +1,16 @@
 from django.urls import path
 
-from .views import RatingCreateView
+from .views import RatingCreateView, RatingHistogramView
 
 urlpatterns = [
     path(
         "rate_article/<uuid:article_id>/",
         RatingCreateView.as_view(),
         name="rating-create",
-    )
+    ),
+    path(
+        "histogram/<uuid:article_id>/",
+        RatingHistogramView.as_view(),
+        name="rating-histogram",
+    ),
 ]
@@ -1,30 +1,114 @@
-from django.db import IntegrityError
-from rest_framework import generics, permissions
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, permissions, status
 from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
 from core_apps.articles.models import Article
-from core_apps.ratings.exceptions import YouhaveAlreadyRated
+from core_apps.ratings.exceptions import RatingChangedConcurrently, YouhaveAlreadyRated
 
 from .models import Rating
 from .serializers import RatingSerializer
 
+# Insert/update rounds before giving up on a rating created and deleted
+# concurrently over and over.
+UPSERT_ATTEMPTS = 3
+
 
 class RatingCreateView(generics.CreateAPIView):
+    """
+    POST rates an article once; PUT creates or replaces the user's rating,
+    adjusting the article's rating aggregates by the difference.
+    """
+
     queryset = Rating.objects.all()
     serializer_class = RatingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def perform_create(self, serializer):
+    def get_article(self):
         article_id = self.kwargs.get("article_id")
         if article_id:
             try:
-                article = Article.objects.get(id=article_id)
+                return Article.objects.only("pkid", "title").get(id=article_id)
             except Article.DoesNotExist:
                 raise ValidationError("Invalid article_id provided")
         else:
             raise ValidationError("article_id is required")
 
+    def perform_create(self, serializer):
+        article = self.get_article()
         try:
-            serializer.save(user=self.request.user, article=article)
+            with transaction.atomic():
+                serializer.save(user=self.request.user, article=article)
         except IntegrityError:
             raise YouhaveAlreadyRated
+
+    def put(self, request, *args, **kwargs):
+        article = self.get_article()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # Try an insert first; on a conflict update the existing rating under
+        # a row lock, so concurrent changes adjust the article by consistent
+        # differences. A rating deleted in between sends us back to the insert.
+        for _ in range(UPSERT_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    serializer.save(user=request.user, article=article)
+                return Response(serializer.data, status=status.HTTP_201_CREATED)
+            except IntegrityError:
+                pass
+            with transaction.atomic():
+                rating = (
+                    Rating.objects.select_for_update()
+                    .filter(article=article, user=request.user)
+                    .first()
+                )
+                if rating is None:
+                    serializer = self.get_serializer(data=request.data)
+                    serializer.is_valid(raise_exception=True)
+                    continue
+                serializer = self.get_serializer(rating, data=request.data)
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        raise RatingChangedConcurrently
+
+
+class RatingHistogramView(generics.GenericAPIView):
+    """
+    How many ratings of each RATING_CHOICES value an article has, with its
+    average and count. Cached per Article.cache_version, which every rating
+    change bumps, so a new rating is reflected on the next request.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        article = get_object_or_404(
+            Article.objects.only("pkid", "cache_version", "rating_sum", "rating_count"),
+            id=kwargs["article_id"],
+        )
+        cache_key = f"ratings:histogram:{article.pkid}:{article.cache_version}"
+        histogram = cache.get(cache_key)
+        if histogram is None:
+            counts = Rating.objects.histogram(article.pkid)
+            histogram = [
+                {"rating": value, "label": label, "count": counts[value]}
+                for value, label in Rating.RATING_CHOICES
+            ]
+            cache.set(cache_key, histogram, settings.RATINGS["HISTOGRAM_CACHE_TTL"])
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Rating histogram retrieved successfully.",
+                "data": {
+                    "average_rating": article.average_rating(),
+                    "rating_count": article.rating_count,
+                    "histogram": histogram,
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,126 @@
+from django.contrib.auth import get_user_model
+from django.db import connection, models
+
+# Hard cap on how far a thread is followed, also when no depth is requested.
+MAX_THREAD_DEPTH = 100
+
+THREAD_SQL = """
+WITH RECURSIVE candidates AS (
+    {roots}
+), roots AS (
+    SELECT pkid FROM candidates ORDER BY created_at, pkid LIMIT %(limit)s
+), tree (pkid, depth) AS (
+    SELECT pkid, 0 FROM roots
+    UNION ALL
+    SELECT child.pkid, tree.depth + 1
+    FROM {responses} child
+    JOIN tree ON child.parent_response_id = tree.pkid
+    WHERE child.article_id = %(article)s AND tree.depth < %(max_depth)s
+)
+SELECT
+    response.pkid,
+    response.id,
+    response.parent_response_id,
+    parent.id,
+    author.first_name,
+    response.content,
+    response.created_at,
+    response.updated_at,
+    tree.depth,
+    (
+        SELECT COUNT(*) FROM {responses} reply
+        WHERE reply.article_id = %(article)s
+        AND reply.parent_response_id = response.pkid
+    ),
+    (SELECT COUNT(*) FROM candidates) > %(limit)s
+FROM tree
+JOIN {responses} response ON response.pkid = tree.pkid
+JOIN {users} author ON author.pkid = response.user_id
+LEFT JOIN {responses} parent ON parent.pkid = response.parent_response_id
+ORDER BY tree.depth, response.created_at, response.pkid
+"""
+
+ROOT_PAGE_SQL = """
+    SELECT pkid, created_at FROM {responses}
+    WHERE article_id = %(article)s AND parent_response_id IS NULL {after}
+    ORDER BY created_at, pkid
+    LIMIT %(limit)s + 1
+"""
+
+SUBTREE_ROOT_SQL = """
+    SELECT pkid, created_at FROM {responses} WHERE pkid = %(root)s
+"""
+
+
+class ResponseManager(models.Manager):
+    def _load_tree(self, roots_sql, params, max_depth):
+        tables = {
+            "responses": connection.ops.quote_name(self.model._meta.db_table),
+            "users": connection.ops.quote_name(get_user_model()._meta.db_table),
+        }
+        if max_depth is None or max_depth > MAX_THREAD_DEPTH:
+            max_depth = MAX_THREAD_DEPTH
+        sql = THREAD_SQL.format(roots=roots_sql.format(**tables), **tables)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {**params, "max_depth": max_depth})
+            rows = cursor.fetchall()
+
+        nodes = {}
+        roots = []
+        has_more = False
+        # Rows come breadth-first, so a parent is always seen before its replies.
+        for (
+            pkid,
+            response_id,
+            parent_pkid,
+            parent_id,
+            user_first_name,
+            content,
+            created_at,
+            updated_at,
+            depth,
+            reply_count,
+            has_more,
+        ) in rows:
+            node = {
+                "id": response_id,
+                "user_first_name": user_first_name,
+                "parent_response": parent_id,
+                "content": content,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "depth": depth,
+                "reply_count": reply_count,
+                "replies": [],
+            }
+            nodes[pkid] = node
+            if depth == 0:
+                roots.append(node)
+                last_root = (created_at, pkid)
+            else:
+                nodes[parent_pkid]["replies"].append(node)
+        return roots, last_root if has_more else None
+
+    def threads(self, article_pkid, after=None, limit=10, max_depth=None):
+        """
+        A page of root responses of an article with their replies nested under
+        ``replies``, loaded with one recursive query. ``after`` is the
+        (created_at, pkid) of the last root of the previous page. Returns the
+        roots, oldest first, and the ``after`` position of the next page, or
+        None on the last page.
+        """
+        params = {"article": article_pkid, "limit": limit}
+        after_sql = ""
+        if after is not None:
+            after_sql = (
+                "AND (created_at, pkid) > (%(after_created_at)s, %(after_pkid)s)"
+            )
+            params["after_created_at"], params["after_pkid"] = after
+        roots_sql = ROOT_PAGE_SQL.replace("{after}", after_sql)
+        return self._load_tree(roots_sql, params, max_depth)
+
+    def subtree(self, response, max_depth=None):
+        """``response`` and its replies down to ``max_depth`` levels, nested."""
+        params = {"article": response.article_id, "root": response.pkid, "limit": 1}
+        roots, _ = self._load_tree(SUBTREE_ROOT_SQL, params, max_depth)
+        return roots[0] if roots else None
@@ -0,0 +1,22 @@
+# Generated by Django 4.1.7 on 2026-10-18 11:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("responses", "0002_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="response",
+            index=models.Index(
+                fields=["article", "parent_response", "created_at"],
+                name="response_thread_idx",
+            ),
+        ),
+    ]
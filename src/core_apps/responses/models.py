@@ -5,6 +5,8 @@ from django.utils.translation import gettext_lazy as _
 from core_apps.articles.models import Article
 from core_apps.common.models import TimeStampedModel
 
+from .managers import ResponseManager
+
 User = get_user_model()
 
 
@@ -19,10 +21,19 @@ class Response(TimeStampedModel):
 
     content = models.TextField(verbose_name=_("response content"))
 
+    objects = ResponseManager()
+
     class Meta:
         verbose_name = "Response"
         verbose_name_plural = "Responses"
         ordering = ["created_at"]
+        indexes = [
+            # Root pages and reply lookups of ResponseManager.threads().
+            models.Index(
+                fields=["article", "parent_response", "created_at"],
+                name="response_thread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.first_name} commented on {self.article.title}"
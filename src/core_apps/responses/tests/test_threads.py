@@ -0,0 +1,112 @@
+import pytest
+
+from core_apps.responses.models import Response
+
+
+@pytest.fixture
+def thread(article_factory, user_factory):
+    """
+    first
+    └── reply
+        └── nested
+    second
+    third
+    """
+    article = article_factory()
+    user = user_factory()
+
+    def respond(content, parent=None, on=article):
+        return Response.objects.create(
+            user=user, article=on, parent_response=parent, content=content
+        )
+
+    first = respond("first")
+    reply = respond("reply", first)
+    nested = respond("nested", reply)
+    second = respond("second")
+    third = respond("third")
+    respond("elsewhere", on=article_factory())
+    return article, {
+        response.content: response for response in (first, reply, nested, second, third)
+    }
+
+
+def _contents(nodes):
+    return [node["content"] for node in nodes]
+
+
+@pytest.mark.django_db
+def test_threads_nest_replies_under_their_roots(thread, django_assert_num_queries):
+    article, responses = thread
+
+    with django_assert_num_queries(1):
+        roots, next_position = Response.objects.threads(article.pkid, limit=10)
+
+    assert _contents(roots) == ["first", "second", "third"]
+    assert next_position is None
+    first = roots[0]
+    assert first["depth"] == 0
+    assert first["reply_count"] == 1
+    assert first["parent_response"] is None
+    [reply] = first["replies"]
+    assert reply["content"] == "reply"
+    assert reply["depth"] == 1
+    assert reply["parent_response"] == responses["first"].id
+    assert _contents(reply["replies"]) == ["nested"]
+    assert reply["replies"][0]["replies"] == []
+
+
+@pytest.mark.django_db
+def test_threads_page_through_roots(thread):
+    article, responses = thread
+
+    roots, next_position = Response.objects.threads(article.pkid, limit=2)
+    assert _contents(roots) == ["first", "second"]
+    second = responses["second"]
+    assert next_position == (second.created_at, second.pkid)
+
+    roots, next_position = Response.objects.threads(
+        article.pkid, after=next_position, limit=2
+    )
+    assert _contents(roots) == ["third"]
+    assert next_position is None
+
+
+@pytest.mark.django_db
+def test_threads_stop_at_max_depth(thread):
+    article, _ = thread
+
+    roots, _ = Response.objects.threads(article.pkid, max_depth=1)
+
+    [reply] = roots[0]["replies"]
+    assert reply["replies"] == []
+    # The count still tells the client that there is more to load.
+    assert reply["reply_count"] == 1
+
+
+@pytest.mark.django_db
+def test_threads_of_an_article_without_responses(article_factory):
+    assert Response.objects.threads(article_factory().pkid) == ([], None)
+
+
+@pytest.mark.django_db
+def test_subtree_starts_at_the_response(thread, django_assert_num_queries):
+    _, responses = thread
+
+    with django_assert_num_queries(1):
+        node = Response.objects.subtree(responses["reply"])
+
+    assert node["content"] == "reply"
+    assert node["depth"] == 0
+    assert _contents(node["replies"]) == ["nested"]
+    assert node["replies"][0]["depth"] == 1
+
+
+@pytest.mark.django_db
+def test_subtree_respects_max_depth(thread):
+    _, responses = thread
+
+    node = Response.objects.subtree(responses["first"], max_depth=0)
+
+    assert node["replies"] == []
+    assert node["reply_count"] == 1
@@ -1,6 +1,11 @@
 from django.urls import path
 
-from .views import ResponseListCreateView, ResponseUpdateDeleteView
+from .views import (
+    ResponseListCreateView,
+    ResponseSubtreeView,
+    ResponseThreadView,
+    ResponseUpdateDeleteView,
+)
 
 urlpatterns = [
     path(
@@ -8,5 +13,11 @@ urlpatterns = [
         ResponseListCreateView.as_view(),
         name="article_responses",
     ),
+    path(
+        "article/<uuid:article_id>/threads/",
+        ResponseThreadView.as_view(),
+        name="article_response_threads",
+    ),
     path("<uuid:id>/", ResponseUpdateDeleteView.as_view(), name="response_detail"),
+    path("<uuid:id>/thread/", ResponseSubtreeView.as_view(), name="response_thread"),
 ]
@@ -1,11 +1,25 @@
+from datetime import datetime
+
+from django.db import transaction
 from rest_framework import generics, permissions
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response as APIResponse
+from rest_framework.utils.urls import replace_query_param
+
+from core_apps.common.cursors import decode_cursor, encode_cursor
 
 from .models import Article, Response
 from .serializers import ResponseSerializer
 
 
+def get_thread_depth(request):
+    try:
+        return max(int(request.query_params["depth"]), 0)
+    except (KeyError, ValueError):
+        return None
+
+
 class ResponseListCreateView(generics.ListCreateAPIView):
     queryset = Response.objects.all()
     permission_classes = [permissions.IsAuthenticated]
@@ -19,7 +33,8 @@ class ResponseListCreateView(generics.ListCreateAPIView):
         user = self.request.user
         article_id = self.kwargs.get("article_id")
         article = get_object_or_404(Article, id=article_id)
-        serializer.save(user=user, article=article)
+        with transaction.atomic():
+            serializer.save(user=user, article=article)
 
 
 class ResponseUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
@@ -42,3 +57,60 @@ class ResponseUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
                 "You do not have permission to delete this response."
             )
         instance.delete()
+
+
+class ResponseThreadView(generics.GenericAPIView):
+    """
+    Root responses of an article with their whole reply trees, one recursive
+    query per page. ?depth= limits how many reply levels are included, and
+    pages over root threads are followed through the ``next`` cursor link.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    page_size = 10
+    max_page_size = 50
+
+    def get_page_size(self):
+        try:
+            page_size = int(self.request.query_params["page_size"])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get(self, request, *args, **kwargs):
+        article = get_object_or_404(Article, id=self.kwargs.get("article_id"))
+        after = None
+        if request.query_params.get("cursor"):
+            try:
+                position = decode_cursor(request.query_params["cursor"])
+                after = (datetime.fromisoformat(position["c"]), int(position["p"]))
+            except (TypeError, ValueError, KeyError):
+                raise NotFound("Invalid cursor")
+
+        threads, next_position = Response.objects.threads(
+            article.pkid,
+            after=after,
+            limit=self.get_page_size(),
+            max_depth=get_thread_depth(request),
+        )
+        next_link = None
+        if next_position is not None:
+            created_at, pkid = next_position
+            next_link = replace_query_param(
+                request.build_absolute_uri(),
+                "cursor",
+                encode_cursor({"c": created_at.isoformat(), "p": pkid}),
+            )
+        return APIResponse({"next": next_link, "results": threads})
+
+
+class ResponseSubtreeView(generics.GenericAPIView):
+    """A single response with its replies nested, optionally limited by ?depth=."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        response = get_object_or_404(Response, id=self.kwargs.get("id"))
+        return APIResponse(
+            Response.objects.subtree(response, max_depth=get_thread_depth(request))
+        )